@@ -0,0 +1,100 @@
+#!/usr/bin/python
+
+'''!
+Benchmark the memory use and latency of the Card representation.
+
+Compares the current __slots__ based playingcards.Card with the original
+__dict__ based design (reproduced below as DictCard) on a corpus of
+1,000,000 cards.
+
+To execute the benchmark from base dir location, enter:
+@code
+python benchmarks/bench_card.py [corpus_size]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import os, sys, time, tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pybaccarat.playingcards import Card
+
+
+class DictCard(object):
+    '''!
+    The original Card layout: four attributes in a per-instance __dict__,
+    a tuple built by every __hash__, and getter calls in __eq__.
+    '''
+    def __init__(self, new_ordinal):
+        self.__rank = 1 + (new_ordinal % 13)
+        self.__suit = 'cdhs'[new_ordinal // 13]
+        self.__ordinal = new_ordinal
+        self.__to_string = 'A23456789TJQK'[self.__rank - 1] + self.__suit
+
+    def get_rank(self):
+        return self.__rank
+
+    def get_suit(self):
+        return self.__suit
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return (self.get_rank() == other.get_rank()) and \
+                   (self.get_suit() == other.get_suit())
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple([self.get_rank(), self.get_suit()]))
+
+    def point(self):
+        rank = self.get_rank()
+        if rank > 9:
+            rank = 0
+        return rank
+
+
+def build(card_class, size):
+    '''!
+    Build the corpus and return (cards, bytes allocated, seconds).
+    '''
+    tracemalloc.start()
+    start = time.time()
+    cards = [card_class(i % 52) for i in range(size)]
+    elapsed = time.time() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return cards, allocated, elapsed
+
+
+def timed(function, cards):
+    '''!
+    Return seconds to run function over the corpus.
+    '''
+    start = time.time()
+    function(cards)
+    return time.time() - start
+
+
+def bench(name, card_class, point, size):
+    cards, allocated, build_time = build(card_class, size)
+    other = cards[1:] + cards[:1]
+    print("%-8s build %6.3fs %7.1f bytes/card" %
+          (name, build_time, allocated * 1.0 / size))
+    print("%-8s hash  %6.3fs" %
+          (name, timed(lambda c: [hash(x) for x in c], cards)))
+    print("%-8s eq    %6.3fs" %
+          (name, timed(lambda c: [x == y for x, y in zip(c, other)], cards)))
+    print("%-8s point %6.3fs" %
+          (name, timed(lambda c: [point(x) for x in c], cards)))
+
+
+if __name__ == "__main__":
+    # command line entry point
+    SIZE = 1000000
+    if len(sys.argv) > 1:
+        SIZE = int(sys.argv[1])
+    print("corpus of %d cards" % SIZE)
+    bench("DictCard", DictCard, DictCard.point, SIZE)
+    bench("Card", Card, Card.get_point, SIZE)
+
+# END #
@@ -0,0 +1,40 @@
+#!/usr/bin/python
+
+'''!
+Benchmark the NumPy lockstep simulator against Game.simulate_shoe().
+
+To execute the benchmark from base dir location, enter:
+@code
+python benchmarks/bench_lockstep.py [number_shoes]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import os, sys, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pybaccarat.baccarat import Game
+from pybaccarat.lockstep import simulate_shoes
+from pybaccarat.shoebatch import generate_shoes, shoe_from_row
+
+
+if __name__ == "__main__":
+    # command line entry point
+    COUNT = 100000
+    if len(sys.argv) > 1:
+        COUNT = int(sys.argv[1])
+    shoes = generate_shoes(COUNT, 8, seed=1)
+
+    start = time.time()
+    hands = 0
+    for row in shoes[:COUNT // 100]:
+        hands += len(Game(shoe=shoe_from_row(row)).simulate_shoe().hands)
+    elapsed = time.time() - start
+    print("Game.simulate_shoe() %10.0f hands/second" % (hands / elapsed))
+
+    start = time.time()
+    hands = simulate_shoes(shoes).totals()['hands']
+    elapsed = time.time() - start
+    print("simulate_shoes()     %10.0f hands/second" % (hands / elapsed))
+
+# END #
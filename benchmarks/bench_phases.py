@@ -0,0 +1,38 @@
+#!/usr/bin/python
+
+'''!
+Show where the time of a hand goes, phase by phase.
+
+Plays seeded shoes with a system and renders them (to a discarded output)
+under a PhaseTimer, then prints its report. The shoes are the same every
+run, so reports can be compared between versions of the code.
+
+To execute the benchmark from base dir location, enter:
+@code
+python benchmarks/bench_phases.py [number_shoes]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import os, sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pybaccarat.baccarat import Game
+from pybaccarat.baccaratsystems import George1
+from pybaccarat.playingcards import Shoe
+from pybaccarat.timing import PhaseTimer
+
+
+if __name__ == "__main__":
+    # command line entry point
+    COUNT = 200
+    if len(sys.argv) > 1:
+        COUNT = int(sys.argv[1])
+    game = Game(shoe=Shoe(8, rng=1), system=George1())
+    stdout = sys.stdout
+    with PhaseTimer() as timer:
+        with open(os.devnull, 'w') as sys.stdout:
+            for _ in range(COUNT):
+                game.render(game.simulate_shoe())
+    sys.stdout = stdout
+    print(timer.report())
@@ -0,0 +1,55 @@
+#!/usr/bin/python
+
+'''!
+Benchmark the table driven resolver against Game.play_hand().
+
+Both resolve the same hands from one seeded 8 deck shoe. play_hand() deals
+Card objects into Hand objects; resolve() is given the card points.
+
+To execute the benchmark from base dir location, enter:
+@code
+python benchmarks/bench_resolver.py [number_hands]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import os, sys, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pybaccarat.baccarat import Game, Hand
+from pybaccarat.playingcards import Shoe
+from pybaccarat.resolver import resolve
+
+
+if __name__ == "__main__":
+    # command line entry point
+    COUNT = 200000
+    if len(sys.argv) > 1:
+        COUNT = int(sys.argv[1])
+    shoe = Shoe(8, rng=1)
+    shoe.shuffle()
+    points = [c.get_point() for c in shoe.peek(416)]
+    player = Hand()
+    banker = Hand()
+    game = Game(shoe=shoe, player=player, banker=banker)
+
+    start = time.time()
+    for _ in range(COUNT):
+        if shoe.cards_remaining() < 6:
+            shoe.reset()
+        player.empty()
+        banker.empty()
+        game.play_hand()
+    elapsed = time.time() - start
+    print("play_hand() %10.0f hands/second" % (COUNT / elapsed))
+
+    start = time.time()
+    position = 0
+    for _ in range(COUNT):
+        if position > 410:
+            position = 0
+        position += resolve(points[position:position + 6])[3]
+    elapsed = time.time() - start
+    print("resolve()   %10.0f hands/second" % (COUNT / elapsed))
+
+# END #
@@ -0,0 +1,38 @@
+#!/usr/bin/python
+
+'''!
+Benchmark batch shoe generation against one Shoe at a time.
+
+To execute the benchmark from base dir location, enter:
+@code
+python benchmarks/bench_shoebatch.py [number_shoes]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import os, sys, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pybaccarat.playingcards import Shoe
+from pybaccarat.shoebatch import generate_shoes
+
+
+if __name__ == "__main__":
+    # command line entry point
+    COUNT = 100000
+    if len(sys.argv) > 1:
+        COUNT = int(sys.argv[1])
+
+    start = time.time()
+    for _ in range(COUNT // 100):
+        shoe = Shoe(8)
+        shoe.shuffle()
+    elapsed = (time.time() - start) * 100
+    print("Shoe(8).shuffle() %10.0f shoes/minute" % (COUNT * 60.0 / elapsed))
+
+    start = time.time()
+    shoes = generate_shoes(COUNT, 8, seed=1)
+    elapsed = time.time() - start
+    print("generate_shoes()  %10.0f shoes/minute" % (COUNT * 60.0 / elapsed))
+
+# END #
@@ -0,0 +1,71 @@
+#!/usr/bin/python
+
+'''!
+Benchmark the hand sinks against printing one line per hand.
+
+The hands of a few seeded shoes are played once, then fed over and over
+to each sink, so only the cost of writing is measured.
+
+To execute the benchmark from base dir location, enter:
+@code
+python benchmarks/bench_sinks.py [number_hands]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import os, sys, tempfile, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pybaccarat.baccarat import Game
+from pybaccarat.playingcards import Shoe
+from pybaccarat.sinks import CsvSink, JsonlSink, NpzSink
+
+
+def unbuffered(filespec, hands):
+    '''!
+    The baseline: the CsvSink lines, each written (and flushed) on its own
+    as print() to a terminal or pipe would.
+    '''
+    with open(filespec, 'w', buffering=1) as out:
+        for (number, hand) in hands:
+            out.write("%d,%d,%s,%s,%s,%s,%s\n" % (
+                0, number,
+                " ".join([str(c) for c in hand.player]),
+                " ".join([str(c) for c in hand.banker]),
+                hand.win, hand.diff, hand.bonus.strip()))
+
+
+def sink(sink_class, filespec, hands):
+    with sink_class(filespec) as out:
+        out.new_shoe(())
+        for (number, hand) in hands:
+            out.hand_post(number, hand, None, None)
+
+
+if __name__ == "__main__":
+    # command line entry point
+    COUNT = 1000000
+    if len(sys.argv) > 1:
+        COUNT = int(sys.argv[1])
+    game = Game(shoe=Shoe(8, rng=1))
+    played = []
+    for _ in range(10):
+        game.simulate_shoe()
+        played += list(enumerate(game.simulate_shoe().hands, 1))
+    hands = (played * (COUNT // len(played) + 1))[:COUNT]
+    folder = tempfile.mkdtemp()
+    for (name, function) in (
+            ("line buffered", lambda f: unbuffered(f, hands)),
+            ("CsvSink", lambda f: sink(CsvSink, f, hands)),
+            ("JsonlSink", lambda f: sink(JsonlSink, f, hands)),
+            ("NpzSink", lambda f: sink(NpzSink, f, hands))):
+        filespec = os.path.join(folder, "hands.out")
+        start = time.time()
+        function(filespec)
+        elapsed = time.time() - start
+        print("%-14s %10.0f hands/second %6.1f bytes/hand" %
+              (name, COUNT / elapsed, os.path.getsize(filespec) * 1.0 / COUNT))
+        os.remove(filespec)
+    os.rmdir(folder)
+
+# END #
@@ -0,0 +1,46 @@
+#!/usr/bin/python
+
+'''!
+Benchmark a parameter sweep against one full run per grid point.
+
+A full run deals every shoe again for each grid point. The sweep compiles
+the shoes to tapes once and plays all the grid points on each replay.
+
+To execute the benchmark from base dir location, enter:
+@code
+python benchmarks/bench_sweep.py [number_shoes]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import os, sys, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pybaccarat.baccarat import Game
+from pybaccarat.baccaratsystems import George1
+from pybaccarat.seeding import make_shoe
+from pybaccarat.sweep import grid, sweep
+from pybaccarat.tape import compile_run
+
+
+if __name__ == "__main__":
+    # command line entry point
+    COUNT = 200
+    if len(sys.argv) > 1:
+        COUNT = int(sys.argv[1])
+    points = grid(size=[2, 3, 4], later_size=[3, 4, 5])
+
+    start = time.time()
+    for point in points:
+        for index in range(COUNT):
+            Game(shoe=make_shoe(1, index),
+                 system=George1(**point)).simulate_shoe()
+    elapsed = time.time() - start
+    print("%-22s %8.3f sec" % ("full run per point", elapsed))
+
+    start = time.time()
+    tapes = compile_run(1, COUNT)
+    compiled = time.time() - start
+    sweep("George1", points, tapes, processes=1)
+    elapsed = time.time() - start
+    print("%-22s %8.3f sec (compile %.3f)" % ("sweep", elapsed, compiled))
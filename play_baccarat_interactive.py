@@ -4,6 +4,7 @@ import argparse
 from pybaccarat.playingcards import Shoe
 from pybaccarat.baccarat import Game
 from pybaccarat.baccaratsystems import Interactive, JustBoards
+from pybaccarat.montecarlo import run
 
 
 def just_boards():
@@ -39,9 +40,28 @@ if __name__ == "__main__":
     parser.add_argument("--just_boards", type=str2bool, nargs='?', const=True,
         default=False,
         help="Just use the program to display board results")
+    parser.add_argument("--simulate", dest="simulate", type=int,
+        help="play this many shoes headless on all CPUs and print totals")
+    parser.add_argument("--processes", type=int, default=None,
+        help="with --simulate, number of worker processes (default all CPUs)")
+    parser.add_argument("--chunk_size", type=int, default=100,
+        help="with --simulate, shoes handed to a worker at a time")
+    parser.add_argument("--seed", type=int, default=None,
+        help="with --simulate, root seed of the run (default random)")
+    parser.add_argument("--system", dest="systems", action="append",
+        default=[],
+        help="with --simulate, also play this system (George1, ValSys)")
+    parser.add_argument("--checkpoint", type=str, default=None,
+        help="with --simulate, save progress to this file and resume from it")
     args = parser.parse_args()
 
-    if args.use_filespec is not None:
+    if args.simulate is not None:
+        tally = run(args.simulate, root_seed=args.seed,
+                    processes=args.processes, chunk_size=args.chunk_size,
+                    systems=args.systems, checkpoint=args.checkpoint)
+        print("seed(%d)" % tally.root_seed)
+        print(tally.report())
+    elif args.use_filespec is not None:
         if args.create_filespec is not None:
             raise ValueError("can not use both --create and --use at same time")
         # --use creates an empty shoe, then fill from a saved file
@@ -9,6 +9,8 @@ This module is collection of classes used with playing the game
 <li>Hand</li>
 <li>Scoreboard</li>
 <li>Ties</li>
+<li>HandObserver and the trackers BptCounter, TieTracker, BoardTracker,
+    SideCounter and SystemTracker</li>
 <li>Game</li>
 </ul>
 @author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
@@ -21,10 +23,71 @@ This module is collection of classes used with playing the game
 '''
 
 
-from pybaccarat.playingcards import Card,Shoe
+import collections
+
+from pybaccarat.playingcards import Card,Shoe,get_card
+from pybaccarat.resolver import NATURALS, PLAYER_DRAWS, BANKER_DRAWS, \
+    OUTCOMES, STOOD, outcome_index
 
 __version__ = 0.22  ##!<@version 0.22
 
+##!< HandResult one hand of Game.simulate_shoe(): player and banker are
+# tuples of the Cards dealt, win/diff/bonus as Game.play_hand() returns.
+# The running counters are not in the record, so a plain simulate_shoe()
+# only deals and resolves; add a SideCounter (or BptCounter) observer to
+# read them after each hand.
+HandResult = collections.namedtuple(
+    'HandResult', 'player banker win diff bonus')
+##!< ShoeResult one shoe of Game.simulate_shoe(): the burned cards (the
+# shown card first) and the list of HandResult.
+ShoeResult = collections.namedtuple('ShoeResult', 'burned_cards hands')
+
+
+def _cards_value(cards):
+    '''!
+    Internal use only.
+    @return baccarat value of a tuple of Cards
+    '''
+    value = 0
+    for card in cards:
+        value += card.get_point()
+    return value % 10
+
+
+def _cards_string(cards):
+    '''!
+    Internal use only.
+    @return a tuple of Cards in the same form as str(Hand)
+    '''
+    return "[" + ",".join([str(card) for card in cards]) + "]"
+
+
+def _side_count(cards, rc1, rc2):
+    '''!
+    Internal use only.
+    @return the running side counts (rc1, rc2) after adding <em>cards</em>
+    '''
+    for c in cards:
+        r = c.get_point()
+        if r == 1 or r == 2 or r == 3:
+            rc1 += 1
+        elif r == 4 or r == 5 or r == 6 or r == 7:
+            rc2 += 1
+        elif r == 8 or r == 9:
+            rc1 += -1
+            rc2 += -2
+    return rc1,rc2
+
+
+def _mark_boards(boards, win):
+    '''!
+    Internal use only. Mark the result of a hand on the four scoreboards.
+    '''
+    boards[0].mark(win)
+    if win != "T":
+        for j in range(1,4):
+            boards[j].mark(boards[j].get_cs_mark(boards[0].get_array()))
+
 
 class Hand(object):
     '''!
@@ -83,10 +146,7 @@ class Hand(object):
         else:
             self.__cards[size] = new_card
             self.__size = size + 1
-            rank = new_card.get_rank()  # 1..13
-            if rank > 9:
-                rank = 0
-            self.__bacc_value = (self.__bacc_value + rank) % 10
+            self.__bacc_value = (self.__bacc_value + new_card.get_point()) % 10
 
     # -------------------------------------------------------------------------
     def __add__(self, right):
@@ -139,6 +199,14 @@ class Hand(object):
             card = self.__cards[index]
         return card
 
+    # -------------------------------------------------------------------------
+    def get_cards(self):
+        '''!
+        Return the cards in this hand.
+        @return tuple of 0 to 3 Cards, in the order they were added
+        '''
+        return tuple(self.__cards[:self.__size])
+
     # -------------------------------------------------------------------------
     def is_natural(self):
         '''!
@@ -187,19 +255,44 @@ class Scoreboard(object):
     board1 = "big eye boy"
     board2 = "small road"
     board3 = "cockroach pig"
+
+    The board is kept as a grid of characters, one bytearray per print
+    line, and mark() changes only the cells it marks. The lines are made
+    into strings when asked for. For the last column the number of rows
+    from the top already holding its marker is kept, so finding the slide
+    does not scan the column again.
     '''
     RED_SAME = 's'
     BLUE_CHOP = 'C'
+    __SPACE = ord(" ")
+    __EQUAL = ord("=")
+    __MORE = ord(">")
+    # "%2d" of the horizontal counts
+    __COUNTS = [("%2d" % n).encode("ascii") for n in range(100)]
 
     def __init__(self, type, table_size=6):
         self.board_type = type
         self.h_array = [ "R%d" % type ]
         self.horiz_count = table_size * [0]
-        self.lines = (table_size+1) * [None]
-        self.lines[0] = "....v....1....v....2....v....3....v....4" + \
+        header = "....v....1....v....2....v....3....v....4" + \
             "....v....5....v....6" + " R%d" % type
+        self.__grid = [bytearray(header.encode("ascii"))]
         for i in range(table_size):
-            self.lines[i + 1] = " "*60 + " %2d" % self.horiz_count[i]
+            self.__grid.append(bytearray(
+                (" "*60 + " %2d" % self.horiz_count[i]).encode("ascii")))
+        self.__sixty = len(header) - 3
+        # the rows from the top of column run_col holding its marker,
+        # run_col 0 when it must be counted again
+        self.__run_col = 0
+        self.__run = 0
+
+    @property
+    def lines(self):
+        '''!
+        The print lines, the column ruler first, then one line per row
+        ending with its horizontal count.
+        '''
+        return [row.decode("ascii") for row in self.__grid]
 
     def get_array(self):
         return self.h_array
@@ -227,54 +320,66 @@ class Scoreboard(object):
         # "len<2" means this is the first mark on this board.
         # "[-1][0]!=marker" means this is a different marker from the
         # last one recorded, thus requires a new column.
-        if len(self.h_array) < 2 or self.h_array[-1][0] != marker:
+        h_array = self.h_array
+        if len(h_array) < 2 or h_array[-1][0] != marker:
             # add a new column with a count of 0 (incremented later)
-            self.h_array.append( [marker, 0] )
+            h_array.append( [marker, 0] )
         # increment the count in this column
-        col = len(self.h_array) - 1
-        self.h_array[col][1] += 1
+        col = len(h_array) - 1
+        h_array[col][1] += 1
         # time to mark the print lines
-        row = self.h_array[col][1]
+        row = h_array[col][1]
         #
-        six = len(self.horiz_count)
-        sixty = len(self.lines[0]) - 3
+        grid = self.__grid
+        code = ord(marker)
+        position = col - 1
+        horiz_count = self.horiz_count
+        six = len(horiz_count)
+        sixty = self.__sixty
         # update the horiz count
         if row <= six:
-            self.horiz_count[row - 1] += 1
-            self.lines[row] = self.lines[row][:sixty + 1] + \
-                "%2d" % self.horiz_count[row - 1]
-        # calculate the slide
-        slide = 0
-        for iRow in range(row - 1):
-            if six <= iRow:
-                slide = row - iRow
-                break
-            if marker != self.lines[iRow + 1][col - 1]:
-                slide = row - iRow
-                break
-        if slide == 0:
-            if six < row:
-                slide = row - six
+            count = horiz_count[row - 1] + 1
+            horiz_count[row - 1] = count
+            if count < 100:
+                grid[row][sixty + 1:] = self.__COUNTS[count]
             else:
-                if " " != self.lines[row][col - 1]:
-                    slide = 1
+                grid[row][sixty + 1:] = ("%2d" % count).encode("ascii")
+            if sixty < position:
+                self.__run_col = 0
+        # calculate the slide: the mark slides right from the first row,
+        # from the top of this column, not holding the marker
+        if self.__run_col != col:
+            run = 0
+            while run < six and grid[run + 1][position] == code:
+                run += 1
+            self.__run_col = col
+        else:
+            run = self.__run
+        if run < row - 1:
+            slide = row - run
+        elif six < row:
+            slide = row - six
+        elif self.__SPACE != grid[row][position]:
+            slide = 1
+        else:
+            slide = 0
         #
         if sixty < col + slide:
             # slide too far to the right, add special mark
-            self.lines[row - slide] = \
-                self.lines[row - slide][:sixty] + ">" + \
-                self.lines[row - slide][sixty + 1:]
+            grid[row - slide][sixty] = self.__MORE
+            if sixty == position:
+                self.__run_col = 0
         else:
             #check for same below us without slide, change to "="
             if slide == 0 and row < six:
-                if marker == self.lines[row + 1][col - 1]:
-                    self.lines[row + 1] = \
-                        self.lines[row + 1][:col - 1] + "=" + \
-                        self.lines[row + 1][col:]
+                if code == grid[row + 1][position]:
+                    grid[row + 1][position] = self.__EQUAL
             #mark it, it should be empty
-            self.lines[row - slide] = \
-                self.lines[row - slide][:col + slide - 1] + marker + \
-                self.lines[row - slide][col + slide:]
+            grid[row - slide][position + slide] = code
+            if slide == 0:
+                # rows above all hold the marker, the row below does not
+                run = row
+        self.__run = run
 
     def get_cs_mark(self, main_array):
         '''!
@@ -319,10 +424,7 @@ class Scoreboard(object):
         return temp
 
     def print_lines(self):
-        out = ""
-        for line in self.lines:
-            out += line + "\n"
-        return out
+        return "".join([line + "\n" for line in self.lines])
 
     def remove_last(self):
         pass
@@ -393,19 +495,237 @@ class Ties(object):
 # end class Ties
 
 
+class HandObserver(object):
+    '''!
+    Parent class of the trackers a Game notifies as a shoe is played.
+    Register one with Game.add_observer(). Children override only the
+    events they need; the methods here do nothing.
+    '''
+
+    # -------------------------------------------------------------------------
+    def new_shoe(self, burned_cards):
+        '''!
+        Called after the burn, before the first hand of a shoe.
+        @param burned_cards list of the cards burned, the shown card first
+        '''
+        pass
+
+    # -------------------------------------------------------------------------
+    def hand_pre(self, hand_number):
+        '''!
+        Called before the cards of a hand are dealt.
+        @param hand_number <em>int</em> 1, 2, 3, ...
+        @return display string
+        '''
+        return ""
+
+    # -------------------------------------------------------------------------
+    def hand_post(self, hand_number, hand, player, banker):
+        '''!
+        Called after a hand is played.
+        @param hand_number <em>int</em> 1, 2, 3, ...
+        @param hand HandResult
+        @param player Hand of the player, read-only, None when replaying
+            results
+        @param banker Hand of the banker, read-only, None when replaying
+            results
+        @return display string
+        '''
+        return ""
+
+    # -------------------------------------------------------------------------
+    def end_shoe(self):
+        '''!
+        Called after the last hand of a shoe.
+        @return display string
+        '''
+        return ""
+
+    # -------------------------------------------------------------------------
+# end class HandObserver
+
+
+class BptCounter(HandObserver):
+    '''!
+    Count the hands won by banker, player and tie.
+    bpt is the dictionary {'B': n, 'P': n, 'T': n}.
+    '''
+    def __init__(self):
+        self.bpt = {'B': 0, 'P': 0, 'T': 0}
+
+    def new_shoe(self, burned_cards):
+        self.bpt = {'B': 0, 'P': 0, 'T': 0}
+
+    def hand_post(self, hand_number, hand, player, banker):
+        self.bpt[hand.win] += 1
+        return ""
+# end class BptCounter
+
+
+class TieTracker(HandObserver):
+    '''!
+    Keep the Ties tracker of a shoe up to date.
+    '''
+    def __init__(self):
+        self.ties = Ties()
+
+    def new_shoe(self, burned_cards):
+        self.ties = Ties()
+
+    def hand_post(self, hand_number, hand, player, banker):
+        self.ties.mark(hand.win)
+        return ""
+# end class TieTracker
+
+
+class BoardTracker(HandObserver):
+    '''!
+    Keep the four Scoreboards of a shoe up to date: big road (0), big eye
+    boy (1), small road (2) and cockroach pig (3).
+    '''
+    def __init__(self):
+        self.boards = [Scoreboard(0), Scoreboard(1), Scoreboard(2),
+                       Scoreboard(3)]
+
+    def new_shoe(self, burned_cards):
+        self.boards = [Scoreboard(0), Scoreboard(1), Scoreboard(2),
+                       Scoreboard(3)]
+
+    def hand_post(self, hand_number, hand, player, banker):
+        _mark_boards(self.boards, hand.win)
+        return ""
+
+    def peek_b(self):
+        '''!
+        @return the marks boards 1, 2 and 3 would get if banker won next
+        '''
+        boards = self.boards
+        arrayB = boards[0].get_peek_B_array(boards[0].get_array())
+        return boards[1].get_cs_mark(arrayB) + \
+            boards[2].get_cs_mark(arrayB) + boards[3].get_cs_mark(arrayB)
+# end class BoardTracker
+
+
+class SideCounter(HandObserver):
+    '''!
+    Keep the running side counts rc1 and rc2 of a shoe.
+    '''
+    def __init__(self):
+        self.rc1 = 0
+        self.rc2 = 0
+
+    def new_shoe(self, burned_cards):
+        self.rc1 = 0
+        self.rc2 = 0
+
+    def hand_post(self, hand_number, hand, player, banker):
+        self.rc1, self.rc2 = _side_count(hand.player, self.rc1, self.rc2)
+        self.rc1, self.rc2 = _side_count(hand.banker, self.rc1, self.rc2)
+        return ""
+
+    def flags(self, hand_number):
+        '''!
+        @return (flag1, flag2), ">" when rc1 is over its threshold and "<"
+            when rc2 is over its threshold for this hand number, else " "
+        '''
+        flag1 = " "
+        flag2 = " "
+        if (25 + hand_number // 11) < self.rc1:
+            flag1 = ">"
+        if (32 - 4 * (hand_number // 11)) < self.rc2:
+            flag2 = "<"
+        return (flag1, flag2)
+# end class SideCounter
+
+
+class SystemTracker(HandObserver):
+    '''!
+    Drive a baccaratsystems.BaccSys from hand events. The system reads the
+    scoreboards, ties and BPT counts of the trackers given, which must be
+    registered before this one. Several SystemTrackers may share the same
+    trackers. A card count system (baccaratsystems.Dragon, EZDragon) is
+    driven the same way but is only given the cards.
+    '''
+    def __init__(self, system, boards, ties, bpt):
+        '''!
+        @param system baccaratsystems.BaccSys, Dragon or EZDragon
+        @param boards BoardTracker
+        @param ties TieTracker
+        @param bpt BptCounter
+        '''
+        self.system = system
+        self.__boards = boards
+        self.__ties = ties
+        self.__bpt = bpt
+
+    def new_shoe(self, burned_cards):
+        '''!
+        @exception ValueError
+            If the system forces the cards (JustBoards), which only
+            Game.play() supports.
+        '''
+        if not hasattr(self.system, 'set_tie_object'):
+            # a card count system, it has no use for the boards
+            self.system.new_shoe(burned_cards[:1])
+            return
+        if self.system.new_shoe(burned_cards[:1], self.__boards.boards):
+            raise ValueError("system(%s) needs play()" % self.system.name)
+        self.system.set_tie_object(self.__ties.ties)
+        self.system.set_bpt_object(self.__bpt.bpt)
+
+    def hand_pre(self, hand_number):
+        return self.system.hand_pre()
+
+    def hand_post(self, hand_number, hand, player, banker):
+        return self.system.hand_post(hand.win + hand.diff, player, banker)
+
+    def end_shoe(self):
+        return self.system.end_shoe()
+# end class SystemTracker
+
+
+def _system_observers(systems):
+    '''!
+    Internal use only.
+    @param systems list of systems
+    @return the observers that drive <em>systems</em> through a shoe: one
+        BptCounter, TieTracker and BoardTracker shared by all of them, then
+        a SystemTracker for each
+    '''
+    bpt = BptCounter()
+    ties = TieTracker()
+    boards = BoardTracker()
+    return [bpt, ties, boards] + \
+        [SystemTracker(system, boards, ties, bpt) for system in systems]
+
+
 class Game(object):
     '''!
     This class plays a game of Baccarat
     '''
 
     # -------------------------------------------------------------------------
-    def __init__(self, shoe=None, player=None, banker=None, system=None):
+    def __init__(self, shoe=None, player=None, banker=None, system=None,
+                 rng=None, pool=None, systems=None):
         '''!
         TBD
+        @param systems list of more systems for simulate_shoe() to play on
+            the same deal as <em>system</em>. See simulate_shoe().
+        @param rng random number generator or integer seed used to shuffle
+            the new 8 deck shoe created when <em>shoe</em> is None.
+            See Shoe.
+        @param pool shoepool.ShoePool. When given, every play() takes a
+            shuffled shoe from the pool and gives it back at the end, in
+            place of <em>shoe</em>.
+        @exception ValueError
+            If both <em>shoe</em> and <em>pool</em> are given.
         '''
         #
-        if shoe is None:
-            shoe = Shoe(8)
+        if pool is not None:
+            if shoe is not None:
+                raise ValueError("give shoe or pool, not both")
+        elif shoe is None:
+            shoe = Shoe(8, rng=rng)
             shoe.shuffle()
         if player is None:
             player = Hand()
@@ -413,14 +733,53 @@ class Game(object):
             banker = Hand()
         #
         self.__shoe = shoe
+        self.__pool = pool
         self.__player = player
         ##!< banker is the Hand for banker
         self.__banker = banker
         ##!< system_play is the bacc system we are tracking
         self.system_play = system
+        ##!< systems more systems played by simulate_shoe()
+        self.systems = []
+        if systems is not None:
+            self.systems = list(systems)
         #
         self.count_d7 = 0
         self.count_p8 = 0
+        self.__observers = []
+
+    # -------------------------------------------------------------------------
+    def add_observer(self, observer):
+        '''!
+        Register a tracker to be notified of every shoe and hand played by
+        simulate_shoe() (and play() without a system). Observers are
+        notified in the order they were added. With no observers only the
+        deal and resolve of the hands is done.
+        @param observer HandObserver
+        '''
+        self.__observers.append(observer)
+
+    # -------------------------------------------------------------------------
+    def remove_observer(self, observer):
+        '''!
+        Stop notifying a tracker added by add_observer().
+        @param observer HandObserver
+        @exception ValueError
+            If <em>observer</em> was not added.
+        '''
+        self.__observers.remove(observer)
+
+    # -------------------------------------------------------------------------
+    def set_shoe(self, shoe):
+        '''!
+        Replace the shoe played by the next play() or simulate_shoe().
+        @param shoe Shoe (or ArrayShoe, VirtualShoe)
+        @exception ValueError
+            If this game takes its shoes from a pool.
+        '''
+        if self.__pool is not None:
+            raise ValueError("game shoes come from the pool")
+        self.__shoe = shoe
 
     # -------------------------------------------------------------------------
     def play_hand(self):
@@ -429,105 +788,272 @@ class Game(object):
         zparam hand_number <em>int</em>
         @return (win,diff)
         '''
-        bonus = "  "
         # deal first 4 cards
-        self.__player.add(self.__shoe.deal())
-        self.__banker.add(self.__shoe.deal())
-        self.__player.add(self.__shoe.deal())
-        self.__banker.add(self.__shoe.deal())
-        # if not naturals, then third hits?
-        diff = "n"
-        if (not self.__player.is_natural()) and \
-           (not self.__banker.is_natural()):
-            diff = "0"
-            if self.__player.need_hit(None):
-                self.__player.add(self.__shoe.deal())
-            if self.__banker.need_hit(self.__player):
-                self.__banker.add(self.__shoe.deal())
-        # get winning hand
-        if self.__banker.value() < self.__player.value():
-            win = "P"
-            if not self.__player.is_natural():
-                diff = str(self.__player.value() - self.__banker.value())
-            if (self.__player.value() == 8) and \
-               (self.__player.get_card(2) is not None):
-                bonus = "P8"
-                self.count_p8 += 1
-        elif self.__banker.value() > self.__player.value():
-            win = "B"
-            if not self.__banker.is_natural():
-                diff = str(self.__banker.value() - self.__player.value())
-            if (self.__banker.value() == 7) and \
-               (self.__banker.get_card(2) is not None):
-                bonus = "D7"
-                self.count_d7 += 1
-        else:
-            win = "T"
+        cards = self.__shoe.deal_many(4)
+        if len(cards) < 4:
+            raise ValueError("shoe ran out of cards")
+        player = self.__player
+        banker = self.__banker
+        player.add(cards[0])
+        banker.add(cards[1])
+        player.add(cards[2])
+        banker.add(cards[3])
+        # decisions and outcome are looked up, see resolver
+        result = NATURALS[player.value() * 10 + banker.value()]
+        if result is None:
+            third = STOOD
+            if PLAYER_DRAWS[player.value()]:
+                card = self.__shoe.deal()
+                player.add(card)
+                third = card.get_point()
+            banker_drew = BANKER_DRAWS[banker.value() * 11 + third]
+            if banker_drew:
+                banker.add(self.__shoe.deal())
+            result = OUTCOMES[outcome_index(player.value(), banker.value(),
+                                            third != STOOD, banker_drew)]
+        (win, diff, bonus, _) = result
+        if bonus == "P8":
+            self.count_p8 += 1
+        elif bonus == "D7":
+            self.count_d7 += 1
         return (win, diff, bonus)
 
     def side_count(self, hand, rc1, rc2):
-        for i in range(3):
-            c = hand.get_card(i)
-            if c is not None:
-                r = c.get_rank()
-                if r == 1 or r == 2 or r == 3:
-                    rc1 += 1
-                elif r == 4 or r == 5 or r == 6 or r == 7:
-                    rc2 += 1
-                elif r == 8 or r == 9:
-                    rc1 += -1
-                    rc2 += -2
-        return rc1,rc2
+        return _side_count(hand.get_cards(), rc1, rc2)
 
     # -------------------------------------------------------------------------
-    def play(self, display=True, show_burn_cards=False, cut_card=-14):
+    def __burn(self, cut_card):
         '''!
-        Play one game of Baccarat.
+        Internal use only.
+        Start a new shoe: reset the counters and the shoe, set the cut card
+        and burn cards. The first card is shown and its rank (10 for a
+        ten or face card) is the number of cards burned after it.
+        @return list of every card burned, the shown card first
         '''
-
-        # start of new shoe procedure
         self.count_d7 = 0
         self.count_p8 = 0
         self.__shoe.reset()
-        #self.__shoe.shuffle()
         self.__shoe.set_cut_card(cut_card)
-        tie_track = Ties()
-        boards = [Scoreboard(0), Scoreboard(1), Scoreboard(2), Scoreboard(3)]
-        rc1 = 0
-        rc2 = 0
-
-        # burn procedure
-        burn = self.__shoe.deal()
-        if display:
-            display_burn = "burn(%s)" % str(burn)
-        burned_cards = [burn]
-        burn = burn.get_rank()
+        burned_cards = [self.__shoe.deal()]
+        burn = burned_cards[0].get_rank()
         if burn > 9:
             burn = 10
         for _ in range(burn):
-            burned_card = self.__shoe.deal()
+            burned_cards.append(self.__shoe.deal())
+        return burned_cards
+
+    # -------------------------------------------------------------------------
+    def __run(self, function, *args):
+        '''!
+        Internal use only.
+        Call function(*args), on a shoe from the pool if there is one.
+        '''
+        if self.__pool is None:
+            return function(*args)
+        self.__shoe = self.__pool.get()
+        try:
+            return function(*args)
+        finally:
+            self.__pool.release(self.__shoe)
+            self.__shoe = None
+
+    # -------------------------------------------------------------------------
+    def simulate_shoe(self, cut_card=-14):
+        '''!
+        Play one shoe of Baccarat without any display.
+        Uses the same burn and cut card rules as play(), but builds no
+        strings and prints nothing. count_d7 and count_p8 are updated as
+        play() does. The observers added with add_observer() are notified
+        of the shoe and of every hand. The system_play and the systems
+        are each driven by a SystemTracker. They share one deal and one
+        BptCounter, TieTracker and BoardTracker to read, placed after the
+        added observers for this shoe only, so each extra system costs
+        only its own hand_pre() and hand_post(). Each system keeps its own
+        plays and money; the results are left in the system objects.
+
+        Example usage:
+        @code{.py}
+            result = Game(shoe=shoe).simulate_shoe()
+            wins = [hand.win for hand in result.hands]
+        @endcode
+
+        @param cut_card <em>int</em> cut card position, see
+            Shoe.set_cut_card()
+        @return ShoeResult
+        @exception ValueError
+            If the system_play forces the cards (JustBoards), which only
+            play() supports.
+        '''
+        return self.__run(self.__simulate_shoe, cut_card)
+
+    # -------------------------------------------------------------------------
+    def __simulate_shoe(self, cut_card):
+        '''!
+        Internal use only. simulate_shoe() on the current shoe.
+        '''
+        burned_cards = self.__burn(cut_card)
+        player = self.__player
+        banker = self.__banker
+        observers = self.__observers
+        systems = self.systems
+        if self.system_play is not None:
+            systems = [self.system_play] + systems
+        if systems:
+            observers = observers + _system_observers(systems)
+        for observer in observers:
+            observer.new_shoe(burned_cards)
+        hands = []
+        hand_number = 0
+        last_hand = False
+        while not last_hand:
+            hand_number += 1
+            player.empty()
+            banker.empty()
+            last_hand = self.__shoe.cut_card_seen()
+            for observer in observers:
+                observer.hand_pre(hand_number)
+            (win, diff, bonus) = self.play_hand()
+            hand = HandResult(player.get_cards(), banker.get_cards(),
+                              win, diff, bonus)
+            hands.append(hand)
+            for observer in observers:
+                observer.hand_post(hand_number, hand, player, banker)
+        for observer in observers:
+            observer.end_shoe()
+        return ShoeResult(tuple(burned_cards), hands)
+
+    # -------------------------------------------------------------------------
+    def play(self, display=True, show_burn_cards=False, cut_card=-14):
+        '''!
+        Play one game of Baccarat.
+        Without a system_play this is simulate_shoe() followed by render()
+        when <em>display</em> is True. With a system_play, the systems
+        list is not played.
+        '''
+        if self.system_play is not None:
+            self.__run(self.__play_system, display, show_burn_cards,
+                       cut_card)
+            return
+        result = self.simulate_shoe(cut_card)
+        if display:
+            self.render(result, show_burn_cards)
+
+    # -------------------------------------------------------------------------
+    def render(self, result, show_burn_cards=False):
+        '''!
+        Print a shoe played by simulate_shoe(): the burn line, one line per
+        hand and the end of shoe summary and scoreboards.
+        @param result ShoeResult
+        @param show_burn_cards <em>boolean</em> print the burned cards, or
+            XX for each
+        '''
+        print(self.__burn_line(result.burned_cards, show_burn_cards))
+        bpt = BptCounter()
+        ties = TieTracker()
+        boards = BoardTracker()
+        counts = SideCounter()
+        observers = [bpt, ties, boards, counts]
+        for observer in observers:
+            observer.new_shoe(result.burned_cards)
+        count_d7 = 0
+        count_p8 = 0
+        for index, hand in enumerate(result.hands):
+            for observer in observers:
+                observer.hand_post(index + 1, hand, None, None)
+            if hand.bonus == "D7":
+                count_d7 += 1
+            elif hand.bonus == "P8":
+                count_p8 += 1
+            self.__print_hand(index + 1, hand, bpt.bpt, boards, counts, "")
+            # the hand after this one starts with the cut card seen
+            if index + 2 == len(result.hands):
+                print("last hand of this shoe")
+        self.__print_end(ties.ties, boards.boards, count_d7, count_p8)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def __burn_line(burned_cards, show_burn_cards):
+        '''!
+        Internal use only. Return the burn line to display.
+        '''
+        display_burn = "burn(%s)" % str(burned_cards[0])
+        for burned_card in burned_cards[1:]:
             if show_burn_cards:
                 display_burn += " " + str(burned_card)
-                burned_cards.append(burned_card)
             else:
                 display_burn += " XX"
+        return display_burn
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def __print_hand(hand_number, hand, bpt, boards, counts,
+                     system_hand_output):
+        '''!
+        Internal use only. Print the line for one hand.
+        @param hand HandResult
+        @param bpt dictionary of B, P and T counts
+        @param boards BoardTracker
+        @param counts SideCounter
+        '''
+        board0horiz_count = boards.boards[0].get_horiz_count()
+        peekB = boards.peek_b()
+        (flag1, flag2) = counts.flags(hand_number)
+
+        print(("%02d P%d%-10s B%d%-10s %s%s %s BPT=%02d-%02d-%02d" + \
+              " %02d/%02d %s%s%02d,%02d%s %s") %
+              (hand_number,
+               _cards_value(hand.player), _cards_string(hand.player),
+               _cards_value(hand.banker), _cards_string(hand.banker),
+               hand.win, hand.diff, hand.bonus, bpt['B'], bpt['P'], bpt['T'],
+               board0horiz_count[0], board0horiz_count[1], peekB,
+               flag1, counts.rc1, counts.rc2, flag2, system_hand_output))
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def __print_end(tie_track, boards, count_d7, count_p8):
+        '''!
+        Internal use only. Print the end of shoe summary and scoreboards.
+        '''
+        print("%-30s  D7(%d) P8(%d)" % \
+            (str(tie_track), count_d7, count_p8))
+        print(boards[0].print_lines())
+        print(boards[2].print_lines())
+
+    # -------------------------------------------------------------------------
+    def __play_system(self, display, show_burn_cards, cut_card):
+        '''!
+        Internal use only. Play one game of Baccarat on the current shoe
+        with the system_play deciding before and after every hand.
+        '''
+
+        # start of new shoe procedure
+        burned = self.__burn(cut_card)
+        display_burn = self.__burn_line(burned, show_burn_cards)
+        burned_cards = burned[:1]
+        if show_burn_cards:
+            burned_cards = burned
+        bpt_counter = BptCounter()
+        ties = TieTracker()
+        board_tracker = BoardTracker()
+        counts = SideCounter()
+        trackers = [bpt_counter, ties, board_tracker]
+        tie_track = ties.ties
+        boards = board_tracker.boards
 
         # prepare before playing entire shoe
         hand_number = 0
         last_hand = False
-        bpt = {'B': 0, 'P': 0, 'T': 0}
+        bpt = bpt_counter.bpt
         win = 'X'
 
-        special_JustBoards = False
         if display:
             print(display_burn)
-        if self.system_play is not None:
-            special_JustBoards = self.system_play.new_shoe(burned_cards, boards)
-            self.system_play.set_tie_object(tie_track)
-            self.system_play.set_bpt_object(bpt)
-            if special_JustBoards:
-                special_card9s = Card(9, 's')
-                special_cardJh = Card(11, 'h')
+        special_JustBoards = self.system_play.new_shoe(burned_cards, boards)
+        self.system_play.set_tie_object(tie_track)
+        self.system_play.set_bpt_object(bpt)
+        if special_JustBoards:
+            special_card9s = get_card(9, 's')
+            special_cardJh = get_card(11, 'h')
         #
         while not last_hand:
             # start of a hand
@@ -535,104 +1061,75 @@ class Game(object):
             self.__player.empty()
             self.__banker.empty()
             last_hand = self.__shoe.cut_card_seen()
-            system_hand_output = ""
-            if self.system_play is not None:
-                #
-                print(79*"=")
-                print(boards[0].print_lines())
-                print(boards[2].print_lines())
-                print(str(tie_track))
-                print(self.system_play.end_shoe())
-                #
-                system_hand_output = self.system_play.hand_pre()
-                if special_JustBoards:
-                    print("***\n*** special_JustBoards\n***")
-                    if system_hand_output == "B" or \
-                       system_hand_output == "P" or \
-                       system_hand_output == "T":
-                        next_card = self.__shoe._Shoe__next_card
-                        print("*** force a %s" % system_hand_output)
-                        special_1 = special_cardJh
-                        special_2 = special_cardJh
-                        if system_hand_output != "B":
-                            special_1 = special_card9s
-                        if system_hand_output != "P":
-                            special_2 = special_card9s
-                        self.__shoe._Shoe__cards[next_card+0] = special_cardJh
-                        self.__shoe._Shoe__cards[next_card+1] = special_cardJh
-                        self.__shoe._Shoe__cards[next_card+2] = special_1 #p2
-                        self.__shoe._Shoe__cards[next_card+3] = special_2 #b2
-                    elif system_hand_output == "X":
-                        print("*** backup")
-                        hand_number -= 1
-                        if hand_number < 0:
-                            hand_number = 0
-                        print("***win(%s)" % win)
-                        if win == 'X':
-                            print("can not clear")
-                        else:
-                            bpt[win] -= 1
-                            if win == 'T':
-                                tie_track.remove_last()
-                            win = 'X'
-                        boards[0].remove_last()
-                        h_array = boards[0].get_array()
-                        if 1 < len(h_array):
-                            #last_col = len(h_array
-                            h_a_index = len(h_array) - 1
-                            boards[0].h_array[h_a_index][1] -= 1
-                        for j in range(1,4):
-                            boards[j].remove_last()
-                            print("%s" % str(boards[j].get_array()))
-                            print("%s" % str(boards[j].get_horiz_count()))
-                        continue
+            #
+            print(79*"=")
+            print(boards[0].print_lines())
+            print(boards[2].print_lines())
+            print(str(tie_track))
+            print(self.system_play.end_shoe())
+            #
+            system_hand_output = self.system_play.hand_pre()
+            if special_JustBoards:
+                print("***\n*** special_JustBoards\n***")
+                if system_hand_output == "B" or \
+                   system_hand_output == "P" or \
+                   system_hand_output == "T":
+                    print("*** force a %s" % system_hand_output)
+                    special_1 = special_cardJh
+                    special_2 = special_cardJh
+                    if system_hand_output != "B":
+                        special_1 = special_card9s
+                    if system_hand_output != "P":
+                        special_2 = special_card9s
+                    self.__shoe.force_cards([special_cardJh,
+                                             special_cardJh,
+                                             special_1,   #p2
+                                             special_2])  #b2
+                elif system_hand_output == "X":
+                    print("*** backup")
+                    hand_number -= 1
+                    if hand_number < 0:
+                        hand_number = 0
+                    print("***win(%s)" % win)
+                    if win == 'X':
+                        print("can not clear")
                     else:
-                        print("*** what is this??? (%s)" % system_hand_output)
+                        bpt[win] -= 1
+                        if win == 'T':
+                            tie_track.remove_last()
+                        win = 'X'
+                    boards[0].remove_last()
+                    h_array = boards[0].get_array()
+                    if 1 < len(h_array):
+                        #last_col = len(h_array
+                        h_a_index = len(h_array) - 1
+                        boards[0].h_array[h_a_index][1] -= 1
+                    for j in range(1,4):
+                        boards[j].remove_last()
+                        print("%s" % str(boards[j].get_array()))
+                        print("%s" % str(boards[j].get_horiz_count()))
+                    continue
+                else:
+                    print("*** what is this??? (%s)" % system_hand_output)
 
             (win, diff, bonus) = self.play_hand()
-            bpt[win] += 1
-            tie_track.mark(win)
-            boards[0].mark(win)
-            for j in range(1,4):
-                if win != "T":
-                    boards[j].mark(boards[j].get_cs_mark(boards[0].get_array()))
+            hand = HandResult(self.__player.get_cards(),
+                              self.__banker.get_cards(), win, diff, bonus)
+            for tracker in trackers:
+                tracker.hand_post(hand_number, hand, self.__player,
+                                  self.__banker)
 
             # shoe hand results
-            if self.system_play is not None:
-                system_hand_output += self.system_play.hand_post(win+diff,
-                                                                 self.__player,
-                                                                 self.__banker)
+            system_hand_output += self.system_play.hand_post(win+diff,
+                                                             self.__player,
+                                                             self.__banker)
 
             #running counts
-            rc1,rc2 = self.side_count(self.__player, rc1, rc2)
-            rc1,rc2 = self.side_count(self.__banker, rc1, rc2)
+            counts.hand_post(hand_number, hand, self.__player, self.__banker)
 
             if display:
-                board0horiz_count = boards[0].get_horiz_count()
-                #
-                peekB = ""
-                if True:
-                    board0arr = boards[0].get_array()
-                    arrayB = boards[0].get_peek_B_array(board0arr)
-                    peekB += boards[1].get_cs_mark(arrayB)
-                    peekB += boards[2].get_cs_mark(arrayB)
-                    peekB += boards[3].get_cs_mark(arrayB)
-                #
-                flag1 = " "
-                flag2 = " "
-                if (25 + hand_number // 11) < rc1:
-                    flag1 = ">"
-                if (32 - 4 * (hand_number // 11)) < rc2:
-                    flag2 = "<"
-
-                print(("%02d P%d%-10s B%d%-10s %s%s %s BPT=%02d-%02d-%02d" + \
-                      " %02d/%02d %s%s%02d,%02d%s %s") %
-                      (hand_number,
-                       self.__player.value(), str(self.__player),
-                       self.__banker.value(), str(self.__banker),
-                       win, diff, bonus, bpt['B'], bpt['P'], bpt['T'],
-                       board0horiz_count[0], board0horiz_count[1], peekB,
-                       flag1, rc1, rc2, flag2, system_hand_output))
+                self.__print_hand(hand_number, hand, bpt, board_tracker,
+                                  counts, system_hand_output)
             # notify the user
             if self.__shoe.cut_card_seen() and not last_hand:
                 if display:
@@ -643,12 +1140,8 @@ class Game(object):
         # end of shoe
         #
         if display:
-            print("%-30s  D7(%d) P8(%d)" % \
-                (str(tie_track), self.count_d7, self.count_p8))
-            print(boards[0].print_lines())
-            print(boards[2].print_lines())
+            self.__print_end(tie_track, boards, self.count_d7, self.count_p8)
 
-        if self.system_play is not None:
-            print(self.system_play.end_shoe())
+        print(self.system_play.end_shoe())
     # -------------------------------------------------------------------------
 # end class Game
@@ -16,10 +16,16 @@ class Dragon(object):
     '''
 
     # --------------------------------------------------------------------
-    def __init__(self):
+    def __init__(self, threshold=25, threshold_hands=11):
         '''!
         TBD
+        @param threshold <em>int</em> the count must be over this to play
+            at the start of the shoe
+        @param threshold_hands <em>int</em> the threshold goes up 1 every
+            this many hands
         '''
+        self.threshold = threshold
+        self.threshold_hands = threshold_hands
         self.dragon_play = "    "
         self.dragon_count = 0
         self.dragon_dict = {}
@@ -29,7 +35,8 @@ class Dragon(object):
     def update_count(self, rank):
         '''!
         Add these ranks to the count.
-        @param rank <em>int</em> card rank's to add to system count
+        @param rank <em>int</em> card rank's to add to system count. The
+            baccarat point (Card.get_point()) gives the same count.
         '''
         if (rank == 1) or (rank == 2) or (rank == 3):
             self.dragon_count += 1
@@ -42,9 +49,10 @@ class Dragon(object):
         Begin a new shoe.
         @param burn_cards <em>Card</em>
         '''
+        self.hand_number = 0
         ##!< dragon_count used to count my system
         self.dragon_count = 0
-        self.update_count(burn_cards[0].get_rank())
+        self.update_count(burn_cards[0].get_point())
         ##!< dragon_play is used for display out
         self.dragon_play = "    "
         ##!< dragon_dict tracks the side bet difference results
@@ -71,7 +79,8 @@ class Dragon(object):
         #             66 >31         =6
         # hand_number 77 >32    h//11=7+25
         #
-        threshold = 25 + (self.hand_number // 11)
+        threshold = self.threshold + \
+            (self.hand_number // self.threshold_hands)
         if threshold < self.dragon_count:
             self.dragon_play = " <<<"
             self.dragon_dict[win_diff] += 1
@@ -82,17 +91,18 @@ class Dragon(object):
         for i in range(3):
             card = player.get_card(i)
             if card is not None:
-                self.update_count(card.get_rank())
+                self.update_count(card.get_point())
             card = banker.get_card(i)
             if card is not None:
-                self.update_count(card.get_rank())
+                self.update_count(card.get_point())
         return "dragon=%s<%02d%s" % \
             (str(threshold), self.dragon_count, self.dragon_play)
 
     # --------------------------------------------------------------------
-    def end_shoe(self):
+    def get_money(self):
         '''!
-        TBD
+        @return (dragon_p_money, dragon_b_money, dragon_plays) the units won
+            on the player and banker side bets and the number of plays
         '''
         dragon_p_money = 0
         dragon_b_money = 0
@@ -117,7 +127,14 @@ class Dragon(object):
             elif 'Bn' == k: dragon_b_money += v*1
             elif 'Tn' == k: dragon_b_money += v*0
             else:           dragon_b_money -= v
+        return (dragon_p_money, dragon_b_money, dragon_plays)
 
+    # --------------------------------------------------------------------
+    def end_shoe(self):
+        '''!
+        TBD
+        '''
+        (dragon_p_money, dragon_b_money, dragon_plays) = self.get_money()
         out = ""
         if False:
             out += "Tn" + "=" + str(self.dragon_dict['Tn'])
@@ -144,10 +161,19 @@ class EZDragon(object):
     '''
 
     # --------------------------------------------------------------------
-    def __init__(self):
+    def __init__(self, true_count=4.0, decks=8.65, hands_per_deck=10.0):
         '''!
         TBD
+        @param true_count <em>float</em> play when the true count is at
+            least this
+        @param decks <em>float</em> decks left at the start of the shoe,
+            for the true count
+        @param hands_per_deck <em>float</em> hands played per deck, for the
+            true count
         '''
+        self.true_count = true_count
+        self.decks = decks
+        self.hands_per_deck = hands_per_deck
         self.play_w = 0
         self.play_l = 0
         self.count = 0
@@ -156,7 +182,8 @@ class EZDragon(object):
     # --------------------------------------------------------------------
     def add_count(self, card_rank):
         '''!
-        Local routine to add a card to the count
+        Local routine to add a card to the count. Either the rank or the
+        baccarat point of the card may be given, the count is the same.
         '''
         debug = False
         if debug:
@@ -181,9 +208,10 @@ class EZDragon(object):
             the count.
         '''
         self.count = 0
-        self.add_count(burn_cards[0].get_rank())
+        self.add_count(burn_cards[0].get_point())
         self.play_w = 0
         self.play_l = 0
+        self.hand_number = 0
 
     # --------------------------------------------------------------------
     def hand_pre(self):
@@ -205,10 +233,10 @@ class EZDragon(object):
         for i in range(3):
             card = banker.get_card(i)
             if card is not None:
-                self.add_count(card.get_rank())
+                self.add_count(card.get_point())
             card = player.get_card(i)
             if card is not None:
-                self.add_count(card.get_rank())
+                self.add_count(card.get_point())
         # who won
         if win_diff[0] == 'B':
             pass
@@ -234,9 +262,11 @@ class EZDragon(object):
         # cut 14
 
         result = '-'
-        true_count = this_hand_count / (8.65 - self.hand_number/10.0)
-        next_tc = (self.count) / (8.650 - (self.hand_number + 1.0)/10.0)
-        if true_count >= 4.0:
+        true_count = this_hand_count / \
+            (self.decks - self.hand_number / self.hands_per_deck)
+        next_tc = (self.count) / \
+            (self.decks - (self.hand_number + 1.0) / self.hands_per_deck)
+        if true_count >= self.true_count:
             if (win_diff[0] == 'B') and (banker.value() == 7) and \
                (banker.get_card(2) is not None):
                 result = 'WIN'
@@ -253,8 +283,9 @@ class EZDragon(object):
     def end_shoe(self):
         '''!
         End of shoe. Show results.
+        @return String display system results
         '''
-        print("end_shoe() EZDragon %dW-%dL" % (self.play_w, self.play_l))
+        return "end_shoe() EZDragon %dW-%dL" % (self.play_w, self.play_l)
 
     # --------------------------------------------------------------------
 
@@ -549,9 +580,15 @@ class George1(BaccSys):
     '''
     George bacc system 1.
     '''
-    def __init__(self, system_name=""):
+    def __init__(self, system_name="", size=3, later_size=4):
+        '''
+        size is taken from the length of board 2 to get the bet size of
+        the first play: post 5 bet 2, post 6 bet 3. later_size is taken
+        for every play after that.
+        '''
         parent = super(George1,self).__init__("George1") #call parent
-        self.George1_size = 3 #post 5 bet 2, post 6 bet 3
+        self.George1_size = size #post 5 bet 2, post 6 bet 3
+        self.George1_later_size = later_size
         return parent
     def hand_pre(self):
         '''
@@ -582,7 +619,7 @@ class George1(BaccSys):
                 self.play("P",len_R2-self.George1_size)
             else:
                 self.play("B",len_R2-self.George1_size)
-            self.George1_size = 4
+            self.George1_size = self.George1_later_size
             return ("playG%d"%len_R2)+long_R2+"(%s)"%peekB2
         #elif b2_array[-1][1] == 6:
         #    return "playG6"+b2_array[-1][0]+"(B=%s)"%peekB2
@@ -590,6 +627,12 @@ class George1(BaccSys):
         return "playG7"
 
 class ValSys(BaccSys):
+    def __init__(self, system_name="", streak=4):
+        '''
+        streak is the length of a run on board 0 that is played to go on.
+        '''
+        super(ValSys,self).__init__(system_name)
+        self.streak = streak
     def hand_post(self, win_diff, p_hand, b_hand):
         parent_ret = super(ValSys,self).hand_post(win_diff,p_hand,b_hand)
         return " %s" % self.last_WLT
@@ -597,13 +640,13 @@ class ValSys(BaccSys):
         '''!
         ValSystem rules:
         1. if board 2 last entry is in row 1, play chop else play same
-        2. overrides rule 1. If 4+ in a row on board 0, play same
+        2. overrides rule 1. If 4+ (streak) in a row on board 0, play same
         '''
         parent_ret = super(ValSys,self).hand_pre()
         #
         if self.scoreboards is not None:
             b0_array = self.scoreboards[0].get_array()
-            if len(b0_array) > 1 and b0_array[-1][1] >= 4:
+            if len(b0_array) > 1 and b0_array[-1][1] >= self.streak:
                 rule = 2
                 self.play_on = b0_array[-1][0]
                 self.play_size = 1
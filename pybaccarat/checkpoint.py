@@ -0,0 +1,72 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.checkpoint
+This module saves and loads the state of a long simulation run.
+
+A checkpoint is a dictionary pickled to a file. save_checkpoint() writes
+it to a temporary file in the same folder, flushes it to the disk and then
+renames it over the old checkpoint with os.replace(). A crash at any point
+leaves either the old or the new checkpoint, never a partial file.
+
+Example usage:
+@code{.py}
+    from pybaccarat.checkpoint import save_checkpoint, load_checkpoint
+    state = load_checkpoint("run.ckpt")   # None the first time
+    ...
+    save_checkpoint("run.ckpt", {"shoes_done": 5000, "tally": tally})
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import os
+import pickle
+import tempfile
+
+FORMAT = 1  ##!< FORMAT version stored in every checkpoint
+
+
+def save_checkpoint(filespec, state):
+    '''!
+    Atomically replace the checkpoint file with <em>state</em>.
+    @param filespec checkpoint file
+    @param state dictionary of picklable values
+    '''
+    folder = os.path.dirname(os.path.abspath(filespec))
+    (handle, temp_filespec) = tempfile.mkstemp(
+        prefix=os.path.basename(filespec) + ".", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            pickle.dump({'format': FORMAT, 'state': state}, temp_file,
+                        pickle.HIGHEST_PROTOCOL)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_filespec, filespec)
+    except BaseException:
+        if os.path.exists(temp_filespec):
+            os.remove(temp_filespec)
+        raise
+
+
+def load_checkpoint(filespec):
+    '''!
+    Read a checkpoint written by save_checkpoint().
+    @param filespec checkpoint file
+    @return the state dictionary, or None if the file does not exist
+    @exception ValueError
+        If the file is not a checkpoint of this format.
+    '''
+    if not os.path.exists(filespec):
+        return None
+    with open(filespec, 'rb') as checkpoint_file:
+        try:
+            saved = pickle.load(checkpoint_file)
+        except Exception:
+            raise ValueError("filespec(%s) not a checkpoint" % filespec)
+    if not isinstance(saved, dict) or saved.get('format') != FORMAT:
+        raise ValueError("filespec(%s) not a version %d checkpoint" %
+                         (filespec, FORMAT))
+    return saved['state']
+
+# END
@@ -201,12 +201,14 @@ class ComputeBaccaratOdds(object):
         The 13 indexed values will represent the number of each of the 13
         cards in a suit. The shoe[0] is the number of aces, shoe[1] is the
         number of twos, et cetera. Up to shoe[12] is the number of Kings.
-        @param shoe integer array of length 13
+        A live shoe's Shoe.get_composition() can be passed directly.
+        @param shoe integer array (list or tuple) of length 13
         '''
 
         # validate shoe and compute it's size
-        if not isinstance(shoe, list) or (len(shoe) != 13):
+        if not isinstance(shoe, (list, tuple)) or (len(shoe) != 13):
             raise ValueError("int[13] required")
+        shoe = list(shoe)  # counts are changed while walking the shoe
         shoe_size = 0
         for i in shoe:
             if not isinstance(i, int) or (i < 0) or (i > 50):
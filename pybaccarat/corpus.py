@@ -0,0 +1,323 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.corpus
+This module reads and writes a binary corpus of many shoes in one file.
+
+The file layout is a 16 byte header followed by the shoes, one byte (the
+Card ordinal 0 to 51) per card:
+<TABLE BORDER="1">
+<TR><TD>0</TD><TD>4 bytes</TD><TD>magic "PBSC"</TD></TR>
+<TR><TD>4</TD><TD>uint8</TD><TD>format version (1)</TD></TR>
+<TR><TD>5</TD><TD>uint8</TD><TD>number of decks per shoe</TD></TR>
+<TR><TD>6</TD><TD>uint16</TD><TD>reserved (0)</TD></TR>
+<TR><TD>8</TD><TD>uint32</TD><TD>cards per shoe</TD></TR>
+<TR><TD>12</TD><TD>uint32</TD><TD>number of shoes</TD></TR>
+<TR><TD>16</TD><TD colspan="2">shoe 0, shoe 1, ...</TD></TR>
+</TABLE>
+All integers are little endian.
+
+A ShoeCorpus opens the file with mmap. Shoe <em>k</em> is found in O(1)
+without reading the rest of the file, and the shoes are handed out as
+read-only memoryview slices of the map (no copy). The corpus keeps a weak
+reference to each slice and close() releases the ones still alive, so a
+slice must not be used after the corpus is closed.
+
+Example usage:
+@code{.py}
+    from pybaccarat.corpus import CorpusWriter, ShoeCorpus
+    from pybaccarat.seeding import make_shoe
+    with CorpusWriter("shoes.pbsc", 8) as writer:
+        for k in range(1000):
+            writer.append(make_shoe(1, k))
+    with ShoeCorpus("shoes.pbsc") as corpus:
+        shoe = corpus.get_shoe(123)   # ArrayShoe ready to play
+        raw = corpus[456]             # memoryview, 416 bytes
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import mmap
+import struct
+import weakref
+
+from pybaccarat.playingcards import ArrayShoe, Card, _load_cards
+
+MAGIC = b"PBSC"  ##!< MAGIC first 4 bytes of a corpus file
+VERSION = 1  ##!< VERSION format version written by CorpusWriter
+_HEADER = struct.Struct("<4sBBHII")
+HEADER_SIZE = _HEADER.size  ##!< HEADER_SIZE bytes before the first shoe
+
+
+def _shoe_bytes(shoe):
+    '''!
+    Internal use only.
+    Return the ordinals of a shoe as bytes.
+    @param shoe a Shoe or ArrayShoe, a bytes-like object or numpy row of
+        ordinals, or a sequence of Cards or ordinals
+    @return bytes
+    '''
+    if hasattr(shoe, 'get_ordinals'):
+        return bytes(shoe.get_ordinals())
+    if hasattr(shoe, 'tobytes'):
+        return shoe.tobytes()
+    if isinstance(shoe, (bytes, bytearray, memoryview)):
+        return bytes(shoe)
+    ordinals = []
+    for i in shoe:
+        if isinstance(i, Card):
+            i = i.get_ordinal()
+        ordinals.append(i)
+    return bytes(bytearray(ordinals))
+
+
+class CorpusWriter(object):
+    '''!
+    Write shoes to a new corpus file.
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, filespec, number_decks=8):
+        '''!
+        Create (or truncate) a corpus file.
+        @param filespec file to write
+        @param number_decks <em>int</em> decks per shoe, 1 to 12. Every shoe
+            written must hold exactly 52 * number_decks cards.
+        @exception ValueError
+            If <em>number_decks</em> is not a legal value.
+        '''
+        if not isinstance(number_decks, int) or \
+           (number_decks < 1) or (12 < number_decks):
+            raise ValueError("number_decks(%s) not a legal value" %
+                             str(number_decks))
+        self.number_decks = number_decks
+        self.shoe_size = 52 * number_decks
+        self.shoe_count = 0
+        self.__file = open(filespec, 'wb')
+        self.__write_header()
+
+    # -------------------------------------------------------------------------
+    def __write_header(self):
+        '''!
+        Internal use only. (Re)write the header at the start of the file.
+        '''
+        self.__file.seek(0)
+        self.__file.write(_HEADER.pack(MAGIC, VERSION, self.number_decks, 0,
+                                       self.shoe_size, self.shoe_count))
+        self.__file.seek(0, 2)
+
+    # -------------------------------------------------------------------------
+    def append(self, shoe):
+        '''!
+        Add one shoe to the end of the corpus.
+        @param shoe a Shoe or ArrayShoe, a bytes-like object or numpy row of
+            ordinals, or a sequence of Cards or ordinals
+        @exception ValueError
+            If the shoe is the wrong size or holds an illegal ordinal.
+        '''
+        data = _shoe_bytes(shoe)
+        if len(data) != self.shoe_size:
+            raise ValueError("shoe size(%d) not %d cards" %
+                             (len(data), self.shoe_size))
+        if max(bytearray(data)) > 51:
+            raise ValueError("shoe has an ordinal not in legal range 0..51")
+        self.__file.write(data)
+        self.shoe_count += 1
+
+    # -------------------------------------------------------------------------
+    def append_matrix(self, shoes):
+        '''!
+        Add every row of a (N, 52 * number_decks) numpy.uint8 matrix, such
+        as shoebatch.generate_shoes() returns, with a single write.
+        @param shoes 2 dimensional numpy array
+        @exception ValueError
+            If the matrix has the wrong shape or an illegal ordinal.
+        '''
+        if len(shoes.shape) != 2 or shoes.shape[1] != self.shoe_size:
+            raise ValueError("matrix shape(%s) not (N, %d)" %
+                             (str(shoes.shape), self.shoe_size))
+        if shoes.size and shoes.max() > 51:
+            raise ValueError("shoe has an ordinal not in legal range 0..51")
+        self.__file.write(shoes.astype('uint8', copy=False).tobytes())
+        self.shoe_count += shoes.shape[0]
+
+    # -------------------------------------------------------------------------
+    def close(self):
+        '''!
+        Write the final shoe count and close the file.
+        '''
+        if not self.__file.closed:
+            self.__write_header()
+            self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # -------------------------------------------------------------------------
+# end class CorpusWriter
+
+
+class ShoeCorpus(object):
+    '''!
+    Read-only, memory-mapped access to a corpus file.
+    len(corpus) is the number of shoes, corpus[k] is shoe k as a
+    memoryview of ordinals, and iterating yields every shoe in order.
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, filespec):
+        '''!
+        Open a corpus file.
+        @param filespec file to read
+        @exception ValueError
+            If the file is not a corpus file or is truncated.
+        '''
+        self.__file = open(filespec, 'rb')
+        try:
+            header = self.__file.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE:
+                raise ValueError("filespec(%s) too short for a corpus" %
+                                 filespec)
+            (magic, version, self.number_decks, _, self.shoe_size,
+             self.shoe_count) = _HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("filespec(%s) not a version %d corpus" %
+                                 (filespec, VERSION))
+            self.__map = mmap.mmap(self.__file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+            if len(self.__map) < HEADER_SIZE + \
+               self.shoe_count * self.shoe_size:
+                self.__map.close()
+                raise ValueError("filespec(%s) is truncated" % filespec)
+        except Exception:
+            self.__file.close()
+            raise
+        self.__view = memoryview(self.__map)
+        self.__slices = {}  # id(weakref) to weakref of each slice out
+
+    # -------------------------------------------------------------------------
+    def __len__(self):
+        '''!
+        @return number of shoes in the corpus
+        '''
+        return self.shoe_count
+
+    # -------------------------------------------------------------------------
+    def __getitem__(self, index):
+        '''!
+        Return shoe <em>index</em> without copying it.
+        @param index <em>int</em> 0 to len-1, negative counts from the end
+        @return read-only memoryview of 52 * number_decks ordinals
+        @exception IndexError
+            If there is no such shoe.
+        '''
+        if index < 0:
+            index += self.shoe_count
+        if index < 0 or self.shoe_count <= index:
+            raise IndexError("shoe index out of range")
+        start = HEADER_SIZE + index * self.shoe_size
+        shoe = self.__view[start:start + self.shoe_size]
+        # a live slice keeps the map exported, close() must release it
+        slices = self.__slices
+        ref = weakref.ref(shoe, lambda r, s=slices: s.pop(id(r), None))
+        slices[id(ref)] = ref
+        return shoe
+
+    # -------------------------------------------------------------------------
+    def __iter__(self):
+        '''!
+        Yield every shoe in order as a memoryview.
+        '''
+        for index in range(self.shoe_count):
+            yield self[index]
+
+    # -------------------------------------------------------------------------
+    def get_shoe(self, index):
+        '''!
+        Return shoe <em>index</em> as an ArrayShoe ready for a Game.
+        @param index <em>int</em>
+        @return ArrayShoe holding a copy of the shoe
+        '''
+        return ArrayShoe(bytearray(self[index]))
+
+    # -------------------------------------------------------------------------
+    def as_matrix(self):
+        '''!
+        Return the whole corpus as a read-only (N, 52 * number_decks)
+        numpy.uint8 matrix backed by the map (no copy). Requires NumPy.
+        Delete the matrix before calling close().
+        '''
+        import numpy
+        return numpy.frombuffer(self.__map, dtype=numpy.uint8,
+                                count=self.shoe_count * self.shoe_size,
+                                offset=HEADER_SIZE).reshape(
+                                    self.shoe_count, self.shoe_size)
+
+    # -------------------------------------------------------------------------
+    def close(self):
+        '''!
+        Release the views handed out, unmap and close the file. Views
+        handed out must not be used after this.
+        @exception BufferError
+            If a matrix from as_matrix() is still alive. The file is closed
+            anyway.
+        '''
+        if not self.__file.closed:
+            try:
+                for ref in list(self.__slices.values()):
+                    shoe = ref()
+                    if shoe is not None:
+                        shoe.release()
+                self.__slices.clear()
+                self.__view.release()
+                self.__map.close()
+            finally:
+                self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # -------------------------------------------------------------------------
+# end class ShoeCorpus
+
+
+def text_to_corpus(text_filespecs, corpus_filespec, number_decks=8):
+    '''!
+    Convert shoes saved in the text format (Shoe.save_shoe(), one shoe per
+    file) into one corpus file.
+    @param text_filespecs list of text files to read
+    @param corpus_filespec corpus file to write
+    @param number_decks <em>int</em> decks per shoe
+    @return number of shoes written
+    '''
+    with CorpusWriter(corpus_filespec, number_decks) as writer:
+        for filespec in text_filespecs:
+            writer.append(_load_cards(filespec))
+        return writer.shoe_count
+
+
+def corpus_to_text(corpus_filespec, text_pattern):
+    '''!
+    Convert every shoe in a corpus file into a text file in the
+    Shoe.save_shoe() format.
+    @param corpus_filespec corpus file to read
+    @param text_pattern file name pattern with one %d for the shoe index,
+        such as "shoe%05d.txt"
+    @return list of text files written
+    '''
+    written = []
+    with ShoeCorpus(corpus_filespec) as corpus:
+        for index in range(len(corpus)):
+            filespec = text_pattern % index
+            corpus.get_shoe(index).save_shoe(filespec)
+            written.append(filespec)
+    return written
+
+# END
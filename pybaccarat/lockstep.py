@@ -0,0 +1,342 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.lockstep
+This module plays many shoes of Baccarat at once with NumPy.
+
+simulate_shoes() takes a (N, 52 * decks) matrix of Card ordinals, one
+shoe per row, such as shoebatch.generate_shoes() or corpus.ShoeCorpus
+as_matrix() returns. Every row is played with the same rules as
+Game.simulate_shoe(): the first card is burned along with as many cards
+as its rank (10 for a ten or face card), and the hand started after the
+cut card is seen is the last. Hand <em>k</em> of all N shoes is resolved
+together with array operations. Each row keeps its own cursor, since a hand
+uses 4, 5 or 6 cards.
+
+The result holds one (N, max_hands) int8 array for each of: the winner,
+the final player and banker values, and the third card draws. Entries
+after the last hand of a shoe are NO_HAND in <em>win</em>.
+
+This module requires NumPy, which is an optional dependency of pybaccarat.
+
+Example usage:
+@code{.py}
+    from pybaccarat.shoebatch import generate_shoes
+    from pybaccarat.lockstep import simulate_shoes
+    result = simulate_shoes(generate_shoes(100000, 8, seed=1))
+    print(result.totals())
+@endcode
+
+resolve_hands() scores independent hands, such as every 6 card prefix of
+an enumeration, given one row of card points (or ranks) per hand.
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import collections
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from pybaccarat.resolver import BONUS_STRINGS, STOOD, WIN_LETTERS, \
+    _BANKER_MAX
+
+WIN_BANKER = 0  ##!< WIN_BANKER win code, banker wins
+WIN_PLAYER = 1  ##!< WIN_PLAYER win code, player wins
+WIN_TIE = 2  ##!< WIN_TIE win code, tie
+NO_HAND = -1  ##!< NO_HAND win code after the last hand of a shoe
+
+PLAYER_DREW = 1  ##!< PLAYER_DREW draws bit, player drew a third card
+BANKER_DREW = 2  ##!< BANKER_DREW draws bit, banker drew a third card
+
+BONUS_NONE = 0  ##!< BONUS_NONE bonus code, no bonus
+BONUS_P8 = 1  ##!< BONUS_P8 bonus code, player wins with a 3 card 8
+BONUS_D7 = 2  ##!< BONUS_D7 bonus code, banker wins with a 3 card 7
+
+
+def _require_numpy():
+    '''!
+    Internal use only.
+    Raise an ImportError if NumPy is not installed.
+    '''
+    if numpy is None:
+        raise ImportError("pybaccarat.lockstep requires numpy")
+
+
+def _tables():
+    '''!
+    Internal use only.
+    @return (point by ordinal, rank by ordinal, banker max by player third
+        point or STOOD) as numpy arrays
+    '''
+    ranks = numpy.arange(52, dtype=numpy.int8) % 13 + 1
+    points = numpy.where(ranks > 9, 0, ranks).astype(numpy.int8)
+    banker_max = numpy.array(_BANKER_MAX, dtype=numpy.int8)
+    return points, ranks, banker_max
+
+
+def _resolve(points, banker_max):
+    '''!
+    Internal use only.
+    Resolve hands from the points of the next 6 cards of each.
+    @param points (6, M) int8 array, one column per hand, rows in deal
+        order: player, banker, player, banker, then the third cards
+    @param banker_max table from _tables()
+    @return (win, player value, banker value, draws) int8 arrays of M
+    '''
+    player = (points[0] + points[2]) % 10
+    banker = (points[1] + points[3]) % 10
+    natural = (player >= 8) | (banker >= 8)
+    player_drew = ~natural & (player <= 5)
+    third = numpy.where(player_drew, points[4], STOOD)
+    banker_drew = ~natural & (banker <= banker_max[third])
+    player = numpy.where(player_drew, (player + points[4]) % 10, player)
+    banker = numpy.where(banker_drew,
+                         (banker + numpy.where(player_drew, points[5],
+                                               points[4])) % 10,
+                         banker)
+    win = numpy.where(player > banker, WIN_PLAYER,
+                      numpy.where(player < banker, WIN_BANKER, WIN_TIE))
+    draws = player_drew * PLAYER_DREW + banker_drew * BANKER_DREW
+    return (win.astype(numpy.int8), player.astype(numpy.int8),
+            banker.astype(numpy.int8), draws.astype(numpy.int8))
+
+
+##!< HandBatch the hands scored by resolve_hands(), one entry per row:
+# win codes, final player and banker totals, and bool arrays for natural,
+# player third card, banker third card, and int8 bonus codes.
+HandBatch = collections.namedtuple(
+    'HandBatch', 'win player_total banker_total natural player_drew '
+                 'banker_drew bonus')
+
+
+def resolve_hands(cards, ranks=False):
+    '''!
+    Score many independent hands at once, with the rules of Hand.need_hit()
+    and Game.play_hand().
+    @param cards (M, 6) array, one hand per row, in deal order: player,
+        banker, player, banker, then the third cards (the player third card
+        first when both draw). Columns not needed by a hand are ignored;
+        4 or 5 columns are accepted if no hand needs more.
+    @param ranks <em>boolean</em> False if <em>cards</em> holds points 0
+        to 9, True if it holds Card ranks 1 to 13
+    @return HandBatch
+    @exception ValueError
+        If <em>cards</em> has the wrong shape or values, or a hand needs a
+        card the row does not have.
+    '''
+    _require_numpy()
+    cards = numpy.asarray(cards)
+    if len(cards.shape) != 2 or not (4 <= cards.shape[1] <= 6):
+        raise ValueError("cards shape(%s) not (M, 6)" % str(cards.shape))
+    (low, high) = (1, 13) if ranks else (0, 9)
+    if cards.size and (cards.min() < low or high < cards.max()):
+        raise ValueError("cards not in legal range %d..%d" % (low, high))
+    points = cards.astype(numpy.int8)
+    if ranks:
+        points = numpy.where(points > 9, 0, points).astype(numpy.int8)
+    columns = cards.shape[1]
+    if columns < 6:
+        points = numpy.hstack([points, numpy.zeros(
+            (cards.shape[0], 6 - columns), dtype=numpy.int8)])
+    (win, player, banker, draws) = _resolve(points.T, _tables()[2])
+    needed = 4 + (draws & PLAYER_DREW) + (draws >> 1)
+    if (needed > columns).any():
+        raise ValueError("a hand needs more than %d cards" % columns)
+    player_drew = (draws & PLAYER_DREW) != 0
+    banker_drew = (draws & BANKER_DREW) != 0
+    natural = (draws == 0) & ((player >= 8) | (banker >= 8))
+    bonus = ((win == WIN_PLAYER) & (player == 8) & player_drew) * BONUS_P8 + \
+        ((win == WIN_BANKER) & (banker == 7) & banker_drew) * BONUS_D7
+    return HandBatch(win, player, banker, natural, player_drew, banker_drew,
+                     bonus.astype(numpy.int8))
+
+
+class LockstepResult(object):
+    '''!
+    The hands played by simulate_shoes(). Arrays are indexed
+    [shoe, hand number - 1].
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, win, player_value, banker_value, draws, hand_count):
+        '''!
+        @param win int8 win codes, NO_HAND after the last hand
+        @param player_value int8 final player hand values
+        @param banker_value int8 final banker hand values
+        @param draws int8 PLAYER_DREW and BANKER_DREW bits
+        @param hand_count number of hands played in each shoe
+        '''
+        self.win = win
+        self.player_value = player_value
+        self.banker_value = banker_value
+        self.draws = draws
+        self.hand_count = hand_count
+
+    # -------------------------------------------------------------------------
+    def played(self):
+        '''!
+        @return bool array, True for every hand that was played
+        '''
+        return self.win != NO_HAND
+
+    # -------------------------------------------------------------------------
+    def natural(self):
+        '''!
+        @return bool array, True for hands won or tied with a natural
+        '''
+        return self.played() & (self.draws == 0) & \
+            ((self.player_value >= 8) | (self.banker_value >= 8))
+
+    # -------------------------------------------------------------------------
+    def bonus(self):
+        '''!
+        @return int8 array of BONUS_NONE, BONUS_P8 or BONUS_D7
+        '''
+        p8 = (self.win == WIN_PLAYER) & (self.player_value == 8) & \
+            ((self.draws & PLAYER_DREW) != 0)
+        d7 = (self.win == WIN_BANKER) & (self.banker_value == 7) & \
+            ((self.draws & BANKER_DREW) != 0)
+        return (p8 * BONUS_P8 + d7 * BONUS_D7).astype(numpy.int8)
+
+    # -------------------------------------------------------------------------
+    def totals(self):
+        '''!
+        Count the outcomes of every shoe together.
+        @return dict with the number of hands, B, P, T, naturals, D7 and P8
+        '''
+        bonus = self.bonus()
+        return {'hands': int(self.hand_count.sum()),
+                'B': int((self.win == WIN_BANKER).sum()),
+                'P': int((self.win == WIN_PLAYER).sum()),
+                'T': int((self.win == WIN_TIE).sum()),
+                'naturals': int(self.natural().sum()),
+                'D7': int((bonus == BONUS_D7).sum()),
+                'P8': int((bonus == BONUS_P8).sum())}
+
+    # -------------------------------------------------------------------------
+    def hands(self, shoe):
+        '''!
+        Return the hands of one shoe in the form Game.play_hand() returns.
+        @param shoe <em>int</em> row number
+        @return list of (win, diff, bonus) strings
+        '''
+        hands = []
+        for k in range(int(self.hand_count[shoe])):
+            win = int(self.win[shoe, k])
+            player = int(self.player_value[shoe, k])
+            banker = int(self.banker_value[shoe, k])
+            draws = int(self.draws[shoe, k])
+            if draws == 0 and (player >= 8 or banker >= 8):
+                diff = "n"
+            else:
+                diff = str(abs(player - banker))
+            bonus = BONUS_NONE
+            if win == WIN_PLAYER and player == 8 and draws & PLAYER_DREW:
+                bonus = BONUS_P8
+            elif win == WIN_BANKER and banker == 7 and draws & BANKER_DREW:
+                bonus = BONUS_D7
+            hands.append((WIN_LETTERS[win], diff, BONUS_STRINGS[bonus]))
+        return hands
+
+    # -------------------------------------------------------------------------
+# end class LockstepResult
+
+
+def simulate_shoes(shoes, cut_card=-14):
+    '''!
+    Play every shoe (row) of a matrix of Card ordinals.
+    @param shoes (N, S) array of ordinals 0 to 51
+    @param cut_card <em>int</em> cut card position as for
+        Shoe.set_cut_card(), negative counts from the end of the shoe
+    @return LockstepResult
+    @exception ValueError
+        If <em>cut_card</em> is not a legal value, or a shoe runs out of
+        cards before its last hand is complete.
+    '''
+    _require_numpy()
+    shoes = numpy.asarray(shoes)
+    if len(shoes.shape) != 2:
+        raise ValueError("shoes shape(%s) not (N, S)" % str(shoes.shape))
+    (count, size) = shoes.shape
+    if not isinstance(cut_card, int):
+        raise ValueError("cut_card(%s) not an integer" % str(cut_card))
+    cut = cut_card
+    if cut < 0:
+        cut += size
+    if cut < 0 or size < cut:
+        raise ValueError("cut_card(%d) not a legal value" % cut_card)
+    point_of, rank_of, banker_max = _tables()
+    max_hands = (size - 1) // 4 + 1
+    win = numpy.full((count, max_hands), NO_HAND, dtype=numpy.int8)
+    player_value = numpy.zeros((count, max_hands), dtype=numpy.int8)
+    banker_value = numpy.zeros((count, max_hands), dtype=numpy.int8)
+    draws = numpy.zeros((count, max_hands), dtype=numpy.int8)
+    hand_count = numpy.zeros(count, dtype=numpy.int32)
+    if count == 0 or size == 0:
+        return LockstepResult(win, player_value, banker_value, draws,
+                              hand_count)
+    points = point_of[shoes]
+    # burn the first card and as many more as its rank, ten at most
+    cursor = 1 + numpy.minimum(rank_of[shoes[:, 0]], 10).astype(numpy.int64)
+    rows = numpy.arange(count)
+    offsets = numpy.arange(6)[:, numpy.newaxis]
+    k = 0
+    while len(rows):
+        last_hand = cut <= cursor
+        index = cursor + offsets
+        numpy.minimum(index, size - 1, out=index)
+        (hand_win, player, banker, hand_draws) = _resolve(
+            points[rows, index], banker_max)
+        cursor = cursor + 4 + (hand_draws & PLAYER_DREW) + \
+            (hand_draws >> 1)
+        if (cursor > size).any():
+            raise ValueError("shoe ran out of cards")
+        win[rows, k] = hand_win
+        player_value[rows, k] = player
+        banker_value[rows, k] = banker
+        draws[rows, k] = hand_draws
+        k += 1
+        hand_count[rows] = k
+        going = ~last_hand
+        rows = rows[going]
+        cursor = cursor[going]
+    return LockstepResult(win, player_value, banker_value, draws, hand_count)
+
+
+def simulate_totals(shoe_count, number_decks=8, seed=None, chunk_size=100000,
+                    cut_card=-14):
+    '''!
+    Generate and play <em>shoe_count</em> shoes, <em>chunk_size</em> at a
+    time so memory use stays bounded, and add up the outcomes.
+    @param shoe_count <em>int</em> number of shoes to play
+    @param number_decks <em>int</em> decks per shoe
+    @param seed seed or numpy.random.Generator, see
+        shoebatch.make_generator()
+    @param chunk_size <em>int</em> shoes generated and played at once
+    @param cut_card <em>int</em> see simulate_shoes()
+    @return dict as LockstepResult.totals()
+    @exception ValueError
+        If <em>chunk_size</em> is not a legal value.
+    '''
+    from pybaccarat.shoebatch import generate_shoes, make_generator
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk_size(%s) not a legal value" % str(chunk_size))
+    rng = make_generator(seed)
+    totals = None
+    done = 0
+    while done < shoe_count or totals is None:
+        size = min(chunk_size, shoe_count - done)
+        chunk = simulate_shoes(generate_shoes(size, number_decks, rng),
+                               cut_card).totals()
+        if totals is None:
+            totals = chunk
+        else:
+            for key in totals:
+                totals[key] += chunk[key]
+        done += size
+    return totals
+
+# END
@@ -0,0 +1,282 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.montecarlo
+This module plays many shoes of Baccarat on a pool of processes.
+
+The shoes of a run are numbered 0 to N-1 and shoe <em>k</em> is always
+shuffled by seeding.make_shoe(root_seed, k). The run is cut into chunks of
+consecutive shoes. Each worker process plays its chunks with
+Game.simulate_shoe() and sends back a Tally for the chunk. A Tally holds
+only counts, never a record per hand, and two tallies are combined with
+merge(). The totals of a run therefore depend on the root seed and the
+number of shoes only, not on the number of processes.
+
+A long run can save a checkpoint (see pybaccarat.checkpoint) every few
+chunks. Started again with the same checkpoint file, it skips the chunks
+already merged and ends with the same totals as a run that never stopped.
+
+Example usage:
+@code{.py}
+    from pybaccarat.montecarlo import run
+    tally = run(100000, root_seed=2018, processes=8,
+                systems=["George1", "ValSys"])
+    print(tally.report())
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import multiprocessing
+
+from pybaccarat.baccarat import Game
+from pybaccarat.checkpoint import load_checkpoint, save_checkpoint
+from pybaccarat import baccaratsystems
+from pybaccarat.seeding import SeedStream, make_shoe
+
+# systems that read the keyboard can not be played headless
+_KEYBOARD_SYSTEMS = (baccaratsystems.Interactive, baccaratsystems.JustBoards)
+
+
+class Tally(object):
+    '''!
+    Mergeable counts of the shoes played by a run.
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self):
+        '''!
+        Create an empty tally.
+        '''
+        ##!< root_seed seed of the run, set by run()
+        self.root_seed = None
+        self.shoes = 0
+        self.hands = 0
+        ##!< wins count of hands won by each side, "B", "P" and "T"
+        self.wins = {'B': 0, 'P': 0, 'T': 0}
+        self.naturals = 0
+        self.count_d7 = 0
+        self.count_p8 = 0
+        ##!< diffs count of hands by win and diff, such as "B2" or "Pn"
+        self.diffs = {}
+        ##!< systems [won, lost, tied, money] by system name
+        self.systems = {}
+
+    # -------------------------------------------------------------------------
+    def add_shoe(self, result, game):
+        '''!
+        Count one shoe.
+        @param result ShoeResult from Game.simulate_shoe()
+        @param game the Game that played it, for count_d7 and count_p8
+        '''
+        self.shoes += 1
+        self.hands += len(result.hands)
+        self.count_d7 += game.count_d7
+        self.count_p8 += game.count_p8
+        diffs = self.diffs
+        for hand in result.hands:
+            self.wins[hand.win] += 1
+            if hand.diff == "n":
+                self.naturals += 1
+            key = hand.win + hand.diff
+            diffs[key] = diffs.get(key, 0) + 1
+
+    # -------------------------------------------------------------------------
+    def add_system(self, name, system):
+        '''!
+        Count the results of a system for one shoe.
+        @param name String key for the system
+        @param system baccaratsystems.BaccSys after the shoe
+        '''
+        totals = self.systems.setdefault(name, [0, 0, 0, 0.0])
+        totals[0] += system.won
+        totals[1] += system.lost
+        totals[2] += system.tied
+        totals[3] += system.money
+
+    # -------------------------------------------------------------------------
+    def merge(self, other):
+        '''!
+        Add the counts of another tally to this one.
+        @param other Tally
+        @return this tally
+        '''
+        self.shoes += other.shoes
+        self.hands += other.hands
+        for key in self.wins:
+            self.wins[key] += other.wins[key]
+        self.naturals += other.naturals
+        self.count_d7 += other.count_d7
+        self.count_p8 += other.count_p8
+        for key, count in other.diffs.items():
+            self.diffs[key] = self.diffs.get(key, 0) + count
+        for name, other_totals in other.systems.items():
+            totals = self.systems.setdefault(name, [0, 0, 0, 0.0])
+            for i in range(4):
+                totals[i] += other_totals[i]
+        return self
+
+    # -------------------------------------------------------------------------
+    def report(self):
+        '''!
+        @return multi-line String summary of the tally
+        '''
+        hands = max(self.hands, 1)
+        lines = ["shoes(%d) hands(%d) naturals(%d) D7(%d) P8(%d)" %
+                 (self.shoes, self.hands, self.naturals, self.count_d7,
+                  self.count_p8)]
+        lines.append("B=%d %.4f P=%d %.4f T=%d %.4f" %
+                     (self.wins['B'], self.wins['B'] / float(hands),
+                      self.wins['P'], self.wins['P'] / float(hands),
+                      self.wins['T'], self.wins['T'] / float(hands)))
+        for win in "BPT":
+            keys = sorted([k for k in self.diffs if k[0] == win])
+            lines.append(" ".join(["%s=%d" % (k, self.diffs[k])
+                                   for k in keys]))
+        for name in sorted(self.systems):
+            (won, lost, tied, money) = self.systems[name]
+            lines.append("Sys(%s) %d-%d-%d=%+.2f" %
+                         (name, won, lost, tied, money))
+        return "\n".join(lines)
+
+    # -------------------------------------------------------------------------
+# end class Tally
+
+
+def _make_system(name):
+    '''!
+    Internal use only.
+    Create a baccarat system from its class name in baccaratsystems.
+    @exception ValueError
+        If there is no such system, or it reads the keyboard.
+    '''
+    system_class = getattr(baccaratsystems, name, None)
+    if not isinstance(system_class, type) or \
+       not issubclass(system_class, baccaratsystems.BaccSys) or \
+       issubclass(system_class, _KEYBOARD_SYSTEMS):
+        raise ValueError("system(%s) not a legal value" % str(name))
+    return system_class()
+
+
+def play_chunk(root_seed, first, count, number_decks=8, cut_card=-14,
+               systems=()):
+    '''!
+    Play shoes <em>first</em> to <em>first + count - 1</em> of a run.
+    The systems play on the same deal as the tally, sharing its
+    scoreboards. Each shoe starts them as new system objects so no state
+    carries from one shoe to the next (the totals then do not depend on
+    how the shoes are chunked).
+    @param root_seed <em>int</em> seed of the run
+    @param first <em>int</em> number of the first shoe
+    @param count <em>int</em> number of shoes
+    @param number_decks <em>int</em> decks per shoe
+    @param cut_card <em>int</em> cut card position, see Shoe.set_cut_card()
+    @param systems list of baccaratsystems class names
+    @return Tally
+    '''
+    tally = Tally()
+    game = None
+    for index in range(first, first + count):
+        shoe = make_shoe(root_seed, index, number_decks)
+        if game is None:
+            game = Game(shoe=shoe)
+        game.set_shoe(shoe)
+        game.systems = [_make_system(name) for name in systems]
+        tally.add_shoe(game.simulate_shoe(cut_card), game)
+        for (name, system) in zip(systems, game.systems):
+            tally.add_system(name, system)
+    return tally
+
+
+def _play_chunk(args):
+    '''!
+    Internal use only. play_chunk() for Pool.imap().
+    '''
+    return play_chunk(*args)
+
+
+def run(shoe_count, root_seed=None, processes=None, chunk_size=100,
+        number_decks=8, cut_card=-14, systems=(), checkpoint=None,
+        checkpoint_every=10):
+    '''!
+    Play <em>shoe_count</em> shoes and return the merged Tally.
+    @param shoe_count <em>int</em> number of shoes
+    @param root_seed <em>int</em> seed of the run, None for a random one.
+        The seed used is saved in the <em>root_seed</em> attribute of the
+        returned Tally.
+    @param processes <em>int</em> worker processes, None for one per CPU,
+        1 to play in this process
+    @param chunk_size <em>int</em> shoes per chunk sent to a worker. Bigger
+        chunks cost less to hand out, smaller chunks balance better.
+    @param number_decks <em>int</em> decks per shoe
+    @param cut_card <em>int</em> cut card position, see Shoe.set_cut_card()
+    @param systems list of baccaratsystems class names to play, such as
+        ["George1", "ValSys"]
+    @param checkpoint checkpoint file, None for no checkpoints. If the
+        file exists the run resumes after the last chunk it recorded,
+        with the root seed it recorded, and gives the same Tally an
+        uninterrupted run would.
+    @param checkpoint_every <em>int</em> save the checkpoint after this
+        many chunks are merged, and at the end of the run
+    @return Tally
+    @exception ValueError
+        If <em>shoe_count</em>, <em>chunk_size</em> or a system is not a
+        legal value, or the checkpoint is for a run with other settings.
+    '''
+    if not isinstance(shoe_count, int) or shoe_count < 0:
+        raise ValueError("shoe_count(%s) not a legal value" % str(shoe_count))
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk_size(%s) not a legal value" % str(chunk_size))
+    systems = list(systems)
+    for name in systems:
+        _make_system(name)
+    if not isinstance(checkpoint_every, int) or checkpoint_every < 1:
+        raise ValueError("checkpoint_every(%s) not a legal value" %
+                         str(checkpoint_every))
+    state = None
+    if checkpoint is not None:
+        state = load_checkpoint(checkpoint)
+        if state is not None and root_seed is None:
+            root_seed = state['settings']['root_seed']
+    if root_seed is None:
+        root_seed = SeedStream().root_seed
+    settings = {'shoe_count': shoe_count, 'root_seed': root_seed,
+                'chunk_size': chunk_size, 'number_decks': number_decks,
+                'cut_card': cut_card, 'systems': systems}
+    tally = Tally()
+    chunks_done = 0
+    if state is not None:
+        if state['settings'] != settings:
+            raise ValueError("checkpoint(%s) is for a different run" %
+                             checkpoint)
+        tally = state['tally']
+        chunks_done = state['chunks_done']
+    chunks = [(root_seed, first, min(chunk_size, shoe_count - first),
+               number_decks, cut_card, systems)
+              for first in range(0, shoe_count, chunk_size)]
+    pending = chunks[chunks_done:]
+    pool = None
+    if processes != 1 and len(pending) > 1:
+        pool = multiprocessing.Pool(processes)
+        # in order, so floating point money adds up the same every run
+        results = pool.imap(_play_chunk, pending)
+    else:
+        results = (_play_chunk(chunk) for chunk in pending)
+    try:
+        for chunk_tally in results:
+            tally.merge(chunk_tally)
+            chunks_done += 1
+            if checkpoint is not None and \
+               (chunks_done % checkpoint_every == 0 or
+                    chunks_done == len(chunks)):
+                save_checkpoint(checkpoint, {'settings': settings,
+                                             'chunks_done': chunks_done,
+                                             'tally': tally})
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    tally.root_seed = root_seed
+    return tally
+
+# END
@@ -7,16 +7,25 @@ The Card class is the representation of a single playing card.
 The Shoe class is the representation of a stack of playing cards.
 This stack could be a single deck (such as poker), or a multi-deck
 deck (such as Baccarat).
+The ArrayShoe class is a compact Shoe that stores card ordinals in a
+bytearray.
+The VirtualShoe class is a Shoe that only tracks the count of each rank.
 
 To use:
 from playingcards import Card
 from playingcards import Stack
 
+The 52 distinct Cards are also available as shared, preconstructed
+instances. Use get_card() (or the DECK tuple) instead of creating new Card
+objects when many cards are needed, such as when building shoes.
+
 @author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
 '''
 
 # http://www.stack.nl/~dimitri/doxygen/index.html
+import array
 import random
+import sys
 
 
 class Card(object):
@@ -38,6 +47,10 @@ class Card(object):
     @see Shoe
     '''
 
+    # A fixed set of attributes, no per-instance __dict__. This keeps each
+    # Card small, and attribute access is a direct slot lookup.
+    __slots__ = ('__rank', '__suit', '__ordinal', '__point', '__to_string')
+
     # --------------------------------------------------------------------
     def __init__(self, new_ordinal, new_suit=None):
         '''!
@@ -172,6 +185,7 @@ class Card(object):
         self.__rank = new_rank
         self.__suit = new_suit
         self.__ordinal = new_ordinal
+        self.__point = new_rank if new_rank < 10 else 0
         self.__to_string = 'A23456789TJQK'[self.__rank - 1] + self.__suit
         #
         # Extending original design...
@@ -228,6 +242,18 @@ class Card(object):
         '''
         return self.__ordinal
 
+    # -------------------------------------------------------------------------
+    def get_point(self):
+        '''!
+        Return the baccarat point value of this card. Aces count 1, the
+        numbered cards 2 to 9 count their rank, and tens and face cards
+        count 0. The value is computed once when the Card is created.
+
+        @param self this object pointer reference
+        @return integer 0..9
+        '''
+        return self.__point
+
     # -------------------------------------------------------------------------
     def __str__(self):
         '''!
@@ -275,9 +301,11 @@ class Card(object):
             otherwise False. If other is not of Card class type then
             it will be passed to the object class, which will return False.
         '''
+        if self is other:
+            return True  # interned cards from get_card() are the same object
         if isinstance(other, self.__class__):
-            return (self.get_rank() == other.get_rank()) and \
-                   (self.get_suit() == other.get_suit())
+            # the ordinal alone identifies the rank and suit
+            return self.__ordinal == other.__ordinal
         return NotImplemented  # this sends the test to the parent object class
 
     # -------------------------------------------------------------------------
@@ -350,12 +378,12 @@ class Card(object):
         """!
         Override the default hash behavior
         (that returns the id of the object).
-        The new hash will be the two saved values that define which card
-        this class represents.
+        The new hash will be the ordinal, the single saved value that
+        defines which card this class represents.
         @param self this object pointer reference
         @return hash code
         """
-        return hash(tuple([self.get_rank(), self.get_suit()]))
+        return self.__ordinal
     # -------------------------------------------------------------------------
     def __bool__(self):
         """!
@@ -370,6 +398,52 @@ class Card(object):
 # end class Card()
 
 
+##!< DECK is the registry of the 52 canonical Cards, indexed by ordinal.
+DECK = tuple([Card(_) for _ in range(52)])
+# lookup tables for get_card(), keyed by (rank, suit) and by "5s" name
+_CARD_BY_RANK_SUIT = dict(((c.get_rank(), c.get_suit()), c) for c in DECK)
+_CARD_BY_NAME = dict((str(c), c) for c in DECK)
+
+
+def get_card(new_ordinal, new_suit=None):
+    '''!
+    Return the canonical (interned) Card. This accepts the same 3 syntaxes
+    as the Card constructor, but instead of building a new Card it returns
+    one of the 52 shared instances held in DECK. Two calls asking for the
+    same card always return the same object.
+
+    Example usage:
+    @code{.py}
+        from pybaccarat.playingcards import get_card
+        card5s = get_card(43)       # by ordinal
+        card5s = get_card(5, 's')   # by rank and suit
+        card5s = get_card('5s')     # by string name
+    @endcode
+
+    @param new_ordinal integer 0 to 51, or rank 1 to 13 when new_suit is
+        given, or a 2 character string name such as '5s'.
+    @param new_suit single character suit 'c', 'd', 'h' or 's'. Only used
+        with the rank syntax.
+    @return the shared Card instance
+    @exception ValueError
+        If the input parameters do not name a legal Card. The message is
+        the same one the Card constructor would give.
+    '''
+    card = None
+    if new_suit is None:
+        if isinstance(new_ordinal, int) and 0 <= new_ordinal <= 51:
+            card = DECK[new_ordinal]
+        elif isinstance(new_ordinal, str):
+            card = _CARD_BY_NAME.get(new_ordinal)
+    elif isinstance(new_ordinal, int):
+        card = _CARD_BY_RANK_SUIT.get((new_ordinal, new_suit))
+    if card is None:
+        # uncommon spelling (case, white space) or an error,
+        # let the Card constructor parse and validate it
+        card = DECK[Card(new_ordinal, new_suit).get_ordinal()]
+    return card
+
+
 class Shoe(object):
     '''!
     The Shoe class represents a playing card shoe. That is, a device designed
@@ -396,7 +470,7 @@ class Shoe(object):
     '''
 
     # -------------------------------------------------------------------------
-    def __init__(self, number_decks=None):
+    def __init__(self, number_decks=None, rng=None):
         '''!
         Create a shoe of a specified number of decks of playing cards.
 
@@ -439,9 +513,14 @@ class Shoe(object):
             The default value is 1. Legal range is 1 to 12.
             The alternate constructor will allow you to pass in an arraay of
             Cards instead of just a single integer for the number of decks.
+        @param rng the random number generator used by shuffle(). None
+            uses the global Python random module. An integer is used as the
+            seed of a new random.Random. Any other object with a
+            shuffle(list) method, such as random.Random or
+            numpy.random.Generator, is used as is.
         @exception ValueError
             If the input parameter <em>number_decks</em> is not a legal
-            integer.
+            integer, or <em>rng</em> is not a legal generator.
         @todo need a finite limit to number_decks
         
         Shoe()
@@ -469,9 +548,9 @@ class Shoe(object):
                         raise ValueError("non-card type params(%s)" % type(i))
                     self.__cards.append(i)
             elif isinstance(number_decks, str):
-                ten = Card(10, 's')
-                nine = Card(9, 's')
-                ace = Card(1, 's')
+                ten = get_card(10, 's')
+                nine = get_card(9, 's')
+                ace = get_card(1, 's')
                 for i in range(2):
                     self.__cards.append(ace)
                 for i in number_decks:
@@ -514,12 +593,18 @@ class Shoe(object):
                 raise ValueError("number_decks(%s) not a legal value" %
                                  str(number_decks))
             self.__enable_shuffle = (0 < number_decks)
-            for _ in range(number_decks):
-                for _ in range(52):
-                    self.__cards.append(Card(_))
+            # copy the shared Cards, no need to construct new ones
+            self.__cards = list(DECK) * number_decks
 
+        self.__rng = _make_rng(rng)
         self.__next_card = 0
         self.__cut_card_position = 0
+        # __remaining[rank - 1] is the number of undealt cards of each rank
+        self.__remaining = 13 * [0]
+        # Lazy shuffle: positions before __shuffled are final, deal() does
+        # a Fisher-Yates step for later positions. sys.maxsize = no lazy.
+        self.__shuffled = sys.maxsize
+        self.__randbelow = None
         self.reset()
 
     # -------------------------------------------------------------------------
@@ -527,7 +612,8 @@ class Shoe(object):
         '''!
         Reset the shoe to start a new shoe.
         This method will not shuffle the cards nor assign the cut card
-        position.
+        position. A pending lazy shuffle stays pending, the positions
+        already dealt keep their cards.
 
         @code{.py}
             import playingcards
@@ -539,29 +625,106 @@ class Shoe(object):
         '''
         self.__next_card = 0
         self.set_cut_card(0)
+        self.__count_remaining()
+
+    # -------------------------------------------------------------------------
+    def __count_remaining(self):
+        '''!
+        Internal use only.
+        Recount the undealt cards of each rank.
+        '''
+        remaining = 13 * [0]
+        for i in range(self.__next_card, len(self.__cards)):
+            remaining[self.__cards[i].get_rank() - 1] += 1
+        self.__remaining = remaining
+
+    # -------------------------------------------------------------------------
+    def set_rng(self, rng):
+        '''!
+        Replace the random number generator used by shuffle().
+        @param self this object pointer reference
+        @param rng None, an integer seed, or a generator with a shuffle()
+            method. See the constructor.
+        @exception ValueError
+            If <em>rng</em> is not a legal generator.
+        '''
+        self.__rng = _make_rng(rng)
 
     # -------------------------------------------------------------------------
-    def shuffle(self):
+    def shuffle(self, lazy=False):
         '''!
-        Shuffle cards in the shoe. Uses the standard Python
-        random package shuffle method.
+        Shuffle cards in the shoe. Uses the shuffle method of the
+        generator given to the constructor or set_rng(), by default the
+        standard Python random package shuffle method.
+
+        A lazy shuffle does no work up front. Instead each deal() does one
+        Fisher-Yates step, swapping the card being dealt with a random card
+        from the rest of the shoe. A shoe that deals 20 cards does 20 swaps
+        instead of shuffling all 416 cards. The cards dealt have the same
+        distribution as after a full shuffle.
 
         Example usage:
             @code{.py}
             import playingcards
             shoe = playingcards.Shoe()
             shoe.shuffle()
+            shoe.shuffle(lazy=True)
         @endcode
 
         @param self this object pointer reference
+        @param lazy <em>boolean</em> True to shuffle one card at a time as
+            the cards are dealt. If cards have already been dealt a full
+            shuffle is done instead.
+        @exception ValueError
+            If a lazy shuffle is asked for with a generator that has no
+            randrange() (or numpy integers()) method.
         @see <A href=
             "https://docs.python.org/3.6/library/random.html#random.shuffle">
             random.shuffle()</A>
-        @todo Find a way to attach a user's shuffle method instead of our
-            own default.
+        @see set_rng()
         '''
         if self.__enable_shuffle:
-            random.shuffle(self.__cards)
+            if lazy and self.__next_card == 0:
+                self.__randbelow = _make_randbelow(self.__rng)
+                if self.__randbelow is None:
+                    raise ValueError("rng(%s) has no randrange method" %
+                                     str(self.__rng))
+                self.__shuffled = 0
+                return
+            self.__shuffled = sys.maxsize
+            self.__rng.shuffle(self.__cards)
+            if self.__next_card > 0:
+                # dealt and undealt cards were mixed together
+                self.__count_remaining()
+
+    # -------------------------------------------------------------------------
+    def reshuffle(self, lazy=False):
+        '''!
+        Reuse this shoe for a new shoe: reset() then shuffle(), in place.
+        The card list is not rebuilt, so a driver playing many shoes can
+        keep one Shoe instead of creating a new one for each.
+        @param self this object pointer reference
+        @param lazy <em>boolean</em> see shuffle()
+        '''
+        self.reset()
+        self.shuffle(lazy)
+
+    # -------------------------------------------------------------------------
+    def __settle(self, end):
+        '''!
+        Internal use only.
+        Do the pending lazy shuffle steps for positions before <em>end</em>.
+        '''
+        cards = self.__cards
+        size = len(cards)
+        end = min(end, size)
+        i = self.__shuffled
+        while i < end:
+            j = i + self.__randbelow(size - i)
+            cards[i], cards[j] = cards[j], cards[i]
+            i += 1
+        if self.__shuffled < end:
+            self.__shuffled = end
 
     # -------------------------------------------------------------------------
     def set_cut_card(self, position):
@@ -653,11 +816,127 @@ class Shoe(object):
         '''
         card = None
         if self.__next_card < len(self.__cards):
+            if self.__shuffled <= self.__next_card:
+                self.__settle(self.__next_card + 1)  # lazy shuffle step
             # we still have cards to deal, so get the next one
             card = self.__cards[self.__next_card]
             self.__next_card += 1
+            self.__remaining[card.get_rank() - 1] -= 1
         return card
 
+    # --------------------------------------------------------------------
+    def deal_many(self, count):
+        '''!
+        Deal the next <em>count</em> Cards from the Shoe in one call.
+        This is the same as calling deal() <em>count</em> times, and the
+        cut card is seen the same way, but the shoe is only advanced once.
+
+        Example usage:
+        @code{.py}
+        shoe = Shoe(8)
+        shoe.shuffle()
+        p1, b1, p2, b2 = shoe.deal_many(4)
+        @endcode
+
+        @param self this object pointer reference
+        @param count <em>int</em> number of cards wanted
+        @return tuple of Cards. It is shorter than <em>count</em> when the
+            shoe runs out of cards.
+        @exception ValueError
+            If <em>count</em> is not a non-negative integer.
+        @see peek()
+        '''
+        cards = self.peek(count)
+        self.__next_card += len(cards)
+        remaining = self.__remaining
+        for card in cards:
+            remaining[card.get_rank() - 1] -= 1
+        return cards
+
+    # --------------------------------------------------------------------
+    def peek(self, count):
+        '''!
+        Look at the next <em>count</em> Cards without dealing them.
+        @param self this object pointer reference
+        @param count <em>int</em> number of cards wanted
+        @return tuple of Cards. It is shorter than <em>count</em> when the
+            shoe runs out of cards.
+        @exception ValueError
+            If <em>count</em> is not a non-negative integer.
+        @see deal_many()
+        '''
+        if not isinstance(count, int) or count < 0:
+            raise ValueError("count(%s) not a legal value" % str(count))
+        start = self.__next_card
+        end = start + count
+        if self.__shuffled < end:
+            self.__settle(end)  # lazy shuffle steps
+        return tuple(self.__cards[start:end])
+
+    # -------------------------------------------------------------------------
+    def force_cards(self, cards):
+        '''!
+        Replace the next cards to be dealt. The remaining composition is
+        kept up to date. Used to script the outcome of a hand, as the
+        JustBoards system does.
+        @param self this object pointer reference
+        @param cards list of Card, replacing the next len(cards) cards
+        @exception ValueError
+            If there are not enough undealt cards to replace.
+        '''
+        start = self.__next_card
+        if len(self.__cards) < start + len(cards):
+            raise ValueError("force_cards(%d) past end of shoe" % len(cards))
+        self.__settle(start + len(cards))
+        for i in range(len(cards)):
+            self.__remaining[self.__cards[start + i].get_rank() - 1] -= 1
+            self.__remaining[cards[i].get_rank() - 1] += 1
+            self.__cards[start + i] = cards[i]
+
+    # -------------------------------------------------------------------------
+    def get_composition(self):
+        '''!
+        Return the number of undealt cards of each rank. This is kept up to
+        date as cards are dealt, it does not walk the shoe.
+
+        The result can be given directly to
+        ComputeBaccaratOdds.recompute().
+
+        @param self this object pointer reference
+        @return tuple of 13 integers, [0] is the number of aces left,
+            [1] the twos, ... [12] the kings
+        '''
+        return tuple(self.__remaining)
+
+    # -------------------------------------------------------------------------
+    def cards_remaining(self):
+        '''!
+        Return the number of undealt cards in the shoe.
+        @param self this object pointer reference
+        @return integer
+        '''
+        return len(self.__cards) - self.__next_card
+
+    # -------------------------------------------------------------------------
+    def decks_remaining(self):
+        '''!
+        Return the number of undealt decks in the shoe, for card counting
+        true count computations.
+        @param self this object pointer reference
+        @return float, cards_remaining() / 52
+        '''
+        return (len(self.__cards) - self.__next_card) / 52.0
+
+    # -------------------------------------------------------------------------
+    def get_ordinals(self):
+        '''!
+        Return the whole shoe, in its current order, as ordinals.
+        @param self this object pointer reference
+        @return bytes, one ordinal 0..51 per card
+        '''
+        self.__settle(len(self.__cards))
+        return bytes(bytearray([c.get_ordinal() for c in self.__cards]))
+
     # -------------------------------------------------------------------------
     def discard_adjust_baccarat(self, type):
         '''!
@@ -693,99 +972,779 @@ class Shoe(object):
                                ^--^ swap -2 -1
             sweep: b3 b2 b1 p1 p2 p3(top)
         '''
-        if type=="2P2B":
-            if 3 <= self.__next_card:
-                card1 = self.__cards[self.__next_card - 1]
-                card2 = self.__cards[self.__next_card - 2]
-                #ard3 =                               - 3]
-                card4 = self.__cards[self.__next_card - 4]
-                self.__cards[self.__next_card - 4] = card1
-                #                             - 3] = card3
-                self.__cards[self.__next_card - 2] = card4
-                self.__cards[self.__next_card - 1] = card2
-        elif type=="3P2B":
-            if 4 <= self.__next_card:
-                #ard1 =                               - 1]
-                card2 = self.__cards[self.__next_card - 2]
-                card3 = self.__cards[self.__next_card - 3]
-                #ard4 =                               - 4]
-                card5 = self.__cards[self.__next_card - 5]
-                self.__cards[self.__next_card - 5] = card2
-                #                             - 4] = card4
-                self.__cards[self.__next_card - 3] = card5
-                self.__cards[self.__next_card - 2] = card3
-                #                             - 1] = card1
-        elif type=="2P3B":
-            if 4 <= self.__next_card:
-                card1 = self.__cards[self.__next_card - 1]
-                card2 = self.__cards[self.__next_card - 2]
-                card3 = self.__cards[self.__next_card - 3]
-                card4 = self.__cards[self.__next_card - 4]
-                card5 = self.__cards[self.__next_card - 5]
-                self.__cards[self.__next_card - 5] = card1
-                self.__cards[self.__next_card - 4] = card2
-                self.__cards[self.__next_card - 3] = card4
-                self.__cards[self.__next_card - 2] = card5
-                self.__cards[self.__next_card - 1] = card3
-        elif type=="3P3B":
-            if 5 <= self.__next_card:
-                # [-6] = card1
-                # [-5] = card3
-                card1 = self.__cards[self.__next_card - 1]
-                card2 = self.__cards[self.__next_card - 2]
-                card3 = self.__cards[self.__next_card - 3]
-                card4 = self.__cards[self.__next_card - 4]
-                card5 = self.__cards[self.__next_card - 5]
-                card6 = self.__cards[self.__next_card - 6]
-                self.__cards[self.__next_card - 6] = card1
-                self.__cards[self.__next_card - 5] = card3
-                self.__cards[self.__next_card - 4] = card5
-                self.__cards[self.__next_card - 3] = card6
-                self.__cards[self.__next_card - 2] = card4
-                self.__cards[self.__next_card - 1] = card2
-        else:
-            pass # not a legal type
+        _discard_adjust_baccarat(self.__cards, self.__next_card, type)
 
     # -------------------------------------------------------------------------
     def save_shoe(self, filespec):
         '''!
         Save this shoe to a disk file specified.
         '''
-        with open(filespec, 'w') as f:
-            i = 0
-            # write a psuedo burn first
-            line = ""
-            burn_size = self.__cards[i].get_rank()
-            if burn_size > 9:
-                burn_size = 10
-            while i < len(self.__cards) and i < (1 + burn_size):
-                line += str(self.__cards[i])+" "
-                i += 1
-            f.write(line+"\n")
-            # walk the shoe writing psuedo hands, 5 cards
-            while i < len(self.__cards)-14:
-                line = ""
-                j = 0
-                while j < 5:
-                    line += str(self.__cards[i])+" "
-                    j += 1
-                    i += 1
-                f.write(line+"\n")
-            # write a psuedo end of shoe bolt of what's left
-            line = ""
-            while i < len(self.__cards):
-                line += str(self.__cards[i])+" "
-                i += 1
-            f.write(line+"\n")
+        self.__settle(len(self.__cards))
+        _save_cards(self.__cards, filespec)
 
     # --------------------------------------------------------------------
     def load_shoe(self, filespec):
         '''!
         Load a shoe from a disk file specified.
         '''
-        with open(filespec, 'r') as f:
-            lines = f.readlines()
-        for line in lines:
+        cards = _load_cards(filespec)
+        self.__cards.extend(cards)
+        for card in cards:
+            self.__remaining[card.get_rank() - 1] += 1
+
+    # -------------------------------------------------------------------------
+# end class Shoe()
+
+
+class ArrayShoe(object):
+    '''!
+    The ArrayShoe class is an alternative Shoe that holds its cards as a
+    bytearray of Card ordinals (0 to 51) instead of a list of Card objects.
+    An 8 deck shoe is 416 bytes, instead of 416 object pointers. That
+    matters when many shoes are held in memory, for instance to replay
+    them.
+
+    ArrayShoe has the same methods as Shoe and can be used by a Game.
+    Cards are only handed out as Card objects by deal(), and those are the
+    shared Cards from get_card().
+
+    Example usage:
+    @code{.py}
+        shoe = ArrayShoe(8)
+        shoe.shuffle()
+        shoe.set_cut_card(-14)
+        player1 = shoe.deal()
+        banker1 = shoe.deal()
+        raw = shoe.get_ordinals()  # 416 bytes
+    @endcode
+
+    @see Shoe
+    @see get_card
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, number_decks=None, rng=None):
+        '''!
+        Create an ArrayShoe.
+
+        ArrayShoe()
+        ArrayShoe(8)
+        ArrayShoe([Card(43),Card(37),])
+        ArrayShoe(bytearray([43, 37]))
+        ArrayShoe(0)
+
+        @param self this object pointer reference
+        @param number_decks <EM>integer</EM> number of decks, 0 to 12.
+            The default value is 1. Instead of a number of decks, a list of
+            Cards, or a bytes/bytearray/array('B') of ordinals 0 to 51 can
+            be given to create a custom shoe. A custom shoe is not shuffled.
+        @param rng the random number generator used by shuffle(), see
+            Shoe.
+        @exception ValueError
+            If the input parameter <em>number_decks</em> is not legal.
+        '''
+        if number_decks is None:
+            number_decks = 1
+        if isinstance(number_decks, int):
+            if (number_decks < 0) or (12 < number_decks):
+                raise ValueError("number_decks(%s) not a legal value" %
+                                 str(number_decks))
+            self.__enable_shuffle = (0 < number_decks)
+            self.__ordinals = bytearray(range(52)) * number_decks
+        elif isinstance(number_decks, list):
+            self.__enable_shuffle = False  # don't shuffle this custom shoe
+            for i in number_decks:
+                if not isinstance(i, Card):
+                    raise ValueError("non-card type params(%s)" % type(i))
+            self.__ordinals = bytearray([i.get_ordinal() for i in number_decks])
+        elif isinstance(number_decks, (bytes, bytearray, array.array)):
+            if isinstance(number_decks, array.array) and \
+               number_decks.typecode != 'B':
+                # bytearray() would copy the machine bytes, not the values
+                raise ValueError("array typecode(%s) not a legal value" %
+                                 number_decks.typecode)
+            self.__enable_shuffle = False  # don't shuffle this custom shoe
+            self.__ordinals = bytearray(number_decks)
+            for i in self.__ordinals:
+                if 51 < i:
+                    raise ValueError("ordinal(%d) not in legal range 0..51" %
+                                     i)
+        else:
+            raise ValueError("number_decks(%s) not a valid syntax" %
+                             str(number_decks))
+        self.__rng = _make_rng(rng)
+        self.__next_card = 0
+        self.__cut_card_position = 0
+        # __remaining[rank - 1] is the number of undealt cards of each rank
+        self.__remaining = 13 * [0]
+        self.reset()
+
+    # -------------------------------------------------------------------------
+    def reset(self):
+        '''!
+        Reset the shoe to start a new shoe.
+        This method will not shuffle the cards nor assign the cut card
+        position.
+        @param self this object pointer reference
+        @see Shoe.reset
+        '''
+        self.__next_card = 0
+        self.set_cut_card(0)
+        self.__count_remaining()
+
+    # -------------------------------------------------------------------------
+    def __count_remaining(self):
+        '''!
+        Internal use only.
+        Recount the undealt cards of each rank.
+        '''
+        remaining = 13 * [0]
+        for i in range(self.__next_card, len(self.__ordinals)):
+            remaining[self.__ordinals[i] % 13] += 1
+        self.__remaining = remaining
+
+    # -------------------------------------------------------------------------
+    def set_rng(self, rng):
+        '''!
+        Replace the random number generator used by shuffle().
+        @param self this object pointer reference
+        @param rng None, an integer seed, or a generator with a shuffle()
+            method.
+        @see Shoe.set_rng
+        '''
+        self.__rng = _make_rng(rng)
+
+    # -------------------------------------------------------------------------
+    def shuffle(self, lazy=False):
+        '''!
+        Shuffle the ordinals in the shoe, in place.
+        @param self this object pointer reference
+        @param lazy <em>boolean</em> ignored, an ArrayShoe always shuffles
+            in full. Accepted so any shoe can be shuffled the same way.
+        @see Shoe.shuffle
+        '''
+        if self.__enable_shuffle:
+            self.__rng.shuffle(self.__ordinals)
+            if self.__next_card > 0:
+                # dealt and undealt cards were mixed together
+                self.__count_remaining()
+
+    # -------------------------------------------------------------------------
+    def reshuffle(self, lazy=False):
+        '''!
+        Reuse this shoe for a new shoe: reset() then shuffle(), in place.
+        @param self this object pointer reference
+        @param lazy <em>boolean</em> ignored, see shuffle()
+        @see Shoe.reshuffle
+        '''
+        self.reset()
+        self.shuffle(lazy)
+
+    # -------------------------------------------------------------------------
+    def set_cut_card(self, position):
+        '''!
+        Assign the cut card position in the shoe.
+        @param self this object pointer reference
+        @param position <EM><B>integer</B></EM> index position within the shoe.
+            A negative value is allowed and means position
+            from the end of the shoe.
+        @exception ValueError
+            If the input parameter <em>position</em> is not a legal integer
+            value, then throw a ValueError exception.
+        @see Shoe.set_cut_card
+        '''
+        if not isinstance(position, int):
+            raise ValueError("position(%s) not an integer" % str(position))
+        if position < 0:
+            # if negative position, then adjust it from the end of the shoe.
+            position += len(self.__ordinals)
+        if position < 0:
+            raise ValueError("cut card position value too small")
+        if len(self.__ordinals) < position:
+            raise ValueError("cut card position value too big")
+        self.__cut_card_position = position
+
+    # --------------------------------------------------------------------
+    def cut_card_seen(self):
+        '''!
+        Return has the cut card been seen?
+        @param self this object pointer reference
+        @return True if yes, False if no.
+        @see Shoe.cut_card_seen
+        '''
+        return self.__cut_card_position <= self.__next_card
+
+    # --------------------------------------------------------------------
+    def deal(self):
+        '''!
+        Deal a Card from the Shoe.
+        @param self this object pointer reference
+        @return the next (shared) Card from the Shoe, or
+            None if no card is available.
+        @see Shoe.deal
+        '''
+        card = None
+        if self.__next_card < len(self.__ordinals):
+            ordinal = self.__ordinals[self.__next_card]
+            self.__next_card += 1
+            self.__remaining[ordinal % 13] -= 1
+            card = DECK[ordinal]
+        return card
+
+    # --------------------------------------------------------------------
+    def deal_ordinal(self):
+        '''!
+        Deal the next card as an ordinal, without creating or looking up a
+        Card.
+        @param self this object pointer reference
+        @return integer 0..51, or None if no card is available.
+        '''
+        ordinal = None
+        if self.__next_card < len(self.__ordinals):
+            ordinal = self.__ordinals[self.__next_card]
+            self.__next_card += 1
+            self.__remaining[ordinal % 13] -= 1
+        return ordinal
+
+    # --------------------------------------------------------------------
+    def deal_many(self, count):
+        '''!
+        Deal the next <em>count</em> Cards from the Shoe in one call.
+        @param self this object pointer reference
+        @param count <em>int</em> number of cards wanted
+        @return tuple of Cards, shorter than <em>count</em> when the shoe
+            runs out of cards.
+        @see Shoe.deal_many
+        '''
+        return tuple([DECK[i] for i in self.deal_ordinals(count)])
+
+    # --------------------------------------------------------------------
+    def deal_ordinals(self, count):
+        '''!
+        Deal the next <em>count</em> cards as ordinals in one call.
+        @param self this object pointer reference
+        @param count <em>int</em> number of cards wanted
+        @return bytes, shorter than <em>count</em> when the shoe runs out
+            of cards.
+        '''
+        ordinals = self.peek_ordinals(count)
+        self.__next_card += len(ordinals)
+        remaining = self.__remaining
+        for i in bytearray(ordinals):
+            remaining[i % 13] -= 1
+        return ordinals
+
+    # --------------------------------------------------------------------
+    def peek(self, count):
+        '''!
+        Look at the next <em>count</em> Cards without dealing them.
+        @param self this object pointer reference
+        @param count <em>int</em> number of cards wanted
+        @return tuple of Cards
+        @see Shoe.peek
+        '''
+        return tuple([DECK[i] for i in bytearray(self.peek_ordinals(count))])
+
+    # --------------------------------------------------------------------
+    def peek_ordinals(self, count):
+        '''!
+        Look at the next <em>count</em> cards as ordinals without dealing
+        them.
+        @param self this object pointer reference
+        @param count <em>int</em> number of cards wanted
+        @return bytes (a read-only copy of the slice)
+        @exception ValueError
+            If <em>count</em> is not a non-negative integer.
+        '''
+        if not isinstance(count, int) or count < 0:
+            raise ValueError("count(%s) not a legal value" % str(count))
+        start = self.__next_card
+        return bytes(self.__ordinals[start:start + count])
+
+    # -------------------------------------------------------------------------
+    def force_cards(self, cards):
+        '''!
+        Replace the next cards to be dealt.
+        @param self this object pointer reference
+        @param cards list of Card, replacing the next len(cards) cards
+        @exception ValueError
+            If there are not enough undealt cards to replace.
+        @see Shoe.force_cards
+        '''
+        start = self.__next_card
+        if len(self.__ordinals) < start + len(cards):
+            raise ValueError("force_cards(%d) past end of shoe" % len(cards))
+        for i in range(len(cards)):
+            self.__remaining[self.__ordinals[start + i] % 13] -= 1
+            self.__remaining[cards[i].get_rank() - 1] += 1
+            self.__ordinals[start + i] = cards[i].get_ordinal()
+
+    # -------------------------------------------------------------------------
+    def get_composition(self):
+        '''!
+        Return the number of undealt cards of each rank.
+        @param self this object pointer reference
+        @return tuple of 13 integers, [0] aces ... [12] kings
+        @see Shoe.get_composition
+        '''
+        return tuple(self.__remaining)
+
+    # -------------------------------------------------------------------------
+    def cards_remaining(self):
+        '''!
+        Return the number of undealt cards in the shoe.
+        @param self this object pointer reference
+        @return integer
+        '''
+        return len(self.__ordinals) - self.__next_card
+
+    # -------------------------------------------------------------------------
+    def decks_remaining(self):
+        '''!
+        Return the number of undealt decks in the shoe.
+        @param self this object pointer reference
+        @return float, cards_remaining() / 52
+        '''
+        return (len(self.__ordinals) - self.__next_card) / 52.0
+
+    # -------------------------------------------------------------------------
+    def get_ordinals(self):
+        '''!
+        Return a copy of the whole shoe as ordinals.
+        @param self this object pointer reference
+        @return bytes, one ordinal 0..51 per card
+        '''
+        return bytes(self.__ordinals)
+
+    # -------------------------------------------------------------------------
+    def discard_adjust_baccarat(self, type):
+        '''!
+        Rearrange the last hand dealt into the Baccarat discard order.
+        @param self this object pointer reference
+        @param type String "2P2B", "3P2B", "2P3B" or "3P3B"
+        @see Shoe.discard_adjust_baccarat
+        '''
+        _discard_adjust_baccarat(self.__ordinals, self.__next_card, type)
+
+    # -------------------------------------------------------------------------
+    def save_shoe(self, filespec):
+        '''!
+        Save this shoe to a disk file specified, in the Shoe text format.
+        @see Shoe.save_shoe
+        '''
+        _save_cards([DECK[i] for i in self.__ordinals], filespec)
+
+    # --------------------------------------------------------------------
+    def load_shoe(self, filespec):
+        '''!
+        Load a shoe from a disk file specified.
+        @see Shoe.load_shoe
+        '''
+        cards = _load_cards(filespec)
+        self.__ordinals.extend([c.get_ordinal() for c in cards])
+        for card in cards:
+            self.__remaining[card.get_rank() - 1] += 1
+
+    # -------------------------------------------------------------------------
+# end class ArrayShoe()
+
+
+class VirtualShoe(object):
+    '''!
+    The VirtualShoe class is a shoe that only keeps the number of undealt
+    cards of each of the 13 ranks. There is no physical order of cards and
+    no shuffle. Each deal() draws a rank at random, weighted by the counts
+    left, with a scan of the 13 counts. The ranks dealt have the same
+    distribution as dealing from a shuffled shoe of the same composition.
+
+    Use it when only the sequence of ranks matters, for instance a study
+    that plays just the first hands of each shoe, or one that branches
+    from the composition of a live shoe part way through.
+
+    The Cards dealt are the shared Cards from get_card(). Suits are not
+    tracked, every Card dealt is a spade. There is no order of the undealt
+    cards, so there is no peek(), force_cards() or get_ordinals().
+
+    Example usage:
+    @code{.py}
+        shoe = Shoe(8)
+        shoe.shuffle()
+        # ... play part of the shoe ...
+        branch = VirtualShoe(composition=shoe.get_composition(), rng=5)
+        branch.set_cut_card(-14)
+        Game(shoe=branch).play()
+    @endcode
+
+    @see Shoe
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, number_decks=None, rng=None, composition=None):
+        '''!
+        Create a VirtualShoe.
+        @param self this object pointer reference
+        @param number_decks <EM>integer</EM> number of decks, 0 to 12.
+            The default value is 1. Ignored when <em>composition</em> is
+            given.
+        @param rng the random number generator used to draw cards. None
+            uses the global Python random module, an integer seeds a new
+            random.Random. Any other object with a randrange() method (or a
+            numpy.random.Generator) is used as is.
+        @param composition sequence of 13 integers, the number of aces,
+            twos, ... kings, such as Shoe.get_composition() returns.
+        @exception ValueError
+            If a parameter is not a legal value.
+        '''
+        if composition is None:
+            if number_decks is None:
+                number_decks = 1
+            if not isinstance(number_decks, int) or \
+               (number_decks < 0) or (12 < number_decks):
+                raise ValueError("number_decks(%s) not a legal value" %
+                                 str(number_decks))
+            composition = 13 * [4 * number_decks]
+        composition = list(composition)
+        if len(composition) != 13:
+            raise ValueError("composition int[13] required")
+        for i in composition:
+            if not isinstance(i, int) or i < 0:
+                raise ValueError("composition(%s) not a legal value" %
+                                 str(composition))
+        if rng is None:
+            rng = random
+        elif isinstance(rng, int):
+            rng = random.Random(rng)
+        self.__randbelow = _make_randbelow(rng)
+        if self.__randbelow is None:
+            raise ValueError("rng(%s) has no randrange method" % str(rng))
+        self.__initial = composition
+        self.__size = sum(composition)
+        self.__remaining = list(composition)
+        self.__dealt = []
+        self.__next_card = 0
+        self.__cut_card_position = 0
+        self.reset()
+
+    # -------------------------------------------------------------------------
+    def reset(self):
+        '''!
+        Reset the shoe to its starting composition. The cut card is set
+        back to position 0.
+        @param self this object pointer reference
+        '''
+        self.__remaining = list(self.__initial)
+        self.__dealt = []
+        self.__next_card = 0
+        self.set_cut_card(0)
+
+    # -------------------------------------------------------------------------
+    def shuffle(self, lazy=False):
+        '''!
+        Nothing to do, every deal() is already a random draw. Provided so a
+        VirtualShoe can be used wherever a Shoe is.
+        @param self this object pointer reference
+        @param lazy <em>boolean</em> ignored, see Shoe.shuffle
+        '''
+        pass
+
+    # -------------------------------------------------------------------------
+    def reshuffle(self, lazy=False):
+        '''!
+        Reuse this shoe for a new shoe: reset() then shuffle().
+        @param self this object pointer reference
+        @param lazy <em>boolean</em> ignored, see Shoe.shuffle
+        @see Shoe.reshuffle
+        '''
+        self.reset()
+        self.shuffle(lazy)
+
+    # -------------------------------------------------------------------------
+    def set_cut_card(self, position):
+        '''!
+        Assign the cut card position in the shoe.
+        @param self this object pointer reference
+        @param position <EM><B>integer</B></EM> number of cards dealt before
+            the cut card is seen. Negative counts from the end of the shoe.
+        @exception ValueError
+            If the input parameter <em>position</em> is not legal.
+        @see Shoe.set_cut_card
+        '''
+        if not isinstance(position, int):
+            raise ValueError("position(%s) not an integer" % str(position))
+        if position < 0:
+            position += self.__size
+        if position < 0:
+            raise ValueError("cut card position value too small")
+        if self.__size < position:
+            raise ValueError("cut card position value too big")
+        self.__cut_card_position = position
+
+    # --------------------------------------------------------------------
+    def cut_card_seen(self):
+        '''!
+        Return has the cut card been seen?
+        @param self this object pointer reference
+        @return True if yes, False if no.
+        '''
+        return self.__cut_card_position <= self.__next_card
+
+    # --------------------------------------------------------------------
+    def deal(self):
+        '''!
+        Draw a Card from the Shoe.
+        @param self this object pointer reference
+        @return a Card of a randomly drawn rank, or
+            None if no card is available.
+        '''
+        left = self.__size - self.__next_card
+        if left <= 0:
+            return None
+        pick = self.__randbelow(left)
+        remaining = self.__remaining
+        rank = 0
+        while remaining[rank] <= pick:
+            pick -= remaining[rank]
+            rank += 1
+        remaining[rank] -= 1
+        self.__next_card += 1
+        card = DECK[39 + rank]
+        self.__dealt.append(card)
+        return card
+
+    # --------------------------------------------------------------------
+    def deal_many(self, count):
+        '''!
+        Draw the next <em>count</em> Cards in one call. A VirtualShoe has
+        no fixed order, so there is no peek().
+        @param self this object pointer reference
+        @param count <em>int</em> number of cards wanted
+        @return tuple of Cards, shorter than <em>count</em> when the shoe
+            runs out of cards.
+        @exception ValueError
+            If <em>count</em> is not a non-negative integer.
+        '''
+        if not isinstance(count, int) or count < 0:
+            raise ValueError("count(%s) not a legal value" % str(count))
+        count = min(count, self.__size - self.__next_card)
+        return tuple([self.deal() for _ in range(count)])
+
+    # -------------------------------------------------------------------------
+    def get_composition(self):
+        '''!
+        Return the number of undealt cards of each rank.
+        @param self this object pointer reference
+        @return tuple of 13 integers, [0] aces ... [12] kings
+        '''
+        return tuple(self.__remaining)
+
+    # -------------------------------------------------------------------------
+    def cards_remaining(self):
+        '''!
+        Return the number of undealt cards in the shoe.
+        @param self this object pointer reference
+        @return integer
+        '''
+        return self.__size - self.__next_card
+
+    # -------------------------------------------------------------------------
+    def decks_remaining(self):
+        '''!
+        Return the number of undealt decks in the shoe.
+        @param self this object pointer reference
+        @return float, cards_remaining() / 52
+        '''
+        return (self.__size - self.__next_card) / 52.0
+
+    # -------------------------------------------------------------------------
+    def discard_adjust_baccarat(self, type):
+        '''!
+        Nothing to do, a VirtualShoe keeps no discard pile.
+        @param self this object pointer reference
+        @param type String "2P2B", "3P2B", "2P3B" or "3P3B"
+        '''
+        pass
+
+    # -------------------------------------------------------------------------
+    def save_shoe(self, filespec):
+        '''!
+        Save this shoe to a disk file specified, in the Shoe text format:
+        the cards dealt since reset(), in the order dealt, then the undealt
+        cards by rank, aces first. The undealt cards have no order yet, a
+        Shoe loading the file deals the same cards up to this point.
+        @param self this object pointer reference
+        @param filespec file to write
+        @see Shoe.save_shoe
+        '''
+        cards = list(self.__dealt)
+        for rank in range(13):
+            cards.extend(self.__remaining[rank] * [DECK[39 + rank]])
+        _save_cards(cards, filespec)
+
+    # --------------------------------------------------------------------
+    def load_shoe(self, filespec):
+        '''!
+        Add the cards of a disk file specified to the shoe. Only the count
+        of each rank is kept, not the order.
+        @param self this object pointer reference
+        @param filespec file to read
+        @see Shoe.load_shoe
+        '''
+        cards = _load_cards(filespec)
+        for card in cards:
+            self.__initial[card.get_rank() - 1] += 1
+            self.__remaining[card.get_rank() - 1] += 1
+        self.__size += len(cards)
+
+    # -------------------------------------------------------------------------
+# end class VirtualShoe()
+
+
+def _make_rng(rng):
+    '''!
+    Internal use only.
+    Return the generator a shoe should shuffle with.
+    @param rng None, an integer seed, or an object with a shuffle() method
+    @return the random module, a new random.Random, or <em>rng</em>
+    @exception ValueError
+        If <em>rng</em> is none of the above.
+    '''
+    if rng is None:
+        return random
+    if isinstance(rng, int):
+        return random.Random(rng)
+    if not callable(getattr(rng, 'shuffle', None)):
+        raise ValueError("rng(%s) has no shuffle method" % str(rng))
+    return rng
+
+
+def _make_randbelow(rng):
+    '''!
+    Internal use only.
+    Return a function randbelow(n) giving a random integer 0..n-1 drawn
+    from <em>rng</em>.
+    @param rng the random module, a random.Random, a numpy Generator, or
+        any object with a randrange() method
+    @return function, or None if <em>rng</em> can not draw integers
+    '''
+    if callable(getattr(rng, 'randrange', None)):
+        return rng.randrange
+    if callable(getattr(rng, 'integers', None)):
+        return lambda n: int(rng.integers(n))
+    return None
+
+
+def _discard_adjust_baccarat(cards, next_card, type):
+    '''!
+    Internal use only.
+    Rearrange the last hand dealt from <em>cards</em> into the order a
+    Baccarat dealer sweeps them to the discard pile.
+    @param cards mutable sequence, the shoe contents
+    @param next_card index of the next card to deal
+    @param type String "2P2B", "3P2B", "2P3B" or "3P3B"
+    @see Shoe.discard_adjust_baccarat
+    '''
+    if type=="2P2B":
+        if 3 <= next_card:
+            card1 = cards[next_card - 1]
+            card2 = cards[next_card - 2]
+            #ard3 = cards[next_card - 3]
+            card4 = cards[next_card - 4]
+            cards[next_card - 4] = card1
+            #ards[next_card - 3] = card3
+            cards[next_card - 2] = card4
+            cards[next_card - 1] = card2
+    elif type=="3P2B":
+        if 4 <= next_card:
+            #ard1 = cards[next_card - 1]
+            card2 = cards[next_card - 2]
+            card3 = cards[next_card - 3]
+            #ard4 = cards[next_card - 4]
+            card5 = cards[next_card - 5]
+            cards[next_card - 5] = card2
+            #ards[next_card - 4] = card4
+            cards[next_card - 3] = card5
+            cards[next_card - 2] = card3
+            #ards[next_card - 1] = card1
+    elif type=="2P3B":
+        if 4 <= next_card:
+            card1 = cards[next_card - 1]
+            card2 = cards[next_card - 2]
+            card3 = cards[next_card - 3]
+            card4 = cards[next_card - 4]
+            card5 = cards[next_card - 5]
+            cards[next_card - 5] = card1
+            cards[next_card - 4] = card2
+            cards[next_card - 3] = card4
+            cards[next_card - 2] = card5
+            cards[next_card - 1] = card3
+    elif type=="3P3B":
+        if 5 <= next_card:
+            # [-6] = card1
+            # [-5] = card3
+            card1 = cards[next_card - 1]
+            card2 = cards[next_card - 2]
+            card3 = cards[next_card - 3]
+            card4 = cards[next_card - 4]
+            card5 = cards[next_card - 5]
+            card6 = cards[next_card - 6]
+            cards[next_card - 6] = card1
+            cards[next_card - 5] = card3
+            cards[next_card - 4] = card5
+            cards[next_card - 3] = card6
+            cards[next_card - 2] = card4
+            cards[next_card - 1] = card2
+    else:
+        pass # not a legal type
+
+
+def _save_cards(cards, filespec):
+    '''!
+    Internal use only.
+    Save a sequence of Cards to a disk file in the Shoe text format.
+    @param cards sequence of Card
+    @param filespec file to write
+    @see Shoe.save_shoe
+    '''
+    with open(filespec, 'w') as f:
+        i = 0
+        # write a psuedo burn first
+        line = ""
+        burn_size = cards[i].get_rank()
+        if burn_size > 9:
+            burn_size = 10
+        while i < len(cards) and i < (1 + burn_size):
+            line += str(cards[i])+" "
+            i += 1
+        f.write(line+"\n")
+        # walk the shoe writing psuedo hands, 5 cards
+        while i < len(cards)-14:
+            line = ""
+            j = 0
+            while j < 5:
+                line += str(cards[i])+" "
+                j += 1
+                i += 1
+            f.write(line+"\n")
+        # write a psuedo end of shoe bolt of what's left
+        line = ""
+        while i < len(cards):
+            line += str(cards[i])+" "
+            i += 1
+        f.write(line+"\n")
+
+
+def _load_cards(filespec):
+    '''!
+    Internal use only.
+    Read the Cards of one shoe from a disk file in the Shoe text format.
+    Lines starting with "#" are comments, and a "#" token ends a line.
+    Reading stops at a line starting with "#END".
+    @param filespec file to read
+    @return list of Card
+    '''
+    cards = []
+    with open(filespec, 'r') as f:
+        for line in f:
             if line.startswith("#END"):
                 break
             if line.startswith("#"):
@@ -794,7 +1753,92 @@ class Shoe(object):
             for new_card in st:
                 if new_card.startswith("#"):
                     break
-                self.__cards.append(Card(new_card))
+                cards.append(get_card(new_card))
+    return cards
 
-    # -------------------------------------------------------------------------
-# end class Shoe()
+
+class ShoeFormatError(ValueError):
+    '''!
+    A card in a shoe text file could not be read. The file name, line
+    number (starting at 1) and the bad text are kept with the error.
+    '''
+    def __init__(self, filespec, line_number, token, reason):
+        '''!
+        @param filespec file being read
+        @param line_number <em>int</em> line of the bad card
+        @param token String the text that is not a card
+        @param reason String why the card is not legal
+        '''
+        super(ShoeFormatError, self).__init__(
+            "%s:%d: bad card(%s) %s" % (filespec, line_number, token, reason))
+        self.filespec = filespec
+        self.line_number = line_number
+        self.token = token
+
+
+def _report_error(error):
+    '''!
+    Internal use only.
+    Default iter_shoes() error handler, print the error to stderr.
+    '''
+    sys.stderr.write(str(error) + "\n")
+
+
+def iter_shoes(filespec, on_error=None, shoe_class=None):
+    '''!
+    Read a text file holding any number of shoes, yielding one shoe at a
+    time. The file is read a line at a time, so memory use does not grow
+    with the size of the file.
+
+    The format is the one written by Shoe.save_shoe(). A line starting
+    with "#END" ends the current shoe, and the cards that follow start the
+    next one. Other lines starting with "#" are comments, and a "#" token
+    ends a line. Cards left at the end of the file are the last shoe.
+    Empty shoes are not yielded.
+
+    A token that is not a legal card does not stop the stream. The card is
+    skipped and a ShoeFormatError, giving the file and line, is passed to
+    <em>on_error</em>.
+
+    Example usage:
+    @code{.py}
+        from pybaccarat.playingcards import iter_shoes
+        from pybaccarat.baccarat import Game
+        for shoe in iter_shoes("casino.log"):
+            Game(shoe=shoe).play()
+    @endcode
+
+    @param filespec file to read
+    @param on_error function called with each ShoeFormatError. The default
+        prints the error to stderr. To abort on the first error pass a
+        function that raises it.
+    @param shoe_class Shoe (the default) or ArrayShoe, the class built from
+        each list of Cards
+    @return generator of shoes, each reset and ready to deal
+    '''
+    if on_error is None:
+        on_error = _report_error
+    if shoe_class is None:
+        shoe_class = Shoe
+    cards = []
+    with open(filespec, 'r') as f:
+        line_number = 0
+        for line in f:
+            line_number += 1
+            if line.startswith("#END"):
+                if cards:
+                    yield shoe_class(cards)
+                cards = []
+                continue
+            if line.startswith("#"):
+                continue
+            for token in line.split():
+                if token.startswith("#"):
+                    break
+                try:
+                    cards.append(get_card(token))
+                except ValueError as ex:
+                    on_error(ShoeFormatError(filespec, line_number, token,
+                                             str(ex)))
+    if cards:
+        yield shoe_class(cards)
@@ -0,0 +1,147 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.resolver
+This module resolves a hand of Baccarat with table lookups.
+
+The outcome of a hand depends only on the points (0 to 9) of the cards
+dealt, so every decision Game.play_hand() makes is precomputed here once,
+at import time:
+<ul compact>
+<li>NATURALS: outcome of the hand if either side has a natural, by the
+    two card values of player and banker</li>
+<li>PLAYER_DRAWS: does the player draw, by the player two card value</li>
+<li>BANKER_DRAWS: does the banker draw, by the banker two card value and
+    the point of the player third card (STOOD if the player stood)</li>
+<li>OUTCOMES: outcome of the hand by the final values and which sides
+    drew a third card</li>
+</ul>
+An outcome is the tuple (win, diff, bonus, cards_consumed) with the same
+win, diff and bonus strings Game.play_hand() returns:
+win is "P", "B" or "T"; diff is "n" for a natural, else the difference in
+value ("0" for a tie); bonus is "P8" (player wins with a 3 card 8), "D7"
+(banker wins with a 3 card 7) or "  ".
+
+The win and bonus strings also have small integer codes, the index in
+WIN_LETTERS and BONUS_STRINGS, used wherever hands are stored as numbers
+(lockstep, sinks, tape). card_ordinals() gives the stored cards of a hand.
+
+Example usage:
+@code{.py}
+    from pybaccarat.resolver import resolve
+    # deal order: player, banker, player, banker, then third cards
+    print(resolve([3, 0, 0, 3, 0, 4]))   # ('B', '4', 'D7', 6)
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+STOOD = 10  ##!< STOOD index into BANKER_DRAWS when the player stood
+NO_BONUS = "  "  ##!< NO_BONUS bonus string when there is no bonus
+WIN_LETTERS = "BPT"  ##!< WIN_LETTERS win string by win code
+BONUS_STRINGS = (NO_BONUS, "P8", "D7")  ##!< BONUS_STRINGS by bonus code
+WIN_CODES = dict([(w, i) for (i, w) in
+                  enumerate(WIN_LETTERS)])  ##!< WIN_CODES by win string
+BONUS_CODES = dict([(b, i) for (i, b) in
+                    enumerate(BONUS_STRINGS)])  ##!< BONUS_CODES by bonus
+NO_CARD = 255  ##!< NO_CARD ordinal stored for an unused third card
+
+# Banker draws with a two card value of BANKER_MAX[p] or less after the
+# player draws a third card of point p. 5 when the player stood.
+_BANKER_MAX = [3, 3, 4, 4, 5, 5, 6, 6, 2, 3, 5]
+# point         0  1  2  3  4  5  6  7  8  9  STOOD
+
+
+def _outcome(player, banker, player_drew, banker_drew):
+    '''!
+    Internal use only.
+    Work out one entry of the tables the long way.
+    '''
+    consumed = 4 + int(player_drew) + int(banker_drew)
+    natural = not (player_drew or banker_drew) and \
+        (player >= 8 or banker >= 8)
+    bonus = NO_BONUS
+    if banker < player:
+        win = "P"
+        diff = str(player - banker)
+        if player == 8 and player_drew:
+            bonus = "P8"
+    elif player < banker:
+        win = "B"
+        diff = str(banker - player)
+        if banker == 7 and banker_drew:
+            bonus = "D7"
+    else:
+        win = "T"
+        diff = "0"
+    if natural:
+        diff = "n"
+    return (win, diff, bonus, consumed)
+
+
+NATURALS = tuple([
+    _outcome(i // 10, i % 10, False, False)
+    if (i // 10 >= 8 or i % 10 >= 8) else None
+    for i in range(100)])  ##!< NATURALS[player * 10 + banker]
+PLAYER_DRAWS = tuple([v <= 5 for v in range(10)])  ##!< PLAYER_DRAWS[player]
+BANKER_DRAWS = tuple([
+    (i // 11) <= _BANKER_MAX[i % 11]
+    for i in range(110)])  ##!< BANKER_DRAWS[banker * 11 + player3_point]
+OUTCOMES = tuple([
+    _outcome(i // 40, (i // 4) % 10, bool(i & 2), bool(i & 1))
+    for i in range(400)])  ##!< OUTCOMES[outcome_index(...)]
+
+
+def outcome_index(player, banker, player_drew, banker_drew):
+    '''!
+    Return the OUTCOMES index of a hand that was not a natural.
+    @param player <em>int</em> final player value 0 to 9
+    @param banker <em>int</em> final banker value 0 to 9
+    @param player_drew <em>boolean</em> did the player draw a third card
+    @param banker_drew <em>boolean</em> did the banker draw a third card
+    @return int
+    '''
+    return (player * 10 + banker) * 4 + 2 * int(player_drew) + \
+        int(banker_drew)
+
+
+def card_ordinals(cards):
+    '''!
+    Return the ordinals of the cards of one side of a hand, as stored.
+    @param cards tuple of 2 or 3 Cards
+    @return list of 3 Card ordinals, padded with NO_CARD
+    '''
+    ordinals = [c.get_ordinal() for c in cards]
+    if len(ordinals) < 3:
+        ordinals.append(NO_CARD)
+    return ordinals
+
+
+def resolve(points):
+    '''!
+    Resolve one hand from the points of the cards in deal order.
+    @param points sequence of 4 to 6 card points 0 to 9, in the order the
+        cards come out of the shoe: player, banker, player, banker, then
+        the third cards. Extra points are ignored.
+    @return (win, diff, bonus, cards_consumed)
+    @exception IndexError
+        If a third card is needed and <em>points</em> is too short.
+    '''
+    player = (points[0] + points[2]) % 10
+    banker = (points[1] + points[3]) % 10
+    result = NATURALS[player * 10 + banker]
+    if result is not None:
+        return result
+    if PLAYER_DRAWS[player]:
+        third = points[4]
+        player = (player + third) % 10
+        if BANKER_DRAWS[banker * 11 + third]:
+            banker = (banker + points[5]) % 10
+            return OUTCOMES[(player * 10 + banker) * 4 + 3]
+        return OUTCOMES[(player * 10 + banker) * 4 + 2]
+    if BANKER_DRAWS[banker * 11 + STOOD]:
+        banker = (banker + points[4]) % 10
+        return OUTCOMES[(player * 10 + banker) * 4 + 1]
+    return OUTCOMES[(player * 10 + banker) * 4]
+
+# END
@@ -0,0 +1,157 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.seeding
+This module derives independent, reproducible random number streams for
+shuffling shoes.
+
+A SeedStream is a root seed plus a spawn key (a tuple of integers), much
+like numpy.random.SeedSequence. spawn() hands out child streams with
+longer keys that never overlap each other or their parent. The seed of a
+stream is a SHA-256 digest of the root seed and spawn key, so the same
+(root_seed, key) always gives the same generator on every machine and in
+every process.
+
+Shoe number <em>k</em> of a run is shuffled by the stream with key (k,).
+A simulation sharded over many processes by shoe number is therefore
+reproducible bit for bit, whatever the number of processes, and any single
+shoe can be regenerated from (root_seed, shoe_index) without storing it.
+
+Example usage:
+@code{.py}
+    from pybaccarat.seeding import SeedStream, make_shoe
+    root = SeedStream(20181018)
+    workers = root.spawn(64)              # one stream per worker
+    rng = workers[0].random()             # random.Random for worker 0
+    shoe = make_shoe(20181018, 1234)      # shoe 1234, shuffled
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import hashlib
+import os
+import random
+
+from pybaccarat.playingcards import Shoe
+
+
+class SeedStream(object):
+    '''!
+    A reproducible source of seeds that can be split into independent
+    child streams.
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, root_seed=None, spawn_key=()):
+        '''!
+        Create a new seed stream.
+        @param root_seed <em>int</em> the seed of the whole run. None draws
+            a fresh 128 bit seed from os.urandom(), available afterwards as
+            root_seed so the run can be repeated.
+        @param spawn_key <em>tuple</em> of non-negative integers naming
+            this stream below the root. () is the root stream itself.
+        @exception ValueError
+            If <em>root_seed</em> or <em>spawn_key</em> is not legal.
+        '''
+        if root_seed is None:
+            root_seed = int(hashlib.sha256(os.urandom(32)).hexdigest()[:32],
+                            16)
+        if not isinstance(root_seed, int) or root_seed < 0:
+            raise ValueError("root_seed(%s) not a legal value" %
+                             str(root_seed))
+        spawn_key = tuple(spawn_key)
+        for i in spawn_key:
+            if not isinstance(i, int) or i < 0:
+                raise ValueError("spawn_key(%s) not a legal value" %
+                                 str(spawn_key))
+        self.root_seed = root_seed
+        self.spawn_key = spawn_key
+        self.__children_spawned = 0
+
+    # -------------------------------------------------------------------------
+    def spawn(self, count):
+        '''!
+        Create <em>count</em> new child streams. Each call continues where
+        the last one stopped, so no two children are ever the same.
+        @param count <em>int</em> number of children
+        @return list of SeedStream
+        '''
+        first = self.__children_spawned
+        self.__children_spawned += count
+        return [self.child(i) for i in range(first, first + count)]
+
+    # -------------------------------------------------------------------------
+    def child(self, index):
+        '''!
+        Return child stream number <em>index</em>, without changing the
+        spawn counter. child(k) is the same stream the k-th spawn gives.
+        @param index <em>int</em> child number
+        @return SeedStream
+        '''
+        return SeedStream(self.root_seed, self.spawn_key + (index,))
+
+    # -------------------------------------------------------------------------
+    def seed(self):
+        '''!
+        Return the 128 bit integer seed of this stream.
+        @return int
+        '''
+        text = "pybaccarat:%d:%s" % (
+            self.root_seed, ",".join([str(i) for i in self.spawn_key]))
+        return int(hashlib.sha256(text.encode("ascii")).hexdigest()[:32], 16)
+
+    # -------------------------------------------------------------------------
+    def random(self):
+        '''!
+        Return a new random.Random seeded from this stream.
+        @return random.Random
+        '''
+        return random.Random(self.seed())
+
+    # -------------------------------------------------------------------------
+    def generator(self):
+        '''!
+        Return a new numpy.random.Generator seeded from this stream.
+        Requires NumPy.
+        @return numpy.random.Generator
+        '''
+        import numpy
+        return numpy.random.default_rng(self.seed())
+
+    # -------------------------------------------------------------------------
+    def __str__(self):
+        '''!
+        @return String naming the root seed and spawn key
+        '''
+        return "SeedStream(%d, %s)" % (self.root_seed, str(self.spawn_key))
+
+    # -------------------------------------------------------------------------
+# end class SeedStream
+
+
+def shoe_rng(root_seed, shoe_index):
+    '''!
+    Return the generator that shuffles shoe number <em>shoe_index</em> of
+    the run seeded with <em>root_seed</em>.
+    @param root_seed <em>int</em>
+    @param shoe_index <em>int</em> 0, 1, 2, ...
+    @return random.Random
+    '''
+    return SeedStream(root_seed).child(shoe_index).random()
+
+
+def make_shoe(root_seed, shoe_index, number_decks=8):
+    '''!
+    Create and shuffle shoe number <em>shoe_index</em> of the run seeded
+    with <em>root_seed</em>. The same arguments always give the same shoe.
+    @param root_seed <em>int</em>
+    @param shoe_index <em>int</em> 0, 1, 2, ...
+    @param number_decks <em>int</em> decks in the shoe
+    @return shuffled Shoe
+    '''
+    shoe = Shoe(number_decks, rng=shoe_rng(root_seed, shoe_index))
+    shoe.shuffle()
+    return shoe
+
+# END
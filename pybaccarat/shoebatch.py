@@ -0,0 +1,99 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.shoebatch
+This module generates many shuffled shoes at once with NumPy.
+
+A batch of shoes is a (N, 52 * decks) numpy.uint8 matrix. Each row is one
+independently shuffled shoe, with one Card ordinal (0 to 51) per card.
+Any row can be wrapped as an ArrayShoe and played by a Game.
+
+This module requires NumPy, which is an optional dependency of pybaccarat.
+
+Example usage:
+@code{.py}
+    from pybaccarat.shoebatch import generate_shoes, shoe_from_row
+    from pybaccarat.baccarat import Game
+    shoes = generate_shoes(1000, 8, seed=12345)
+    for row in shoes:
+        Game(shoe=shoe_from_row(row)).play(display=False)
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from pybaccarat.playingcards import ArrayShoe
+from pybaccarat.seeding import SeedStream
+
+
+def _require_numpy():
+    '''!
+    Internal use only.
+    Raise an ImportError if NumPy is not installed.
+    '''
+    if numpy is None:
+        raise ImportError("pybaccarat.shoebatch requires numpy")
+
+
+def make_generator(seed=None):
+    '''!
+    Return a numpy.random.Generator for shuffling.
+    @param seed None for fresh entropy, an integer seed, a
+        numpy.random.SeedSequence, a seeding.SeedStream, or an existing
+        numpy.random.Generator which is returned as is.
+    @return numpy.random.Generator
+    '''
+    _require_numpy()
+    if isinstance(seed, numpy.random.Generator):
+        return seed
+    if isinstance(seed, SeedStream):
+        return seed.generator()
+    return numpy.random.default_rng(seed)
+
+
+def generate_shoes(count, number_decks=8, seed=None):
+    '''!
+    Generate <em>count</em> independently shuffled shoes in one vectorized
+    call.
+
+    @param count <em>int</em> number of shoes (rows) to generate
+    @param number_decks <em>int</em> number of decks per shoe, 1 to 12
+    @param seed seed or numpy.random.Generator, see make_generator()
+    @return numpy.uint8 matrix of shape (count, 52 * number_decks)
+    @exception ValueError
+        If <em>count</em> or <em>number_decks</em> is not a legal value.
+    '''
+    _require_numpy()
+    if not isinstance(count, int) or count < 0:
+        raise ValueError("count(%s) not a legal value" % str(count))
+    if not isinstance(number_decks, int) or \
+       (number_decks < 1) or (12 < number_decks):
+        raise ValueError("number_decks(%s) not a legal value" %
+                         str(number_decks))
+    rng = make_generator(seed)
+    shoes = numpy.empty((count, 52 * number_decks), dtype=numpy.uint8)
+    shoes[:] = numpy.tile(numpy.arange(52, dtype=numpy.uint8), number_decks)
+    # shuffle each row independently, in place
+    rng.permuted(shoes, axis=1, out=shoes)
+    return shoes
+
+
+def shoe_from_row(row):
+    '''!
+    Wrap one row of a shoe matrix as a shoe that a Game can play.
+    @param row sequence of ordinals 0..51, such as one row of the
+        generate_shoes() matrix
+    @return ArrayShoe holding a copy of the row
+    '''
+    if numpy is not None and isinstance(row, numpy.ndarray):
+        row = bytearray(row.astype(numpy.uint8, copy=False).tobytes())
+    else:
+        row = bytearray(row)
+    return ArrayShoe(row)
+
+# END
@@ -0,0 +1,147 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.shoepool
+This module keeps a small pool of shuffled shoes ready to play.
+
+Building an 8 deck Shoe and shuffling its 416 cards is most of the cost of
+starting a new shoe. A ShoePool builds a few Shoe objects once and then
+recycles them: get() hands out a shoe that is already shuffled, and
+release() gives it back to be reshuffled in place (Shoe.reshuffle()) by a
+background thread while the caller plays the next one. A Game given a pool
+takes a fresh shoe from it at the start of every play() and returns it at
+the end, so the playing loop never waits on construction or shuffling as
+long as the pool keeps up.
+
+Example usage:
+@code{.py}
+    from pybaccarat.shoepool import ShoePool
+    from pybaccarat.baccarat import Game
+    with ShoePool(size=4, number_decks=8, rng=12345) as pool:
+        game = Game(pool=pool)
+        for _ in range(1000):
+            game.play(display=False)
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import threading
+try:
+    import queue
+except ImportError:  # pragma: no cover
+    import Queue as queue  # python 2
+
+from pybaccarat.playingcards import Shoe, _make_rng
+
+
+class ShoePool(object):
+    '''!
+    A fixed set of Shoe objects recycled between shuffled (ready) and
+    played (released) states.
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, size=4, number_decks=8, rng=None, background=True):
+        '''!
+        Create the pool and shuffle every shoe in it.
+        @param size <em>int</em> number of shoes in the pool, at least 1
+        @param number_decks <em>int</em> decks in each shoe
+        @param rng random.Random or integer seed shared by every shoe. The
+            shoes are always shuffled one at a time in release order, so a
+            seeded pool deals the same sequence of shoes on every run.
+        @param background <em>boolean</em> True to reshuffle released shoes
+            on a daemon thread, False to reshuffle inside release().
+        @exception ValueError
+            If <em>size</em> is not a legal value.
+        '''
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("size(%s) not a legal value" % str(size))
+        self.size = size
+        self.__rng = _make_rng(rng)
+        self.__ready = queue.Queue()
+        self.__released = queue.Queue()
+        self.__closed = False
+        for _ in range(size):
+            shoe = Shoe(number_decks, rng=self.__rng)
+            shoe.shuffle()
+            self.__ready.put(shoe)
+        self.__thread = None
+        if background:
+            self.__thread = threading.Thread(target=self.__refill,
+                                             name="ShoePool")
+            self.__thread.daemon = True
+            self.__thread.start()
+
+    # -------------------------------------------------------------------------
+    def __refill(self):
+        '''!
+        Internal use only. Background thread: reshuffle each released shoe
+        and put it back in the ready queue, until close() sends None.
+        '''
+        while True:
+            shoe = self.__released.get()
+            if shoe is None:
+                break
+            shoe.reshuffle()
+            self.__ready.put(shoe)
+
+    # -------------------------------------------------------------------------
+    def get(self, timeout=None):
+        '''!
+        Take a shuffled shoe out of the pool, waiting for one if every shoe
+        is in use or still being reshuffled.
+        @param timeout None to wait forever, else seconds to wait
+        @return Shoe, shuffled, with next card at the start of the shoe
+        @exception ValueError
+            If the pool is closed.
+        @exception queue.Empty
+            If no shoe became ready within <em>timeout</em>.
+        '''
+        if self.__closed:
+            raise ValueError("ShoePool is closed")
+        return self.__ready.get(timeout=timeout)
+
+    # -------------------------------------------------------------------------
+    def release(self, shoe):
+        '''!
+        Give a shoe taken by get() back to the pool to be reshuffled.
+        @param shoe Shoe from get(). It must not be used after this call.
+        '''
+        if self.__closed:
+            return
+        if self.__thread is None:
+            shoe.reshuffle()
+            self.__ready.put(shoe)
+        else:
+            self.__released.put(shoe)
+
+    # -------------------------------------------------------------------------
+    def ready_count(self):
+        '''!
+        @return number of shoes shuffled and waiting in the pool right now
+        '''
+        return self.__ready.qsize()
+
+    # -------------------------------------------------------------------------
+    def close(self):
+        '''!
+        Stop the background thread. Shoes still out keep working but are
+        not taken back.
+        '''
+        if not self.__closed:
+            self.__closed = True
+            if self.__thread is not None:
+                self.__released.put(None)
+                self.__thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # -------------------------------------------------------------------------
+# end class ShoePool
+
+# END
@@ -0,0 +1,270 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.sinks
+This module writes the hands a Game plays to files.
+
+A sink is a baccarat.HandObserver: add it to a Game with add_observer() and
+every hand of every shoe played by simulate_shoe() is written out. Rows
+are kept in memory and written <em>buffer_size</em> at a time with a
+single write, so a long run makes few system calls. Shoes are numbered
+from 0 in the order the sink sees them, hands from 1 within a shoe.
+<ul compact>
+<li>CsvSink: one line per hand, shoe,hand,player,banker,win,diff,bonus
+    with the cards of a hand separated by spaces, such as "Ks 5h 9d"</li>
+<li>JsonlSink: one JSON object per line with the same fields, the cards
+    as lists of strings</li>
+<li>NpzSink: columns of small integers, one set of .npy arrays per chunk
+    of hands, all in one .npz file. load_npz() joins the chunks back into
+    whole columns. Requires NumPy.</li>
+</ul>
+
+Example usage:
+@code{.py}
+    from pybaccarat.baccarat import Game
+    from pybaccarat.sinks import CsvSink
+    game = Game()
+    with CsvSink("hands.csv") as sink:
+        game.add_observer(sink)
+        for _ in range(1000):
+            game.simulate_shoe()
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import zipfile
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from pybaccarat.baccarat import HandObserver
+from pybaccarat.resolver import BONUS_CODES, NO_CARD, WIN_CODES, \
+    card_ordinals
+
+CSV_HEADER = "shoe,hand,player,banker,win,diff,bonus\n"  ##!< CSV_HEADER
+NATURAL_DIFF = -1  ##!< NATURAL_DIFF diff column value for a natural ("n")
+
+
+class _BufferedSink(HandObserver):
+    '''!
+    Internal use only.
+    Parent of the sinks: numbers the shoes and hands and flushes every
+    <em>buffer_size</em> hands. Children implement _add() and _write().
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, buffer_size):
+        '''!
+        @param buffer_size <em>int</em> hands kept in memory between writes
+        @exception ValueError
+            If <em>buffer_size</em> is not a legal value.
+        '''
+        if not isinstance(buffer_size, int) or buffer_size < 1:
+            raise ValueError("buffer_size(%s) not a legal value" %
+                             str(buffer_size))
+        self.buffer_size = buffer_size
+        self.shoe_number = -1
+        self.hands_written = 0
+        self._pending = 0
+
+    def new_shoe(self, burned_cards):
+        self.shoe_number += 1
+
+    def hand_post(self, hand_number, hand, player, banker):
+        self._add(hand_number, hand)
+        self._pending += 1
+        if self._pending >= self.buffer_size:
+            self.flush()
+        return ""
+
+    # -------------------------------------------------------------------------
+    def flush(self):
+        '''!
+        Write the hands kept in memory.
+        '''
+        if self._pending:
+            self._write()
+            self.hands_written += self._pending
+            self._pending = 0
+
+    # -------------------------------------------------------------------------
+    def close(self):
+        '''!
+        Flush and close the file.
+        '''
+        self.flush()
+        self._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # -------------------------------------------------------------------------
+# end class _BufferedSink
+
+
+class _TextSink(_BufferedSink):
+    '''!
+    Internal use only. A sink writing lines of text.
+    '''
+    def __init__(self, filespec, buffer_size, header=""):
+        super(_TextSink, self).__init__(buffer_size)
+        self.__file = open(filespec, 'w')
+        self.__file.write(header)
+        self._lines = []
+
+    def _write(self):
+        self.__file.write("".join(self._lines))
+        self._lines = []
+
+    def _close(self):
+        self.__file.close()
+# end class _TextSink
+
+
+class CsvSink(_TextSink):
+    '''!
+    Write hands as lines of comma separated values, with a header line.
+    '''
+    def __init__(self, filespec, buffer_size=10000):
+        '''!
+        @param filespec file to write
+        @param buffer_size <em>int</em> hands kept in memory between writes
+        '''
+        super(CsvSink, self).__init__(filespec, buffer_size, CSV_HEADER)
+
+    def _add(self, hand_number, hand):
+        self._lines.append("%d,%d,%s,%s,%s,%s,%s\n" % (
+            self.shoe_number, hand_number,
+            " ".join([str(c) for c in hand.player]),
+            " ".join([str(c) for c in hand.banker]),
+            hand.win, hand.diff, hand.bonus.strip()))
+# end class CsvSink
+
+
+class JsonlSink(_TextSink):
+    '''!
+    Write hands as lines of JSON objects, such as
+    {"shoe":0,"hand":1,"player":["Ks","5h"],"banker":["9d","Tc"],
+    "win":"B","diff":"n","bonus":""}
+    '''
+    def __init__(self, filespec, buffer_size=10000):
+        '''!
+        @param filespec file to write
+        @param buffer_size <em>int</em> hands kept in memory between writes
+        '''
+        super(JsonlSink, self).__init__(filespec, buffer_size)
+
+    def _add(self, hand_number, hand):
+        # every field is a number or a plain ASCII string, so the JSON is
+        # formatted directly instead of with json.dumps()
+        self._lines.append(
+            '{"shoe":%d,"hand":%d,"player":["%s"],"banker":["%s"],'
+            '"win":"%s","diff":"%s","bonus":"%s"}\n' % (
+                self.shoe_number, hand_number,
+                '","'.join([str(c) for c in hand.player]),
+                '","'.join([str(c) for c in hand.banker]),
+                hand.win, hand.diff, hand.bonus.strip()))
+# end class JsonlSink
+
+
+class NpzSink(_BufferedSink):
+    '''!
+    Write hands as columns in an .npz file. Each flush adds one chunk of
+    columns, named "%05d_column" by chunk number:
+    <ul compact>
+    <li>shoe int32, hand int16</li>
+    <li>player, banker uint8 (N, 3) Card ordinals, NO_CARD when unused</li>
+    <li>win int8 0 banker, 1 player, 2 tie</li>
+    <li>diff int8 value difference, NATURAL_DIFF for a natural</li>
+    <li>bonus int8 0 none, 1 P8, 2 D7</li>
+    </ul>
+    '''
+    COLUMNS = ('shoe', 'hand', 'player', 'banker', 'win', 'diff',
+               'bonus')  ##!< COLUMNS names of the columns
+    _DTYPES = {'shoe': 'int32', 'hand': 'int16', 'player': 'uint8',
+               'banker': 'uint8', 'win': 'int8', 'diff': 'int8',
+               'bonus': 'int8'}
+
+    # -------------------------------------------------------------------------
+    def __init__(self, filespec, buffer_size=100000):
+        '''!
+        @param filespec file to write, usually ending in .npz
+        @param buffer_size <em>int</em> hands per chunk
+        @exception ImportError
+            If NumPy is not installed.
+        '''
+        if numpy is None:
+            raise ImportError("pybaccarat.sinks.NpzSink requires numpy")
+        super(NpzSink, self).__init__(buffer_size)
+        self.__zip = zipfile.ZipFile(filespec, 'w', zipfile.ZIP_STORED,
+                                     allowZip64=True)
+        self.__chunk = 0
+        self.__clear()
+
+    def __clear(self):
+        self.__columns = dict([(name, []) for name in self.COLUMNS])
+
+    def _add(self, hand_number, hand):
+        columns = self.__columns
+        columns['shoe'].append(self.shoe_number)
+        columns['hand'].append(hand_number)
+        columns['player'].extend(card_ordinals(hand.player))
+        columns['banker'].extend(card_ordinals(hand.banker))
+        columns['win'].append(WIN_CODES[hand.win])
+        diff = hand.diff
+        columns['diff'].append(NATURAL_DIFF if diff == "n" else int(diff))
+        columns['bonus'].append(BONUS_CODES[hand.bonus])
+
+    def _write(self):
+        arrays = dict([(name, numpy.array(values, dtype=self._DTYPES[name]))
+                       for (name, values) in self.__columns.items()])
+        for name in ('player', 'banker'):
+            arrays[name] = arrays[name].reshape(-1, 3)
+        for name in self.COLUMNS:
+            with self.__zip.open("%05d_%s.npy" % (self.__chunk, name),
+                                 'w', force_zip64=True) as member:
+                numpy.lib.format.write_array(member, arrays[name],
+                                             allow_pickle=False)
+        self.__chunk += 1
+        self.__clear()
+
+    def _close(self):
+        self.__zip.close()
+
+    # -------------------------------------------------------------------------
+# end class NpzSink
+
+
+def load_npz(filespec):
+    '''!
+    Read an NpzSink file back.
+    @param filespec file written by NpzSink
+    @return dict of column name to numpy array, all chunks joined
+    '''
+    if numpy is None:
+        raise ImportError("pybaccarat.sinks.load_npz requires numpy")
+    with numpy.load(filespec) as data:
+        # "%05d_name" grows past 5 digits, so sort by chunk number
+        chunks = {}
+        for member in data.files:
+            (chunk, name) = member.split("_", 1)
+            chunks.setdefault(name, []).append((int(chunk), member))
+        columns = {}
+        for name in NpzSink.COLUMNS:
+            parts = [data[member]
+                     for (_, member) in sorted(chunks.get(name, []))]
+            if parts:
+                columns[name] = numpy.concatenate(parts)
+            else:
+                columns[name] = numpy.zeros(
+                    (0, 3) if name in ('player', 'banker') else 0,
+                    dtype=NpzSink._DTYPES[name])
+    return columns
+
+# END
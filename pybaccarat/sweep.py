@@ -0,0 +1,260 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.sweep
+This module plays a baccarat system over a grid of its parameters.
+
+The shoes are compiled to outcome tapes once (see pybaccarat.tape). Every
+grid point is a system object built with its own parameters, and all of
+them play each tape together on one replay: the hands are decoded and the
+scoreboards marked once per tape, not once per grid point. The tapes are
+cut into chunks played on a pool of processes and the totals are merged
+in chunk order, so a sweep gives the same table for any number of
+processes. As in montecarlo, every shoe starts new system objects.
+
+The totals kept for each grid point depend on the system:
+<ul compact>
+<li>BaccSys (George1, ValSys, ...): won, lost, tied, money</li>
+<li>EZDragon: won, lost and money, the Dragon bet paying 40 to 1</li>
+<li>Dragon: p_money, b_money, plays from Dragon.get_money()</li>
+</ul>
+
+Example usage:
+@code{.py}
+    from pybaccarat.sweep import grid, sweep
+    from pybaccarat.tape import compile_run
+    tapes = compile_run(2018, 2000)
+    result = sweep("George1", grid(size=[2, 3, 4], later_size=[3, 4, 5]),
+                   tapes)
+    print(result.table(sort_by="money"))
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import itertools
+import multiprocessing
+
+from pybaccarat import baccaratsystems
+from pybaccarat.montecarlo import _KEYBOARD_SYSTEMS
+from pybaccarat.tape import replay_system
+
+_DRAGON_PAYS = 40.0  # EZ-Baccarat Dragon 7 pays 40 to 1
+
+
+def grid(**axes):
+    '''!
+    Every combination of the values of some parameters.
+
+    Example usage:
+    @code{.py}
+        grid(size=[2, 3], later_size=[4])
+        # [{'later_size': 4, 'size': 2}, {'later_size': 4, 'size': 3}]
+    @endcode
+
+    @param axes parameter name = list of values
+    @return list of dict, parameter name to value, the last name (in
+        sorted order) changing fastest
+    '''
+    names = sorted(axes)
+    return [dict(zip(names, values))
+            for values in itertools.product(*[axes[n] for n in names])]
+
+
+def _system_class(name):
+    '''!
+    Internal use only.
+    @return the class of baccaratsystems named <em>name</em>
+    @exception ValueError
+        If there is no such system, or it reads the keyboard.
+    '''
+    system_class = getattr(baccaratsystems, name, None)
+    if system_class in (baccaratsystems.Dragon, baccaratsystems.EZDragon):
+        return system_class
+    if not isinstance(system_class, type) or \
+       not issubclass(system_class, baccaratsystems.BaccSys) or \
+       issubclass(system_class, _KEYBOARD_SYSTEMS):
+        raise ValueError("system(%s) not a legal value" % str(name))
+    return system_class
+
+
+def _metrics(system):
+    '''!
+    Internal use only.
+    @return list of the totals of a system after a shoe
+    '''
+    if isinstance(system, baccaratsystems.Dragon):
+        return list(system.get_money())
+    if isinstance(system, baccaratsystems.EZDragon):
+        return [system.play_w, system.play_l,
+                _DRAGON_PAYS * system.play_w - system.play_l]
+    return [system.won, system.lost, system.tied, system.money]
+
+
+def _metric_names(system_class):
+    '''!
+    Internal use only.
+    @return tuple of the names of the totals _metrics() gives
+    '''
+    if system_class is baccaratsystems.Dragon:
+        return ("p_money", "b_money", "plays")
+    if system_class is baccaratsystems.EZDragon:
+        return ("won", "lost", "money")
+    return ("won", "lost", "tied", "money")
+
+
+def play_tapes(system_name, points, tapes):
+    '''!
+    Play every grid point over some tapes.
+    @param system_name String class name in baccaratsystems
+    @param points list of dict of constructor parameters
+    @param tapes list of tape.OutcomeTape
+    @return list, for each point, of the list of totals
+    '''
+    system_class = _system_class(system_name)
+    totals = [[0] * len(_metric_names(system_class)) for _ in points]
+    for tape in tapes:
+        systems = [system_class(**point) for point in points]
+        replay_system(tape, systems)
+        for (point_totals, system) in zip(totals, systems):
+            for (i, value) in enumerate(_metrics(system)):
+                point_totals[i] += value
+    return totals
+
+
+def _play_tapes(args):
+    '''!
+    Internal use only. play_tapes() for Pool.imap().
+    '''
+    return play_tapes(*args)
+
+
+class SweepResult(object):
+    '''!
+    The totals of every grid point of a sweep.
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, system_name, points, names, totals, shoes):
+        '''!
+        @param system_name String class name of the system
+        @param points list of dict of parameters
+        @param names tuple of the names of the totals
+        @param totals list, for each point, of the list of totals
+        @param shoes <em>int</em> shoes played by every point
+        '''
+        self.system_name = system_name
+        self.points = points
+        self.names = names
+        self.totals = totals
+        self.shoes = shoes
+
+    # -------------------------------------------------------------------------
+    def rows(self):
+        '''!
+        @return list of (parameters dict, totals dict), one per grid point
+        '''
+        return [(point, dict(zip(self.names, totals)))
+                for (point, totals) in zip(self.points, self.totals)]
+
+    # -------------------------------------------------------------------------
+    def best(self, metric="money"):
+        '''!
+        @param metric name of a total
+        @return (parameters dict, totals dict) of the point with the
+            highest <em>metric</em>, the first one on a tie
+        @exception ValueError
+            If there are no points or <em>metric</em> is not a total.
+        '''
+        if metric not in self.names or not self.points:
+            raise ValueError("metric(%s) not a legal value" % str(metric))
+        index = self.names.index(metric)
+        best = max(range(len(self.points)),
+                   key=lambda i: (self.totals[i][index], -i))
+        return self.rows()[best]
+
+    # -------------------------------------------------------------------------
+    def table(self, sort_by=None):
+        '''!
+        @param sort_by name of a total to sort the rows by, highest first,
+            None for grid order
+        @return multi-line String, a header line and one line per point
+        @exception ValueError
+            If <em>sort_by</em> is not a total.
+        '''
+        order = list(range(len(self.points)))
+        if sort_by is not None:
+            if sort_by not in self.names:
+                raise ValueError("sort_by(%s) not a legal value" %
+                                 str(sort_by))
+            index = self.names.index(sort_by)
+            order.sort(key=lambda i: -self.totals[i][index])
+        params = sorted(set([n for p in self.points for n in p]))
+        width = dict([(n, max([len(n)] + [len(str(p.get(n, "")))
+                                          for p in self.points]))
+                      for n in params])
+        lines = ["Sys(%s) shoes(%d)" % (self.system_name, self.shoes),
+                 " ".join(["%*s" % (width[n], n) for n in params] +
+                          ["%10s" % n for n in self.names])]
+        for i in order:
+            cells = ["%*s" % (width[n], str(self.points[i].get(n, "")))
+                     for n in params]
+            for value in self.totals[i]:
+                if isinstance(value, float):
+                    cells.append("%+10.2f" % value)
+                else:
+                    cells.append("%10d" % value)
+            lines.append(" ".join(cells))
+        return "\n".join(lines)
+
+    # -------------------------------------------------------------------------
+# end class SweepResult
+
+
+def sweep(system_name, points, tapes, processes=None, chunk_size=50):
+    '''!
+    Play a system with each set of parameters over the same tapes.
+    @param system_name String class name in baccaratsystems, such as
+        "George1"
+    @param points list of dict of constructor parameters, see grid()
+    @param tapes list of tape.OutcomeTape, see tape.compile_run()
+    @param processes <em>int</em> worker processes, None for one per CPU,
+        1 to play in this process
+    @param chunk_size <em>int</em> tapes per chunk sent to a worker
+    @return SweepResult
+    @exception ValueError
+        If the system, a parameter or <em>chunk_size</em> is not a legal
+        value.
+    '''
+    system_class = _system_class(system_name)
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk_size(%s) not a legal value" % str(chunk_size))
+    points = [dict(point) for point in points]
+    for point in points:
+        try:
+            system_class(**point)
+        except TypeError:
+            raise ValueError("point(%s) not a legal value" % str(point))
+    names = _metric_names(system_class)
+    totals = [[0] * len(names) for _ in points]
+    chunks = [(system_name, points, tapes[first:first + chunk_size])
+              for first in range(0, len(tapes), chunk_size)]
+    pool = None
+    if processes != 1 and len(chunks) > 1:
+        pool = multiprocessing.Pool(processes)
+        # in order, so floating point money adds up the same every run
+        results = pool.imap(_play_tapes, chunks)
+    else:
+        results = (_play_tapes(chunk) for chunk in chunks)
+    try:
+        for chunk_totals in results:
+            for (point_totals, more) in zip(totals, chunk_totals):
+                for i in range(len(names)):
+                    point_totals[i] += more[i]
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    return SweepResult(system_name, points, names, totals, len(tapes))
+
+# END
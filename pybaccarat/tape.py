@@ -0,0 +1,353 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.tape
+This module compiles shoes into outcome tapes and replays them.
+
+A baccarat system only sees the results of the hands, the cards of each
+hand and the scoreboards. An OutcomeTape keeps exactly that for one shoe,
+packed in a byte array, so a system can be tested on the same shoes over
+and over without shuffling or dealing a card again. A tape has the burn
+(the cards burned, the shown card first) and one record of RECORD_SIZE
+bytes per hand:
+<ul compact>
+<li>win code: 0 banker, 1 player, 2 tie (the codes of resolver)</li>
+<li>diff code: 0 to 9, DIFF_NATURAL for a natural</li>
+<li>bonus code: 0 none, 1 P8, 2 D7</li>
+<li>cards consumed by the hand, 4 to 6</li>
+<li>the 3 player and 3 banker Card ordinals, NO_CARD when unused</li>
+<li>13 running rank counts: the cards of each rank, ace to king, dealt
+    before the hand, burned cards included</li>
+</ul>
+
+compile_shoe() plays a shoe once with Game.simulate_shoe() and packs the
+result. replay() sends a tape to HandObserver objects the way
+simulate_shoe() does, with Hand objects rebuilt from the stored cards, and
+replay_system() drives a BaccSys through a tape with the same trackers, so
+the system ends with the same results as if it had played the shoe.
+save_tapes() and load_tapes() keep a list of tapes in a file.
+
+Example usage:
+@code{.py}
+    from pybaccarat.baccaratsystems import George1
+    from pybaccarat.tape import compile_run, replay_system
+    tapes = compile_run(2018, 1000)
+    money = 0.0
+    for tape in tapes:
+        system = George1()
+        replay_system(tape, system)
+        money += system.money
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import array
+import struct
+
+from pybaccarat.baccarat import Game, Hand, HandResult, ShoeResult, \
+    _system_observers
+from pybaccarat.playingcards import DECK
+from pybaccarat.resolver import BONUS_CODES, BONUS_STRINGS, NO_CARD, \
+    WIN_CODES, WIN_LETTERS, card_ordinals
+from pybaccarat.seeding import make_shoe
+
+RECORD_SIZE = 23  ##!< RECORD_SIZE bytes per hand in a tape
+DIFF_NATURAL = 10  ##!< DIFF_NATURAL diff code of a natural ("n")
+_WIN = 0  # offsets in a record
+_DIFF = 1
+_BONUS = 2
+_CARDS = 3
+_PLAYER = 4
+_BANKER = 7
+_COUNTS = 10
+_DIFF_STRINGS = "0123456789n"
+_MAGIC = b"PBTAPE"
+_FORMAT = 1
+_HEADER = struct.Struct("<6sHH")  # magic, format, record size
+_TAPE_HEADER = struct.Struct("<BI")  # burned cards, hands
+
+
+class OutcomeTape(object):
+    '''!
+    The packed outcome of every hand of one shoe. Build one with
+    compile_shoe() or compile_result().
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self, burned, records):
+        '''!
+        @param burned array('B') of the burned Card ordinals, the shown
+            card first
+        @param records array('B') of RECORD_SIZE bytes per hand
+        @exception ValueError
+            If <em>records</em> is not a whole number of records.
+        '''
+        if len(records) % RECORD_SIZE != 0:
+            raise ValueError("records(%d bytes) not a legal length" %
+                             len(records))
+        self.burned = burned
+        self.records = records
+
+    # -------------------------------------------------------------------------
+    def __len__(self):
+        '''!
+        @return number of hands
+        '''
+        return len(self.records) // RECORD_SIZE
+
+    # -------------------------------------------------------------------------
+    def __eq__(self, other):
+        return isinstance(other, OutcomeTape) and \
+            self.burned == other.burned and self.records == other.records
+
+    def __ne__(self, other):
+        return not self == other
+
+    # -------------------------------------------------------------------------
+    def burned_cards(self):
+        '''!
+        @return tuple of the burned Cards, the shown card first
+        '''
+        return tuple([DECK[o] for o in self.burned])
+
+    # -------------------------------------------------------------------------
+    def wins(self):
+        '''!
+        @return String of the win letters of the hands, such as "BBPT..."
+        '''
+        return "".join([WIN_LETTERS[w]
+                        for w in self.records[_WIN::RECORD_SIZE]])
+
+    # -------------------------------------------------------------------------
+    def hand(self, index):
+        '''!
+        @param index <em>int</em> hand index, 0 for the first hand
+        @return HandResult as Game.simulate_shoe() gives
+        '''
+        records = self.records
+        base = index * RECORD_SIZE
+        return HandResult(
+            tuple([DECK[o] for o in records[base + _PLAYER:base + _BANKER]
+                   if o != NO_CARD]),
+            tuple([DECK[o] for o in records[base + _BANKER:base + _COUNTS]
+                   if o != NO_CARD]),
+            WIN_LETTERS[records[base + _WIN]],
+            _DIFF_STRINGS[records[base + _DIFF]],
+            BONUS_STRINGS[records[base + _BONUS]])
+
+    # -------------------------------------------------------------------------
+    def hands(self):
+        '''!
+        The hands are decoded on every call and not kept, so a tape only
+        holds its packed bytes; replay() decodes once per replay.
+        @return list of HandResult, one per hand
+        '''
+        records = self.records
+        hands = []
+        for base in range(0, len(records), RECORD_SIZE):
+            (win, diff, bonus, _, p1, p2, p3, b1, b2, b3) = \
+                records[base:base + _COUNTS]
+            player = (DECK[p1], DECK[p2]) if p3 == NO_CARD else \
+                (DECK[p1], DECK[p2], DECK[p3])
+            banker = (DECK[b1], DECK[b2]) if b3 == NO_CARD else \
+                (DECK[b1], DECK[b2], DECK[b3])
+            hands.append(HandResult(player, banker, WIN_LETTERS[win],
+                                    _DIFF_STRINGS[diff],
+                                    BONUS_STRINGS[bonus]))
+        return hands
+
+    # -------------------------------------------------------------------------
+    def cards_consumed(self, index):
+        '''!
+        @param index <em>int</em> hand index, 0 for the first hand
+        @return number of cards dealt in the hand, 4 to 6
+        '''
+        return self.records[index * RECORD_SIZE + _CARDS]
+
+    # -------------------------------------------------------------------------
+    def counts(self, index):
+        '''!
+        @param index <em>int</em> hand index, 0 for the first hand
+        @return tuple of 13 counts, the cards of each rank (ace first)
+            dealt before the hand, burned cards included
+        '''
+        base = index * RECORD_SIZE + _COUNTS
+        return tuple(self.records[base:base + 13])
+
+    # -------------------------------------------------------------------------
+    def to_result(self):
+        '''!
+        @return ShoeResult of the tape, for Game.render() and the sinks
+        '''
+        return ShoeResult(self.burned_cards(), list(self.hands()))
+
+    # -------------------------------------------------------------------------
+# end class OutcomeTape
+
+
+def compile_result(result):
+    '''!
+    Pack a shoe played by Game.simulate_shoe().
+    @param result ShoeResult
+    @return OutcomeTape
+    @exception ValueError
+        If a running rank count does not fit in a byte (over 63 decks).
+    '''
+    counts = [0] * 14  # by rank, 0 unused
+    for card in result.burned_cards:
+        counts[card.get_rank()] += 1
+    records = array.array('B')
+    for hand in result.hands:
+        records.append(WIN_CODES[hand.win])
+        records.append(_DIFF_STRINGS.index(hand.diff))
+        records.append(BONUS_CODES[hand.bonus])
+        records.append(len(hand.player) + len(hand.banker))
+        records.extend(card_ordinals(hand.player))
+        records.extend(card_ordinals(hand.banker))
+        try:
+            records.extend(counts[1:])
+        except OverflowError:
+            raise ValueError("result(%d cards of a rank) not a legal value" %
+                             max(counts))
+        for card in hand.player + hand.banker:
+            counts[card.get_rank()] += 1
+    return OutcomeTape(
+        array.array('B', [c.get_ordinal() for c in result.burned_cards]),
+        records)
+
+
+def compile_shoe(shoe, cut_card=-14):
+    '''!
+    Play a shoe once and pack its outcome.
+    @param shoe Shoe (or ArrayShoe, VirtualShoe), shuffled
+    @param cut_card <em>int</em> cut card position, see Shoe.set_cut_card()
+    @return OutcomeTape
+    '''
+    return compile_result(Game(shoe=shoe).simulate_shoe(cut_card))
+
+
+def compile_run(root_seed, shoe_count, number_decks=8, cut_card=-14,
+                first=0):
+    '''!
+    Compile the shoes of a seeded run, shoe <em>k</em> shuffled by
+    seeding.make_shoe(root_seed, k) as montecarlo does.
+    @param root_seed <em>int</em> seed of the run
+    @param shoe_count <em>int</em> number of shoes
+    @param number_decks <em>int</em> decks per shoe
+    @param cut_card <em>int</em> cut card position, see Shoe.set_cut_card()
+    @param first <em>int</em> number of the first shoe
+    @return list of OutcomeTape
+    '''
+    game = None
+    tapes = []
+    for index in range(first, first + shoe_count):
+        shoe = make_shoe(root_seed, index, number_decks)
+        if game is None:
+            game = Game(shoe=shoe)
+        game.set_shoe(shoe)
+        tapes.append(compile_result(game.simulate_shoe(cut_card)))
+    return tapes
+
+
+def replay(tape, observers):
+    '''!
+    Send a tape to observers as Game.simulate_shoe() would send the shoe.
+    The player and banker Hands given to hand_post() hold the cards of the
+    hand; no card is dealt.
+    @param tape OutcomeTape
+    @param observers list of HandObserver
+    '''
+    burned_cards = list(tape.burned_cards())
+    for observer in observers:
+        observer.new_shoe(burned_cards)
+    player = Hand()
+    banker = Hand()
+    hand_number = 0
+    for hand in tape.hands():
+        hand_number += 1
+        player.empty()
+        banker.empty()
+        for observer in observers:
+            observer.hand_pre(hand_number)
+        for card in hand.player:
+            player.add(card)
+        for card in hand.banker:
+            banker.add(card)
+        for observer in observers:
+            observer.hand_post(hand_number, hand, player, banker)
+    for observer in observers:
+        observer.end_shoe()
+
+
+def replay_system(tape, system):
+    '''!
+    Play a baccarat system, or a list of systems sharing the boards,
+    through a tape, with the scoreboards, ties and BPT counts
+    Game.simulate_shoe() gives it. The results are left in the system
+    objects.
+    @param tape OutcomeTape
+    @param system baccaratsystems.BaccSys, or a list of systems
+    @exception ValueError
+        If a system forces the cards (JustBoards).
+    '''
+    if not isinstance(system, (list, tuple)):
+        system = [system]
+    replay(tape, _system_observers(system))
+
+
+def _bytes(values):
+    '''!
+    Internal use only.
+    @return the bytes of an array, tobytes() was tostring() in Python 2
+    '''
+    if hasattr(values, 'tobytes'):
+        return values.tobytes()
+    return values.tostring()
+
+
+def save_tapes(filespec, tapes):
+    '''!
+    Write tapes to a file.
+    @param filespec file to write
+    @param tapes list of OutcomeTape
+    '''
+    with open(filespec, 'wb') as out:
+        out.write(_HEADER.pack(_MAGIC, _FORMAT, RECORD_SIZE))
+        for tape in tapes:
+            out.write(_TAPE_HEADER.pack(len(tape.burned), len(tape)))
+            out.write(_bytes(tape.burned))
+            out.write(_bytes(tape.records))
+
+
+def load_tapes(filespec):
+    '''!
+    Read the tapes written by save_tapes().
+    @param filespec file to read
+    @return list of OutcomeTape
+    @exception ValueError
+        If the file is not a tape file of this format.
+    '''
+    with open(filespec, 'rb') as tape_file:
+        data = tape_file.read()
+    if len(data) < _HEADER.size or \
+       _HEADER.unpack_from(data) != (_MAGIC, _FORMAT, RECORD_SIZE):
+        raise ValueError("filespec(%s) not a version %d tape file" %
+                         (filespec, _FORMAT))
+    tapes = []
+    offset = _HEADER.size
+    while offset < len(data):
+        if offset + _TAPE_HEADER.size > len(data):
+            raise ValueError("filespec(%s) is truncated" % filespec)
+        (burned_count, hands) = _TAPE_HEADER.unpack_from(data, offset)
+        offset += _TAPE_HEADER.size
+        end = offset + burned_count + hands * RECORD_SIZE
+        if end > len(data):
+            raise ValueError("filespec(%s) is truncated" % filespec)
+        burned = array.array('B', data[offset:offset + burned_count])
+        records = array.array('B', data[offset + burned_count:end])
+        tapes.append(OutcomeTape(burned, records))
+        offset = end
+    return tapes
+
+# END
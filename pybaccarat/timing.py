@@ -0,0 +1,289 @@
+#!/usr/bin/python
+
+'''!
+@package pybaccarat.timing
+This module measures where the time of a Baccarat run goes.
+
+A PhaseTimer, while it runs, replaces the methods that make up a hand with
+timed copies: the shoe deal methods, Game.play_hand() (the hand
+resolution), the Scoreboard and Ties methods, the side count, the
+HandObserver events, the events of the baccarat systems and
+the Game display methods. stop() puts the original methods back, so a
+program that never starts a timer runs exactly the code it did before.
+
+Each phase is named "Class.method" and counts its calls, the time spent in
+the method itself (not in the timed methods it calls) and the total time
+including those. The self times of all phases and the untimed rest add up
+to the elapsed time. The number of hands is the number of
+Game.play_hand() calls.
+
+Only one timer runs at a time. The timed copies are put in the classes,
+so every thread runs them, but only the calls made by the thread that
+started the timer are counted; other threads, such as the refill thread
+of a ShoePool, run them untimed. The worker processes of montecarlo.run()
+are not timed; use processes=1.
+
+Example usage:
+@code{.py}
+    from pybaccarat.baccarat import Game
+    from pybaccarat.timing import PhaseTimer
+    game = Game()
+    with PhaseTimer() as timer:
+        for _ in range(100):
+            game.simulate_shoe()
+    print(timer.report())
+    seconds = timer.phases()["Scoreboard.mark"].seconds
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+'''
+
+import collections
+import time
+try:
+    from threading import get_ident as _get_ident
+except ImportError:  # Python 2
+    from thread import get_ident as _get_ident
+
+from pybaccarat import baccarat, baccaratsystems, playingcards
+
+##!< PhaseTime one phase of PhaseTimer.phases(): the number of calls, the
+# seconds spent in the method itself and the seconds including the timed
+# methods it called.
+PhaseTime = collections.namedtuple('PhaseTime', 'calls seconds total_seconds')
+
+_clock = getattr(time, 'perf_counter', time.time)
+_active = []  # the running PhaseTimer, if any
+_HAND_PHASE = "Game.play_hand"
+_EVENTS = ('new_shoe', 'hand_pre', 'hand_post', 'end_shoe')
+
+
+def _subclasses(parent):
+    '''!
+    Internal use only.
+    @return <em>parent</em> and every class derived from it
+    '''
+    classes = [parent]
+    for child in parent.__subclasses__():
+        classes += _subclasses(child)
+    return classes
+
+
+def _targets():
+    '''!
+    Internal use only.
+    @return list of (owner, attribute name, phase name) to time
+    '''
+    targets = []
+    for shoe_class in (playingcards.Shoe, playingcards.ArrayShoe,
+                       playingcards.VirtualShoe):
+        for name in ('deal', 'deal_many'):
+            targets.append((shoe_class, name,
+                            "%s.%s" % (shoe_class.__name__, name)))
+    game = baccarat.Game
+    targets += [
+        (game, 'play_hand', _HAND_PHASE),
+        (game, '_Game__burn', "Game.burn"),
+        (game, '_Game__burn_line', "Game.burn_line"),
+        (game, '_Game__print_hand', "Game.print_hand"),
+        (game, '_Game__print_end', "Game.print_end"),
+        (baccarat.Scoreboard, 'mark', "Scoreboard.mark"),
+        (baccarat.Scoreboard, 'get_cs_mark', "Scoreboard.get_cs_mark"),
+        (baccarat.Scoreboard, 'get_peek_B_array',
+         "Scoreboard.get_peek_B_array"),
+        (baccarat.Scoreboard, 'print_lines', "Scoreboard.print_lines"),
+        (baccarat.BoardTracker, 'peek_b', "BoardTracker.peek_b"),
+        (baccarat.Ties, 'mark', "Ties.mark"),
+        (baccarat, '_side_count', "side_count")]
+    for observer_class in _subclasses(baccarat.HandObserver):
+        for name in _EVENTS:
+            targets.append((observer_class, name,
+                            "%s.%s" % (observer_class.__name__, name)))
+    for system_class in [baccaratsystems.Dragon, baccaratsystems.EZDragon] + \
+            _subclasses(baccaratsystems.BaccSys):
+        for name in _EVENTS:
+            targets.append((system_class, name,
+                            "%s.%s" % (system_class.__name__, name)))
+    # only what the owner defines itself, inherited methods are timed in
+    # the class that defines them
+    return [(owner, name, phase) for (owner, name, phase) in targets
+            if name in vars(owner)]
+
+
+class PhaseTimer(object):
+    '''!
+    Collect the calls and time of each phase of a hand while running.
+    Starting and stopping again adds to the counts; reset() clears them.
+    '''
+
+    # -------------------------------------------------------------------------
+    def __init__(self):
+        '''!
+        Create a stopped timer with no counts.
+        '''
+        self.__saved = []
+        self.__phases = {}
+        self.__stack = []
+        self.__thread = None
+        self.__elapsed = 0.0
+        self.__started = 0.0
+
+    # -------------------------------------------------------------------------
+    def reset(self):
+        '''!
+        Clear the counts and the elapsed time. A running timer goes on
+        running from zero.
+        '''
+        # in place, the timed methods of a running timer hold these lists
+        for counts in self.__phases.values():
+            counts[:] = [0, 0.0, 0.0]
+        self.__elapsed = 0.0
+        self.__started = _clock()
+
+    # -------------------------------------------------------------------------
+    def __wrap(self, function, phase):
+        '''!
+        Internal use only.
+        @return a copy of <em>function</em> adding its calls and time to
+            <em>phase</em>
+        '''
+        stack = self.__stack
+        thread = self.__thread
+        counts = self.__phases.setdefault(phase, [0, 0.0, 0.0])
+
+        def timed(*args, **kwargs):
+            if _get_ident() != thread:
+                # another thread, not timed; the stack is this thread's
+                return function(*args, **kwargs)
+            # the top of the stack sums the time of the timed calls made
+            # by this one, which is not self time
+            stack.append(0.0)
+            start = _clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = _clock() - start
+                inner = stack.pop()
+                counts[0] += 1
+                counts[1] += elapsed - inner
+                counts[2] += elapsed
+                if stack:
+                    stack[-1] += elapsed
+        return timed
+
+    # -------------------------------------------------------------------------
+    def start(self):
+        '''!
+        Start timing: replace the methods of every phase with timed copies
+        that count the calls made by this thread.
+        @exception ValueError
+            If a timer is already running.
+        '''
+        if _active:
+            raise ValueError("a PhaseTimer is already running")
+        self.__thread = _get_ident()
+        for (owner, name, phase) in _targets():
+            original = vars(owner)[name]
+            if isinstance(original, staticmethod):
+                timed = staticmethod(self.__wrap(original.__func__, phase))
+            else:
+                timed = self.__wrap(original, phase)
+            self.__saved.append((owner, name, original))
+            setattr(owner, name, timed)
+        _active.append(self)
+        self.__started = _clock()
+
+    # -------------------------------------------------------------------------
+    def stop(self):
+        '''!
+        Stop timing and put the original methods back.
+        '''
+        if self not in _active:
+            return
+        self.__elapsed += _clock() - self.__started
+        for (owner, name, original) in reversed(self.__saved):
+            setattr(owner, name, original)
+        self.__saved = []
+        _active.remove(self)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # -------------------------------------------------------------------------
+    def is_running(self):
+        '''!
+        @return True between start() and stop()
+        '''
+        return self in _active
+
+    # -------------------------------------------------------------------------
+    def elapsed(self):
+        '''!
+        @return seconds timed, including a run in progress
+        '''
+        if self.is_running():
+            return self.__elapsed + _clock() - self.__started
+        return self.__elapsed
+
+    # -------------------------------------------------------------------------
+    def phases(self):
+        '''!
+        @return dict of phase name to PhaseTime, for phases called at least
+            once
+        '''
+        return dict([(phase, PhaseTime(*counts))
+                     for (phase, counts) in self.__phases.items()
+                     if counts[0]])
+
+    # -------------------------------------------------------------------------
+    def hands(self):
+        '''!
+        @return number of hands played while timing
+        '''
+        return self.__phases.get(_HAND_PHASE, [0])[0]
+
+    # -------------------------------------------------------------------------
+    def hands_per_second(self):
+        '''!
+        @return hands played per second of elapsed time, 0.0 before any
+        '''
+        elapsed = self.elapsed()
+        if elapsed <= 0.0:
+            return 0.0
+        return self.hands() / elapsed
+
+    # -------------------------------------------------------------------------
+    def report(self):
+        '''!
+        @return multi-line String, one line per phase by most self time:
+            calls, self seconds, percent of elapsed, microseconds per call
+            and total seconds
+        '''
+        elapsed = self.elapsed()
+        percent = 100.0 / max(elapsed, 1e-9)
+        phases = self.phases()
+        lines = ["hands(%d) seconds(%.3f) hands/sec(%.0f)" %
+                 (self.hands(), elapsed, self.hands_per_second()),
+                 "%-30s %10s %9s %6s %9s %9s" %
+                 ("phase", "calls", "self", "%", "us/call", "total")]
+        names = sorted(phases, key=lambda n: (-phases[n].seconds, n))
+        for name in names:
+            phase = phases[name]
+            lines.append("%-30s %10d %9.3f %6.2f %9.3f %9.3f" %
+                         (name, phase.calls, phase.seconds,
+                          phase.seconds * percent,
+                          1e6 * phase.seconds / phase.calls,
+                          phase.total_seconds))
+        other = elapsed - sum([p.seconds for p in phases.values()])
+        lines.append("%-30s %10s %9.3f %6.2f" %
+                     ("(not timed)", "", other, other * percent))
+        return "\n".join(lines)
+
+    # -------------------------------------------------------------------------
+# end class PhaseTimer
+
+# END
@@ -31,6 +31,8 @@ setup(
     maintainer_email='fulkgl@gmail.com',
     license='MIT',
     packages=['pybaccarat'],
+    # numpy is only needed by the batch/vectorized modules
+    extras_require={'numpy': ['numpy>=1.20']},
     keywords=['baccarat','game','playing cards','cards','card game',],
     scripts=['play_baccarat_interactive.py',],
     zip_safe=False,
@@ -0,0 +1,158 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the ArrayShoe class.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_array_shoe.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest,array
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.playingcards import ArrayShoe,Shoe
+from pybaccarat.playingcards import Card,get_card
+
+
+class TestArrayShoe(unittest.TestCase):
+    '''
+    unit test ArrayShoe class
+    '''
+    def test_constructor(self):
+        '''
+        ArrayShoe(8), custom shoes and bad values
+        '''
+        shoe = ArrayShoe(8)
+        self.assertEqual(416, len(shoe.get_ordinals()), "416 byte shoe")
+        shoe = ArrayShoe([Card(43), Card(44), Card(45)])
+        self.assertEqual(b"\x2b\x2c\x2d", shoe.get_ordinals(), "custom")
+        shoe = ArrayShoe(bytearray([43, 44]))
+        self.assertTrue(shoe.deal() is get_card(43), "from ordinals")
+        with self.assertRaises(ValueError):
+            ArrayShoe(13)
+        with self.assertRaises(ValueError):
+            ArrayShoe(bytearray([52]))
+        with self.assertRaises(ValueError):
+            ArrayShoe("8")
+        shoe = ArrayShoe(array.array('B', [5, 6]))
+        self.assertEqual(b"\x05\x06", shoe.get_ordinals(), "array('B')")
+        with self.assertRaises(ValueError):
+            ArrayShoe(array.array('i', [5, 6]))
+
+    def test_deal(self):
+        '''!
+        deal() hands out the shared Cards in order, then None
+        '''
+        shoe = ArrayShoe(8)
+        for i in range(8 * 52):
+            self.assertTrue(shoe.deal() is get_card(i % 52), "card %d" % i)
+        self.assertIsNone(shoe.deal(), "empty")
+        shoe.reset()
+        self.assertEqual(0, shoe.deal_ordinal(), "ordinal Ac after reset")
+
+    def test_composition(self):
+        '''
+        same counters as Shoe
+        '''
+        shoe = Shoe(8, rng=3)
+        array_shoe = ArrayShoe(8, rng=3)
+        shoe.shuffle()
+        array_shoe.shuffle()
+        for _ in range(50):
+            shoe.deal()
+            array_shoe.deal_ordinal()
+        self.assertEqual(shoe.get_composition(), array_shoe.get_composition(),
+                         "same composition")
+        shoe = array_shoe
+        self.assertEqual(366, shoe.cards_remaining(), "366 left")
+        shoe.force_cards([get_card(9, 's')])
+        self.assertEqual(366, sum(shoe.get_composition()), "forced")
+        self.assertEqual("9s", str(shoe.deal()), "forced card dealt")
+
+    def test_deal_many(self):
+        '''!
+        deal_many(), peek() and their ordinal versions
+        '''
+        shoe = ArrayShoe(1)
+        self.assertEqual(b"\x00\x01\x02", shoe.peek_ordinals(3), "peek")
+        self.assertEqual(Shoe(1).peek(3), shoe.peek(3), "same as Shoe")
+        self.assertEqual(b"\x00\x01", shoe.deal_ordinals(2), "deal 2")
+        self.assertEqual("3c", str(shoe.deal_many(1)[0]), "deal_many")
+        self.assertEqual(49, sum(shoe.get_composition()), "49 left")
+        self.assertEqual(49, len(shoe.deal_ordinals(60)), "short at end")
+        with self.assertRaises(ValueError):
+            shoe.deal_many(-1)
+
+    def test_shuffle(self):
+        '''
+        shuffle keeps the same cards in a new order
+        '''
+        shoe = ArrayShoe(8)
+        before = shoe.get_ordinals()
+        shoe.shuffle()
+        after = shoe.get_ordinals()
+        self.assertNotEqual(before, after, "post-shuffle")
+        self.assertEqual(sorted(before), sorted(after), "same cards")
+        shoe.shuffle(lazy=True)
+        shoe.reshuffle(lazy=True)
+        self.assertEqual(sorted(before), sorted(shoe.get_ordinals()),
+                         "lazy is accepted")
+
+    def test_cut_card(self):
+        '''
+        set_cut_card() and cut_card_seen()
+        '''
+        shoe = ArrayShoe(8)
+        self.assertTrue(shoe.cut_card_seen(), "new shoe cut card 0")
+        shoe.set_cut_card(1)
+        self.assertFalse(shoe.cut_card_seen(), "position 1 no deal")
+        shoe.deal()
+        self.assertTrue(shoe.cut_card_seen(), "after 1 dealt")
+        with self.assertRaises(ValueError):
+            shoe.set_cut_card(987)
+        with self.assertRaises(ValueError):
+            shoe.set_cut_card(-987)
+
+    def test_discard_adjust_baccarat(self):
+        '''
+        same discard order as Shoe
+        '''
+        for type in ("2P2B", "3P2B", "2P3B", "3P3B"):
+            shoe = Shoe(1)
+            array_shoe = ArrayShoe(1)
+            for _ in range(6):
+                shoe.deal()
+                array_shoe.deal()
+            shoe.discard_adjust_baccarat(type)
+            array_shoe.discard_adjust_baccarat(type)
+            shoe.reset()
+            array_shoe.reset()
+            for _ in range(6):
+                self.assertTrue(shoe.deal() is array_shoe.deal(), type)
+
+    def test_save_load_shoe(self):
+        '''!
+        save_shoe() writes the same text as Shoe, load_shoe() reads it back
+        '''
+        temp1 = os.sep + 'tmp' + os.sep + 'ut_array1.shoe'
+        temp2 = os.sep + 'tmp' + os.sep + 'ut_array2.shoe'
+        ArrayShoe(8).save_shoe(temp1)
+        Shoe(8).save_shoe(temp2)
+        with open(temp1, 'r') as f1, open(temp2, 'r') as f2:
+            self.assertEqual(f2.read(), f1.read(), "same text format")
+        shoe = ArrayShoe(0)
+        shoe.load_shoe(temp1)
+        self.assertEqual(ArrayShoe(8).get_ordinals(), shoe.get_ordinals(),
+                         "load back")
+        os.remove(temp1)
+        os.remove(temp2)
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
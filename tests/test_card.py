@@ -23,7 +23,7 @@ python tests\test_card.py TestCard.test_constructor
 
 import os,sys,unittest
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
-from pybaccarat.playingcards import Card
+from pybaccarat.playingcards import Card,DECK,get_card
 
 
 class TestCard(unittest.TestCase):
@@ -154,6 +154,26 @@ class TestCard(unittest.TestCase):
         # ...
         # Ks = 51
 
+    def test_point(self):
+        '''
+        test get_point method
+        '''
+        expected = [1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 0, 0, 0]
+        for rank in range(1, 14):
+            for suit in 'cdhs':
+                self.assertEqual(expected[rank - 1],
+                                 Card(rank, suit).get_point(),
+                                 "point of rank %d" % rank)
+
+    def test_slots(self):
+        '''
+        Card instances have no per-instance __dict__
+        '''
+        c5s = Card(5, 's')
+        self.assertFalse(hasattr(c5s, '__dict__'), "no __dict__")
+        with self.assertRaises(AttributeError):
+            c5s.face_up = False
+
     def test_tostring(self):
         '''
         test __str__ method
@@ -316,6 +336,30 @@ class TestCard(unittest.TestCase):
         self.assertTrue(h1 == card3.__hash__(), "card 1 and 3 same value")
         self.assertFalse(h1 == card2.__hash__(), "card 1 and 2 diff")
 
+    def test_get_card(self):
+        '''
+        get_card() returns the shared interned Cards
+        '''
+        self.assertEqual(52, len(DECK), "52 canonical cards")
+        for i in range(52):
+            self.assertEqual(i, DECK[i].get_ordinal(), "DECK[%d]" % i)
+        card5s = get_card(43)
+        self.assertTrue(card5s is DECK[43], "by ordinal")
+        self.assertTrue(card5s is get_card(5, 's'), "by rank and suit")
+        self.assertTrue(card5s is get_card('5s'), "by name")
+        self.assertTrue(card5s is get_card(' 5S '), "by odd spelling")
+        self.assertTrue(card5s == Card(5, 's'), "equal to a new Card")
+        self.assertTrue(get_card('Tc') is get_card(10, 'c'), "ten of clubs")
+        # errors come from the Card constructor
+        try:
+            get_card(66)
+            self.fail("expected a failure get_card(66)")
+        except ValueError as ex:
+            self.assertEqual("new_ordinal(66) not in legal range 0..51",
+                             str(ex))
+        with self.assertRaises(ValueError):
+            get_card('5x')
+
     def test_inherit(self):
         '''
         inheritted things from object:
@@ -0,0 +1,111 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the pybaccarat.checkpoint module and montecarlo resume.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_checkpoint.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest,shutil,tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat import montecarlo
+from pybaccarat.checkpoint import load_checkpoint, save_checkpoint
+
+
+class TestCheckpoint(unittest.TestCase):
+    '''
+    Unit test for save_checkpoint(), load_checkpoint() and run() resume.
+    '''
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.filespec = os.path.join(self.folder, "run.ckpt")
+        self.play_chunk = montecarlo._play_chunk
+
+    def tearDown(self):
+        montecarlo._play_chunk = self.play_chunk
+        shutil.rmtree(self.folder)
+
+    def test_save_load(self):
+        '''
+        a checkpoint reads back, replaces the old one, leaves no temp file
+        '''
+        self.assertIsNone(load_checkpoint(self.filespec))
+        save_checkpoint(self.filespec, {'done': 1})
+        save_checkpoint(self.filespec, {'done': 2, 'seed': 7})
+        self.assertEqual({'done': 2, 'seed': 7},
+                         load_checkpoint(self.filespec))
+        self.assertEqual(["run.ckpt"], os.listdir(self.folder))
+        # a value that can not be pickled keeps the old checkpoint
+        self.assertRaises(Exception, save_checkpoint, self.filespec,
+                          {'done': lambda: 3})
+        self.assertEqual(2, load_checkpoint(self.filespec)['done'])
+        self.assertEqual(["run.ckpt"], os.listdir(self.folder))
+
+    def test_bad_file(self):
+        '''
+        a file that is not a checkpoint
+        '''
+        with open(self.filespec, 'w') as bad_file:
+            bad_file.write("not a checkpoint")
+        self.assertRaises(ValueError, load_checkpoint, self.filespec)
+
+    def test_resume(self):
+        '''
+        a run stopped part way and resumed equals a run that never stopped
+        '''
+        whole = montecarlo.run(10, root_seed=3, processes=1, chunk_size=2,
+                               systems=["George1", "ValSys"])
+        calls = []
+
+        def crash(args):
+            if len(calls) == 3:
+                raise KeyboardInterrupt()
+            calls.append(args[1])
+            return self.play_chunk(args)
+        montecarlo._play_chunk = crash
+        self.assertRaises(KeyboardInterrupt, montecarlo.run, 10,
+                          root_seed=3, processes=1, chunk_size=2,
+                          systems=["George1", "ValSys"],
+                          checkpoint=self.filespec, checkpoint_every=2)
+        state = load_checkpoint(self.filespec)
+        self.assertEqual(2, state['chunks_done'])
+        self.assertEqual(4, state['tally'].shoes)
+
+        # resume, without the seed: only the chunks not saved are played
+        calls[:] = []
+        montecarlo._play_chunk = lambda args: calls.append(args[1]) or \
+            self.play_chunk(args)
+        resumed = montecarlo.run(10, processes=1, chunk_size=2,
+                                 systems=["George1", "ValSys"],
+                                 checkpoint=self.filespec,
+                                 checkpoint_every=2)
+        self.assertEqual([4, 6, 8], calls)
+        self.assertEqual(3, resumed.root_seed)
+        self.assertEqual(whole.report(), resumed.report())
+        self.assertEqual(5, load_checkpoint(self.filespec)['chunks_done'])
+
+    def test_other_run(self):
+        '''
+        a checkpoint is not used for a run with other settings
+        '''
+        montecarlo.run(4, root_seed=3, processes=1, chunk_size=2,
+                       checkpoint=self.filespec)
+        self.assertRaises(ValueError, montecarlo.run, 6, root_seed=3,
+                          processes=1, chunk_size=2, checkpoint=self.filespec)
+        self.assertRaises(ValueError, montecarlo.run, 4, root_seed=4,
+                          processes=1, chunk_size=2, checkpoint=self.filespec)
+        self.assertRaises(ValueError, montecarlo.run, 4, root_seed=3,
+                          processes=1, chunk_size=2, checkpoint_every=0)
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
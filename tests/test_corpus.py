@@ -0,0 +1,121 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the corpus module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_corpus.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.corpus import CorpusWriter,ShoeCorpus,HEADER_SIZE
+from pybaccarat.corpus import text_to_corpus,corpus_to_text
+from pybaccarat.playingcards import ArrayShoe,Shoe
+from pybaccarat.seeding import make_shoe
+
+TEMP = os.sep + 'tmp' + os.sep
+
+
+def delete_file(filespec):
+    '''!
+    Delete a file if it exists.
+    @param filespec file to delete
+    '''
+    if os.path.exists(filespec):
+        os.remove(filespec)
+
+
+class TestCorpus(unittest.TestCase):
+    '''
+    unit test CorpusWriter and ShoeCorpus
+    '''
+    def test_write_read(self):
+        '''
+        shoes written are read back by index and by iteration
+        '''
+        filespec = TEMP + 'ut1.pbsc'
+        shoes = [make_shoe(5, k).get_ordinals() for k in range(10)]
+        with CorpusWriter(filespec, 8) as writer:
+            writer.append(make_shoe(5, 0))
+            for data in shoes[1:]:
+                writer.append(ArrayShoe(bytearray(data)))
+        self.assertEqual(HEADER_SIZE + 10 * 416, os.path.getsize(filespec),
+                         "file size")
+        with ShoeCorpus(filespec) as corpus:
+            self.assertEqual(10, len(corpus), "10 shoes")
+            self.assertEqual(8, corpus.number_decks, "8 decks")
+            self.assertEqual(shoes[7], bytes(corpus[7]), "random access")
+            self.assertEqual(shoes[9], bytes(corpus[-1]), "negative index")
+            self.assertTrue(isinstance(corpus[0], memoryview), "zero copy")
+            self.assertEqual(shoes, [bytes(s) for s in corpus], "iterate")
+            shoe = corpus.get_shoe(3)
+            self.assertEqual(shoes[3], shoe.get_ordinals(), "get_shoe")
+            with self.assertRaises(IndexError):
+                corpus[10]
+        delete_file(filespec)
+
+    def test_close_with_views(self):
+        '''
+        closing after iterating, with views still held, closes the file
+        '''
+        filespec = TEMP + 'ut4.pbsc'
+        with CorpusWriter(filespec, 1) as writer:
+            for k in range(3):
+                writer.append(make_shoe(1, k, 1))
+        with ShoeCorpus(filespec) as corpus:
+            held = corpus[1]
+            for raw in corpus:
+                self.assertEqual(52, len(raw), "shoe size")
+        with self.assertRaises(ValueError):
+            bytes(held)
+        with self.assertRaises(ValueError):
+            bytes(raw)
+        corpus.close()
+        delete_file(filespec)
+
+    def test_bad_input(self):
+        '''
+        wrong shoe sizes and non-corpus files are rejected
+        '''
+        filespec = TEMP + 'ut2.pbsc'
+        with CorpusWriter(filespec, 1) as writer:
+            with self.assertRaises(ValueError):
+                writer.append(Shoe(2))
+            with self.assertRaises(ValueError):
+                writer.append(bytearray(52 * [52]))
+        with ShoeCorpus(filespec) as corpus:
+            self.assertEqual(0, len(corpus), "empty corpus")
+        with open(filespec, 'wb') as f:
+            f.write(b"not a corpus file at all")
+        with self.assertRaises(ValueError):
+            ShoeCorpus(filespec)
+        delete_file(filespec)
+
+    def test_text_convert(self):
+        '''
+        text shoes round trip through a corpus
+        '''
+        texts = [TEMP + 'ut_text%d.shoe' % k for k in range(3)]
+        for k in range(3):
+            make_shoe(9, k).save_shoe(texts[k])
+        filespec = TEMP + 'ut3.pbsc'
+        self.assertEqual(3, text_to_corpus(texts, filespec), "3 converted")
+        written = corpus_to_text(filespec, TEMP + 'ut_back%d.shoe')
+        for k in range(3):
+            with open(texts[k]) as f1, open(written[k]) as f2:
+                self.assertEqual(f1.read(), f2.read(), "shoe %d" % k)
+            delete_file(texts[k])
+            delete_file(written[k])
+        delete_file(filespec)
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the Game class.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_game.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest,io
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.baccarat import Game, HandResult, ShoeResult, \
+    Hand, HandObserver, BptCounter, TieTracker, BoardTracker, SideCounter
+from pybaccarat.baccaratsystems import Dragon, EZDragon, George1, ValSys
+from pybaccarat.playingcards import Shoe
+from pybaccarat.resolver import resolve
+
+
+def seeded_shoe(seed):
+    '''
+    Return a shuffled 8 deck shoe.
+    '''
+    shoe = Shoe(8, rng=seed)
+    shoe.shuffle()
+    return shoe
+
+
+def captured(function, *args):
+    '''
+    Return what function(*args) prints.
+    '''
+    saved = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        function(*args)
+        return sys.stdout.getvalue()
+    finally:
+        sys.stdout = saved
+
+
+class TestGame(unittest.TestCase):
+    '''
+    Unit test for the Game class.
+    '''
+
+    def test_simulate_shoe(self):
+        '''
+        the records hold every card dealt, in order
+        '''
+        shoe = seeded_shoe(5)
+        cards = shoe.peek(416)
+        game = Game(shoe=shoe)
+        self.assertEqual("", captured(game.simulate_shoe))
+        result = game.simulate_shoe()
+        self.assertIsInstance(result, ShoeResult)
+        burn = min(10, cards[0].get_rank())
+        self.assertEqual(cards[:burn + 1], result.burned_cards)
+        dealt = list(result.burned_cards)
+        count_d7 = 0
+        for hand in result.hands:
+            self.assertIsInstance(hand, HandResult)
+            order = [hand.player[0], hand.banker[0],
+                     hand.player[1], hand.banker[1]]
+            # a player third card is dealt before a banker third card
+            order += list(hand.player[2:]) + list(hand.banker[2:])
+            points = [c.get_point() for c in cards[len(dealt):len(dealt) + 6]]
+            (win, diff, bonus, used) = resolve(points)
+            self.assertEqual((win, diff, bonus), hand[2:5])
+            self.assertEqual(used, len(order))
+            self.assertEqual(cards[len(dealt):len(dealt) + used],
+                             tuple(order))
+            dealt += order
+            if bonus == "D7":
+                count_d7 += 1
+        self.assertEqual(count_d7, game.count_d7)
+        # the last hand starts after the cut card is seen
+        self.assertTrue(len(dealt) - used >= 416 - 14)
+        self.assertTrue(len(dealt) - used - 6 < 416 - 14)
+
+    def test_render(self):
+        '''
+        play() prints the same as simulate_shoe() then render()
+        '''
+        for show_burn_cards in (False, True):
+            played = captured(Game(shoe=seeded_shoe(9)).play, True,
+                              show_burn_cards)
+            game = Game(shoe=seeded_shoe(9))
+            result = game.simulate_shoe()
+            self.assertEqual(played, captured(game.render, result,
+                                              show_burn_cards))
+            lines = played.splitlines()
+            self.assertTrue(lines[0].startswith("burn("))
+            self.assertEqual(len(result.hands),
+                             len([l for l in lines if l[:2].isdigit()]))
+            self.assertEqual(1, lines.count("last hand of this shoe"))
+        self.assertEqual("", captured(Game(shoe=seeded_shoe(9)).play, False))
+
+
+    def test_observers(self):
+        '''
+        observers are told of every shoe and hand, in the order added
+        '''
+        events = []
+
+        class Recorder(HandObserver):
+            def __init__(self, name):
+                self.name = name
+
+            def new_shoe(self, burned_cards):
+                events.append((self.name, "new_shoe", len(burned_cards)))
+
+            def hand_pre(self, hand_number):
+                events.append((self.name, "pre", hand_number))
+                return ""
+
+            def hand_post(self, hand_number, hand, player, banker):
+                events.append((self.name, "post", hand_number, hand.win,
+                               player.get_cards() == hand.player))
+                return ""
+
+            def end_shoe(self):
+                events.append((self.name, "end"))
+                return ""
+
+        game = Game(shoe=seeded_shoe(2))
+        first = Recorder("a")
+        game.add_observer(first)
+        game.add_observer(Recorder("b"))
+        result = game.simulate_shoe()
+        count = len(result.hands)
+        self.assertEqual(2 + 4 * count + 2, len(events))
+        self.assertEqual(("a", "new_shoe", len(result.burned_cards)),
+                         events[0])
+        self.assertEqual(("b", "pre", 1), events[3])
+        self.assertEqual(("a", "post", count, result.hands[-1].win, True),
+                         events[-4])
+        self.assertEqual(("b", "end"), events[-1])
+        game.remove_observer(first)
+        self.assertRaises(ValueError, game.remove_observer, first)
+        del events[:]
+        game.simulate_shoe()
+        self.assertEqual(set(["b"]), set([e[0] for e in events]))
+
+    def test_trackers(self):
+        '''
+        the trackers agree with the hand records
+        '''
+        game = Game(shoe=seeded_shoe(4))
+        bpt = BptCounter()
+        ties = TieTracker()
+        boards = BoardTracker()
+        counts = SideCounter()
+        for tracker in (bpt, ties, boards, counts):
+            game.add_observer(tracker)
+        result = game.simulate_shoe()
+        wins = [hand.win for hand in result.hands]
+        self.assertEqual(wins.count("B"), bpt.bpt['B'])
+        self.assertEqual(wins.count("T"), bpt.bpt['T'])
+        self.assertTrue(len(boards.boards[0].get_array()) > 1)
+        self.assertEqual(3, len(boards.peek_b()))
+        (rc1, rc2) = (0, 0)
+        for hand in result.hands:
+            for cards in (hand.player, hand.banker):
+                whole = Hand()
+                for card in cards:
+                    whole.add(card)
+                (rc1, rc2) = game.side_count(whole, rc1, rc2)
+        self.assertEqual((rc1, rc2), (counts.rc1, counts.rc2))
+        # a second shoe starts from zero
+        result = game.simulate_shoe()
+        self.assertEqual(len(result.hands), sum(bpt.bpt.values()))
+
+    def test_system_observer(self):
+        '''
+        a system is played the same with or without other observers
+        '''
+        alone = ValSys()
+        Game(shoe=seeded_shoe(6), system=alone).simulate_shoe()
+        observed = ValSys()
+        game = Game(shoe=seeded_shoe(6), system=observed)
+        game.add_observer(BoardTracker())
+        game.simulate_shoe()
+        self.assertEqual(alone.end_shoe(), observed.end_shoe())
+        self.assertTrue(alone.won + alone.lost > 0)
+
+    def test_systems(self):
+        '''
+        systems sharing one deal end as each would alone
+        '''
+        george = George1()
+        val = ValSys()
+        dragon = Dragon()
+        game = Game(shoe=seeded_shoe(8), system=george,
+                    systems=[val, dragon])
+        game.simulate_shoe()
+        self.assertIs(george.scoreboards, val.scoreboards)
+        for (shared, system_class) in ((george, George1), (val, ValSys)):
+            alone = system_class()
+            Game(shoe=seeded_shoe(8), system=alone).simulate_shoe()
+            self.assertEqual(alone.end_shoe(), shared.end_shoe())
+        # a card count system counts the shown burn card and every card
+        result = Game(shoe=seeded_shoe(8)).simulate_shoe()
+        expected = Dragon()
+        expected.new_shoe(result.burned_cards[:1])
+        for hand in result.hands:
+            for card in hand.player + hand.banker:
+                expected.update_count(card.get_point())
+        self.assertEqual(expected.dragon_count, dragon.dragon_count)
+        self.assertEqual(len(result.hands), dragon.hand_number)
+
+    def test_systems_two_shoes(self):
+        '''
+        card count systems start each shoe of one Game from hand 0
+        '''
+        dragon = Dragon()
+        ez = EZDragon()
+        game = Game(shoe=seeded_shoe(8), systems=[dragon, ez])
+        game.simulate_shoe()
+        game.set_shoe(seeded_shoe(9))
+        result = game.simulate_shoe()
+        dragon_alone = Dragon()
+        ez_alone = EZDragon()
+        Game(shoe=seeded_shoe(9),
+             systems=[dragon_alone, ez_alone]).simulate_shoe()
+        self.assertEqual(len(result.hands), dragon.hand_number)
+        self.assertEqual(len(result.hands), ez.hand_number)
+        self.assertEqual(dragon_alone.get_money(), dragon.get_money())
+        self.assertEqual((ez_alone.play_w, ez_alone.play_l),
+                         (ez.play_w, ez.play_l))
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
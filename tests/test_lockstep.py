@@ -0,0 +1,144 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the pybaccarat.lockstep module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_lockstep.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.baccarat import Game, Hand
+from pybaccarat.playingcards import Shoe, get_card
+try:
+    import numpy
+    from pybaccarat.shoebatch import generate_shoes, shoe_from_row
+    from pybaccarat.lockstep import simulate_shoes, simulate_totals, \
+        resolve_hands, NO_HAND, WIN_LETTERS, BONUS_STRINGS
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestLockstep(unittest.TestCase):
+    '''
+    Unit test for simulate_shoes().
+    '''
+
+    def game_hands(self, row, cut_card=-14):
+        '''
+        Play one row with Game.
+        '''
+        game = Game(shoe=shoe_from_row(row))
+        result = game.simulate_shoe(cut_card)
+        return [(h.win, h.diff, h.bonus) for h in result.hands]
+
+    def test_matches_game(self):
+        '''
+        every hand of every shoe matches Game, for several cut cards
+        '''
+        for (number_decks, cut_card) in ((8, -14), (8, 200), (6, -60),
+                                         (1, -10), (8, 0)):
+            shoes = generate_shoes(60, number_decks, seed=number_decks)
+            result = simulate_shoes(shoes, cut_card)
+            for i, row in enumerate(shoes):
+                self.assertEqual(self.game_hands(row, cut_card),
+                                 result.hands(i))
+            count = result.hand_count
+            self.assertTrue((result.win[numpy.arange(60), count] ==
+                             NO_HAND).all())
+
+    def test_totals(self):
+        '''
+        totals agree with the per hand arrays and add up across chunks
+        '''
+        shoes = generate_shoes(50, 8, seed=11)
+        totals = simulate_shoes(shoes).totals()
+        self.assertEqual(totals['hands'],
+                         totals['B'] + totals['P'] + totals['T'])
+        game_totals = {'B': 0, 'P': 0, 'T': 0, 'D7': 0, 'P8': 0}
+        for row in shoes:
+            for (win, diff, bonus) in self.game_hands(row):
+                game_totals[win] += 1
+                if bonus != "  ":
+                    game_totals[bonus] += 1
+        for key in game_totals:
+            self.assertEqual(game_totals[key], totals[key])
+        self.assertEqual(simulate_totals(50, 8, seed=11, chunk_size=50),
+                         simulate_totals(50, 8, seed=11, chunk_size=7))
+        self.assertEqual(0, simulate_totals(0)['hands'])
+
+    def test_errors(self):
+        '''
+        bad arguments, and a shoe without a cut card runs out of cards
+        '''
+        shoes = generate_shoes(3, 1, seed=1)
+        self.assertRaises(ValueError, simulate_shoes, shoes[0])
+        self.assertRaises(ValueError, simulate_shoes, shoes, 53)
+        self.assertRaises(ValueError, simulate_shoes, shoes, "x")
+        self.assertRaises(ValueError, simulate_shoes, shoes, 52)
+        self.assertRaises(ValueError, self.game_hands, shoes[0], 52)
+        self.assertRaises(ValueError, simulate_totals, 1, chunk_size=0)
+
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestResolveHands(unittest.TestCase):
+    '''
+    Unit test for resolve_hands().
+    '''
+
+    def test_matches_play_hand(self):
+        '''
+        every first 4 ranks, with random third cards, against Hand and
+        Game.play_hand()
+        '''
+        rng = numpy.random.default_rng(16)
+        first = numpy.indices((13, 13, 13, 13)).reshape(4, -1).T + 1
+        rows = numpy.hstack([first, rng.integers(1, 14, (len(first), 2))])
+        batch = resolve_hands(rows, ranks=True)
+        points = numpy.where(rows > 9, 0, rows)
+        self.assertEqual(batch.win.tolist(),
+                         resolve_hands(points).win.tolist())
+        for i in range(0, len(rows), 7):
+            cards = [get_card(int(r), 's') for r in rows[i]]
+            player = Hand()
+            banker = Hand()
+            game = Game(shoe=Shoe(cards), player=player, banker=banker)
+            (win, diff, bonus) = game.play_hand()
+            self.assertEqual(win, WIN_LETTERS[batch.win[i]])
+            self.assertEqual(bonus, BONUS_STRINGS[batch.bonus[i]])
+            self.assertEqual(diff == "n", batch.natural[i])
+            self.assertEqual(player.value(), batch.player_total[i])
+            self.assertEqual(banker.value(), batch.banker_total[i])
+            self.assertEqual(player.get_card(2) is not None,
+                             batch.player_drew[i])
+            self.assertEqual(banker.get_card(2) is not None,
+                             batch.banker_drew[i])
+
+    def test_short_rows(self):
+        '''
+        4 or 5 columns are enough when no hand needs more
+        '''
+        batch = resolve_hands([[8, 0, 0, 0], [7, 0, 0, 7]])
+        self.assertEqual([True, False], batch.natural.tolist())
+        self.assertEqual([1, 2], batch.win.tolist())
+        self.assertRaises(ValueError, resolve_hands, [[1, 1, 1, 1]])
+        self.assertRaises(ValueError, resolve_hands, [[1, 1, 1, 1, 1]])
+        self.assertRaises(ValueError, resolve_hands, [1, 1, 1, 1, 1, 1])
+        self.assertRaises(ValueError, resolve_hands, [[1, 1, 1, 1, 1, 10]])
+        self.assertRaises(ValueError, resolve_hands, [[0, 1, 1, 1, 1, 1]],
+                          True)
+        self.assertEqual(0, len(resolve_hands(numpy.zeros((0, 6))).win))
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the pybaccarat.montecarlo module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_montecarlo.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.baccarat import Game
+from pybaccarat.montecarlo import Tally, play_chunk, run
+from pybaccarat.seeding import make_shoe
+
+
+class TestMonteCarlo(unittest.TestCase):
+    '''
+    Unit test for run(), play_chunk() and Tally.
+    '''
+
+    def test_play_chunk(self):
+        '''
+        a chunk counts every hand of its shoes
+        '''
+        tally = play_chunk(7, 3, 4)
+        self.assertEqual(4, tally.shoes)
+        hands = 0
+        wins = {'B': 0, 'P': 0, 'T': 0}
+        for index in range(3, 7):
+            result = Game(shoe=make_shoe(7, index)).simulate_shoe()
+            hands += len(result.hands)
+            for hand in result.hands:
+                wins[hand.win] += 1
+        self.assertEqual(hands, tally.hands)
+        self.assertEqual(wins, tally.wins)
+        self.assertEqual(hands, sum(tally.diffs.values()))
+
+    def test_merge(self):
+        '''
+        merged chunks equal one big chunk
+        '''
+        whole = play_chunk(11, 0, 6, systems=["ValSys"])
+        merged = Tally().merge(play_chunk(11, 0, 2, systems=["ValSys"]))
+        merged.merge(play_chunk(11, 2, 4, systems=["ValSys"]))
+        self.assertEqual(whole.report(), merged.report())
+        self.assertEqual(6, merged.shoes)
+
+    def test_run(self):
+        '''
+        totals do not depend on the processes or the chunk size
+        '''
+        one = run(12, root_seed=5, processes=1, chunk_size=12,
+                  systems=["George1"])
+        two = run(12, root_seed=5, processes=2, chunk_size=5,
+                  systems=["George1"])
+        self.assertEqual(one.report(), two.report())
+        self.assertEqual(5, two.root_seed)
+        self.assertEqual(12, two.shoes)
+        self.assertIsNotNone(run(1).root_seed)
+        self.assertEqual(0, run(0, root_seed=1).hands)
+
+    def test_errors(self):
+        '''
+        bad arguments
+        '''
+        self.assertRaises(ValueError, run, -1)
+        self.assertRaises(ValueError, run, 1, chunk_size=0)
+        self.assertRaises(ValueError, run, 1, systems=["NoSuchSystem"])
+        self.assertRaises(ValueError, run, 1, systems=["Game"])
+        self.assertRaises(ValueError, run, 1, systems=["JustBoards"])
+        self.assertRaises(ValueError, run, 1, systems=["Interactive"])
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the pybaccarat.resolver module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_resolver.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest,random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.baccarat import Hand
+from pybaccarat.playingcards import get_card
+from pybaccarat.resolver import resolve, NATURALS, OUTCOMES, \
+    card_ordinals, BONUS_CODES, BONUS_STRINGS, NO_CARD, WIN_CODES, \
+    WIN_LETTERS
+
+
+def card_of(point):
+    '''
+    Return a Card with the given point, a ten for 0.
+    '''
+    if point == 0:
+        point = 10
+    return get_card(point, 's')
+
+
+def reference(points):
+    '''
+    Resolve a hand the long way, with Hand objects and the drawing rules
+    as Game.play_hand() had them before the resolver tables.
+    '''
+    player = Hand()
+    banker = Hand()
+    cards = [card_of(p) for p in points]
+    player.add(cards[0])
+    banker.add(cards[1])
+    player.add(cards[2])
+    banker.add(cards[3])
+    used = 4
+    diff = "n"
+    bonus = "  "
+    if not player.is_natural() and not banker.is_natural():
+        diff = "0"
+        if player.need_hit(None):
+            player.add(cards[used])
+            used += 1
+        if banker.need_hit(player):
+            banker.add(cards[used])
+            used += 1
+    if banker.value() < player.value():
+        win = "P"
+        if not player.is_natural():
+            diff = str(player.value() - banker.value())
+        if player.value() == 8 and player.get_card(2) is not None:
+            bonus = "P8"
+    elif banker.value() > player.value():
+        win = "B"
+        if not banker.is_natural():
+            diff = str(banker.value() - player.value())
+        if banker.value() == 7 and banker.get_card(2) is not None:
+            bonus = "D7"
+    else:
+        win = "T"
+    return (win, diff, bonus, used)
+
+
+class TestResolver(unittest.TestCase):
+    '''
+    Unit test for the resolver tables.
+    '''
+
+    def test_tables(self):
+        '''
+        table sizes
+        '''
+        self.assertEqual(100, len(NATURALS))
+        self.assertEqual(36, len([n for n in NATURALS if n is not None]))
+        self.assertEqual(400, len(OUTCOMES))
+
+    def test_codes(self):
+        '''
+        win and bonus codes and stored card ordinals
+        '''
+        for (code, win) in enumerate(WIN_LETTERS):
+            self.assertEqual(code, WIN_CODES[win])
+        for (code, bonus) in enumerate(BONUS_STRINGS):
+            self.assertEqual(code, BONUS_CODES[bonus])
+        self.assertEqual([0, 51, NO_CARD],
+                         card_ordinals((get_card(1, 'c'), get_card(13, 's'))))
+        self.assertEqual([12, 13, 14], card_ordinals(
+            (get_card(13, 'c'), get_card(1, 'd'), get_card(2, 'd'))))
+
+    def test_examples(self):
+        '''
+        a few hands worked by hand
+        '''
+        self.assertEqual(("P", "n", "  ", 4), resolve([4, 0, 4, 7]))
+        self.assertEqual(("T", "n", "  ", 4), resolve([8, 8, 0, 0]))
+        self.assertEqual(("B", "n", "  ", 4), resolve([7, 9, 0, 0]))
+        self.assertEqual(("T", "0", "  ", 4), resolve([7, 6, 0, 1]))
+        self.assertEqual(("B", "4", "D7", 6), resolve([3, 0, 0, 3, 0, 4]))
+        self.assertEqual(("P", "1", "P8", 5), resolve([2, 3, 2, 4, 4, 0]))
+        # banker 3 stands on a player third card of 8
+        self.assertEqual(("B", "3", "  ", 5), resolve([1, 3, 1, 0, 8, 9]))
+        # player stands on 6, banker 5 draws
+        self.assertEqual(("B", "1", "D7", 5), resolve([6, 5, 0, 0, 2]))
+        self.assertRaises(IndexError, resolve, [1, 1, 1, 1])
+
+    def test_reference(self):
+        '''
+        every first four points, with random third cards
+        '''
+        rng = random.Random(13)
+        for i in range(10000):
+            points = [i // 1000, (i // 100) % 10, (i // 10) % 10, i % 10]
+            for _ in range(3):
+                hand = points + [rng.randrange(10), rng.randrange(10)]
+                self.assertEqual(reference(hand), resolve(hand), str(hand))
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
@@ -480,6 +480,28 @@ class TestScoreboard(unittest.TestCase):
         # __repr__  (<method-wrapper '__repr__' of Card object at 0x0336FD50>)
         # __sizeof__(<built-in method __sizeof__ of Card object at 0x02A08F70>)
 
+    def test_lines(self):
+        '''
+        the lines are rendered from the board when asked for
+        '''
+        b2 = Scoreboard(2, table_size=3)
+        for marker in "ssCCsX":
+            b2.mark(marker)
+        lines = b2.lines
+        self.assertEqual(4, len(lines))
+        self.assertEqual("....v....1....v....2....v....3....v....4" +
+                         "....v....5....v....6 R2", lines[0])
+        self.assertEqual("sCs" + 57 * " " + "  3", lines[1])
+        self.assertEqual("sC " + 57 * " " + "  2", lines[2])
+        self.assertEqual(60 * " " + "  0", lines[3])
+        self.assertEqual("".join([l + "\n" for l in lines]),
+                         b2.print_lines())
+        # changing the list returned does not change the board
+        lines[1] = ""
+        self.assertEqual("sCs", b2.lines[1][:3])
+        self.assertEqual([[3, 2, 0], [['s', 2], ['C', 2], ['s', 1]]],
+                         [b2.get_horiz_count(), b2.get_array()[1:]])
+
     # @todo usage examples
 
 
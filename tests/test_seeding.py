@@ -0,0 +1,100 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the seeding module and seeded Shoe shuffles.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_seeding.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest,random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.playingcards import Shoe,ArrayShoe
+from pybaccarat.seeding import SeedStream,shoe_rng,make_shoe
+
+
+def deal_all(shoe):
+    '''!
+    Return the whole shoe as a string.
+    '''
+    cards = ""
+    card = shoe.deal()
+    while card is not None:
+        cards += str(card)
+        card = shoe.deal()
+    return cards
+
+
+class TestSeeding(unittest.TestCase):
+    '''
+    unit test SeedStream and seeded shoes
+    '''
+    def test_shoe_seed(self):
+        '''
+        Shoe(rng=seed) shuffles the same way every time
+        '''
+        shoe1 = Shoe(8, rng=99)
+        shoe1.shuffle()
+        shoe2 = Shoe(8, rng=random.Random(99))
+        shoe2.shuffle()
+        self.assertEqual(deal_all(shoe1), deal_all(shoe2), "same seed")
+        shoe3 = Shoe(8, rng=100)
+        shoe3.shuffle()
+        shoe1.reset()
+        self.assertNotEqual(deal_all(shoe1), deal_all(shoe3), "other seed")
+        array_shoe = ArrayShoe(8, rng=99)
+        array_shoe.shuffle()
+        shoe1.reset()
+        self.assertEqual(deal_all(shoe1), deal_all(array_shoe), "ArrayShoe")
+        with self.assertRaises(ValueError):
+            Shoe(8, rng="seed")
+        with self.assertRaises(ValueError):
+            shoe1.set_rng(1.5)
+
+    def test_spawn(self):
+        '''
+        spawned children are distinct, reproducible and never repeat
+        '''
+        root = SeedStream(12345)
+        first = root.spawn(4)
+        second = root.spawn(4)
+        seeds = set([c.seed() for c in first + second])
+        self.assertEqual(8, len(seeds), "8 distinct children")
+        self.assertFalse(root.seed() in seeds, "parent differs")
+        self.assertEqual((5,), second[1].spawn_key, "keys continue")
+        again = SeedStream(12345).spawn(8)
+        self.assertEqual([c.seed() for c in first + second],
+                         [c.seed() for c in again], "reproducible")
+        grandchild = first[0].spawn(1)[0]
+        self.assertEqual((0, 0), grandchild.spawn_key, "grandchild key")
+        self.assertFalse(grandchild.seed() in seeds, "grandchild distinct")
+        self.assertNotEqual(SeedStream(1).seed(), SeedStream(2).seed(),
+                            "roots differ")
+        with self.assertRaises(ValueError):
+            SeedStream(-1)
+        with self.assertRaises(ValueError):
+            SeedStream(1, (1, -1))
+
+    def test_make_shoe(self):
+        '''
+        a shoe is regenerated from (root_seed, shoe_index)
+        '''
+        shoe = make_shoe(777, 41)
+        self.assertEqual(deal_all(make_shoe(777, 41)), deal_all(shoe),
+                         "regenerated")
+        self.assertNotEqual(deal_all(make_shoe(777, 42)),
+                            deal_all(make_shoe(777, 41)), "next shoe")
+        self.assertEqual(shoe_rng(777, 41).random(),
+                         SeedStream(777).child(41).random().random(),
+                         "shoe_rng is child stream")
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
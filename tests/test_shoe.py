@@ -24,6 +24,9 @@ import os,sys,unittest
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
 from pybaccarat.playingcards import Shoe
 from pybaccarat.playingcards import Card
+from pybaccarat.playingcards import get_card
+from pybaccarat.playingcards import ArrayShoe
+from pybaccarat.playingcards import iter_shoes, ShoeFormatError
 
 
 def delete_file(filespec):
@@ -97,6 +100,86 @@ class TestShoe(unittest.TestCase):
             cards += str(shoe.deal())
         self.assertNotEqual(expected_clubs, cards, "post-shuffle")
 
+    def test_interned_cards(self):
+        '''
+        shoes are built from the shared Cards, not new Card objects
+        '''
+        shoe = Shoe(8)
+        for i in range(8 * 52):
+            card = shoe.deal()
+            self.assertTrue(card is get_card(i % 52), "card %d shared" % i)
+        shoe = Shoe("PBT")
+        self.assertTrue(shoe.deal() is get_card(1, 's'), "scripted As")
+
+    def test_composition(self):
+        '''
+        get_composition(), cards_remaining(), decks_remaining()
+        '''
+        shoe = Shoe(8)
+        shoe.shuffle()
+        self.assertEqual(13 * (32,), shoe.get_composition(), "full shoe")
+        self.assertEqual(416, shoe.cards_remaining(), "416 cards")
+        self.assertEqual(8.0, shoe.decks_remaining(), "8 decks")
+        expected = 13 * [32]
+        for _ in range(100):
+            expected[shoe.deal().get_rank() - 1] -= 1
+        self.assertEqual(tuple(expected), shoe.get_composition(), "dealt")
+        self.assertEqual(316, shoe.cards_remaining(), "316 cards")
+        shoe.shuffle()
+        self.assertEqual(316, sum(shoe.get_composition()), "mid shoe shuffle")
+        shoe.reset()
+        self.assertEqual(416, sum(shoe.get_composition()), "after reset")
+        # unshuffled, the next card is the Ac, force a 9s in its place
+        shoe = Shoe(1)
+        shoe.force_cards([get_card(9, 's')])
+        expected = 13 * [4]
+        expected[0] = 3
+        expected[8] = 5
+        self.assertEqual(tuple(expected), shoe.get_composition(), "forced")
+        self.assertEqual("9s", str(shoe.deal()), "forced card dealt")
+        expected[8] = 4
+        self.assertEqual(tuple(expected), shoe.get_composition(), "dealt 9s")
+        shoe = Shoe(0)
+        self.assertEqual(13 * (0,), shoe.get_composition(), "empty shoe")
+        with self.assertRaises(ValueError):
+            shoe.force_cards([get_card(1)])
+
+    def test_lazy_shuffle(self):
+        '''
+        shuffle(lazy=True) deals a uniform random permutation
+        '''
+        shoe = Shoe(8, rng=21)
+        shoe.shuffle(lazy=True)
+        shoe.set_cut_card(-14)
+        cards = [shoe.deal() for _ in range(20)]
+        self.assertNotEqual("Ac2c3c4c5c", "".join([str(c) for c in cards[:5]]),
+                            "shuffled")
+        shoe.reset()
+        again = [shoe.deal() for _ in range(20)]
+        self.assertEqual(cards, again, "reset keeps the dealt positions")
+        for _ in range(396):
+            shoe.deal()
+        self.assertEqual(13 * (0,), shoe.get_composition(), "all dealt")
+        self.assertEqual(sorted(Shoe(8).get_ordinals()),
+                         sorted(shoe.get_ordinals()), "same 416 cards")
+
+        # chi-square test of the first and the fifth card of a single deck
+        trials = 52 * 200
+        first = 52 * [0]
+        fifth = 52 * [0]
+        shoe = Shoe(1, rng=8)
+        for _ in range(trials):
+            shoe.shuffle(lazy=True)
+            first[shoe.deal().get_ordinal()] += 1
+            for _ in range(3):
+                shoe.deal()
+            fifth[shoe.deal().get_ordinal()] += 1
+            shoe.reset()
+        for name, counts in (("first", first), ("fifth", fifth)):
+            chi2 = sum([(c - 200.0) ** 2 / 200.0 for c in counts])
+            # 51 degrees of freedom, p=0.001 critical value is 87.97
+            self.assertTrue(chi2 < 87.97, "%s card chi2(%.1f)" % (name, chi2))
+
     def test_set_cut_card(self):
         '''
         test method set_cut_card(int)
@@ -152,6 +235,36 @@ class TestShoe(unittest.TestCase):
         card1 = shoe2.deal()
         self.assertIsNone(card1, "fourth of shoe2 (empty)")
 
+    def test_deal_many(self):
+        '''!
+        test methods deal_many() and peek()
+        '''
+        shoe = Shoe(1)
+        shoe.set_cut_card(5)
+        self.assertEqual((), shoe.peek(0), "peek nothing")
+        peeked = shoe.peek(4)
+        self.assertEqual("Ac2c3c4c", "".join([str(c) for c in peeked]),
+                         "peek 4")
+        self.assertEqual(52, shoe.cards_remaining(), "peek does not deal")
+        dealt = shoe.deal_many(4)
+        self.assertEqual(peeked, dealt, "deal the peeked cards")
+        self.assertTrue(isinstance(dealt, tuple), "read-only tuple")
+        self.assertFalse(shoe.cut_card_seen(), "4 dealt, cut at 5")
+        self.assertEqual("5c", str(shoe.deal_many(2)[0]), "next card")
+        self.assertTrue(shoe.cut_card_seen(), "6 dealt, cut at 5")
+        self.assertEqual(46, sum(shoe.get_composition()), "46 left")
+        self.assertEqual(46, len(shoe.deal_many(99)), "short at the end")
+        self.assertEqual((), shoe.deal_many(1), "empty shoe")
+        with self.assertRaises(ValueError):
+            shoe.peek(-1)
+        # lazy shuffle peeks the same cards it deals
+        shoe = Shoe(8, rng=5)
+        shoe.shuffle(lazy=True)
+        peeked = shoe.peek(6)
+        self.assertEqual(peeked[:2], shoe.deal_many(2), "lazy deal_many")
+        self.assertEqual(peeked[2], shoe.deal(), "lazy deal")
+        self.assertEqual(peeked[3:], shoe.deal_many(3), "lazy rest")
+
     def test_save_shoe(self):
         '''!
         test method save_shoe()
@@ -178,6 +291,43 @@ class TestShoe(unittest.TestCase):
     def test_load_shoe(self):
         pass
 
+    def test_iter_shoes(self):
+        '''!
+        test iter_shoes() on a file of several shoes with bad cards
+        '''
+        temp_file = os.sep + 'tmp' + os.sep + 'ut_multi.shoe'
+        with open(temp_file, 'w') as f:
+            f.write("# casino log\n"
+                    "Ac 2c # comment\n"
+                    "3c\n"
+                    "#END\n"
+                    "#END\n"
+                    "Kd Zz Qd\n"
+                    "#END shoe 2\n"
+                    "9h Th\n"
+                    "Js 1x\n")
+        errors = []
+        shoes = list(iter_shoes(temp_file, errors.append))
+        self.assertEqual(3, len(shoes), "3 shoes, empty one skipped")
+        self.assertEqual("Ac", str(shoes[0].deal()), "first card shoe 1")
+        self.assertEqual("2c", str(shoes[0].deal()), "second card shoe 1")
+        self.assertEqual("3c", str(shoes[0].deal()), "third card shoe 1")
+        self.assertIsNone(shoes[0].deal(), "shoe 1 is 3 cards")
+        self.assertEqual("Kd", str(shoes[1].deal()), "shoe 2 Kd")
+        self.assertEqual("Qd", str(shoes[1].deal()), "bad Zz skipped")
+        self.assertEqual(2, len(errors), "2 bad cards")
+        self.assertTrue(isinstance(errors[0], ShoeFormatError), "type")
+        self.assertEqual((6, "Zz"), (errors[0].line_number, errors[0].token),
+                         "line of Zz")
+        self.assertEqual(9, errors[1].line_number, "line of 1x")
+        self.assertTrue(str(errors[1]).startswith(temp_file + ":9: "),
+                        "message names the file and line")
+        # the same file as ArrayShoes
+        shoes = list(iter_shoes(temp_file, errors.append, ArrayShoe))
+        self.assertEqual(b"\x22\x23\x31", shoes[2].get_ordinals(),
+                         "9h Th Js")
+        delete_file(temp_file)
+
 
 #
 # Command line entry point
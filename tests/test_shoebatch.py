@@ -0,0 +1,70 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the shoebatch module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_shoebatch.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.shoebatch import numpy, generate_shoes, shoe_from_row
+from pybaccarat.playingcards import get_card
+from pybaccarat.baccarat import Game
+
+
+@unittest.skipIf(numpy is None, "numpy not installed")
+class TestShoeBatch(unittest.TestCase):
+    '''
+    unit test generate_shoes() and shoe_from_row()
+    '''
+    def test_generate_shoes(self):
+        '''
+        shape, type and contents of the shoe matrix
+        '''
+        shoes = generate_shoes(50, 8, seed=1)
+        self.assertEqual((50, 416), shoes.shape, "shape")
+        self.assertEqual(numpy.uint8, shoes.dtype, "uint8")
+        expected = numpy.tile(numpy.arange(52), 8)
+        expected.sort()
+        for row in shoes:
+            self.assertTrue((numpy.sort(row) == expected).all(), "all cards")
+        self.assertFalse((shoes[0] == shoes[1]).all(), "independent rows")
+        with self.assertRaises(ValueError):
+            generate_shoes(1, 13)
+        with self.assertRaises(ValueError):
+            generate_shoes(-1, 8)
+
+    def test_seed(self):
+        '''
+        the same seed gives the same shoes
+        '''
+        first = generate_shoes(10, 8, seed=12345)
+        second = generate_shoes(10, 8, seed=12345)
+        self.assertTrue((first == second).all(), "reproducible")
+        third = generate_shoes(10, 8, seed=54321)
+        self.assertFalse((first == third).all(), "different seed")
+
+    def test_shoe_from_row(self):
+        '''
+        a row wrapped as a shoe deals the row's cards and plays a Game
+        '''
+        shoes = generate_shoes(3, 8, seed=7)
+        shoe = shoe_from_row(shoes[1])
+        for ordinal in shoes[1]:
+            self.assertTrue(get_card(int(ordinal)) is shoe.deal(), "deal")
+        self.assertIsNone(shoe.deal(), "empty")
+        game = Game(shoe=shoe_from_row(shoes[2]))
+        game.play(display=False)
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the pybaccarat.shoepool module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_shoepool.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.playingcards import Shoe
+from pybaccarat.shoepool import ShoePool
+from pybaccarat.baccarat import Game
+
+
+class TestShoePool(unittest.TestCase):
+    '''
+    Unit test for the ShoePool class.
+    '''
+
+    def test_reshuffle(self):
+        '''
+        Shoe.reshuffle() restarts the shoe with a new order, in place.
+        '''
+        shoe = Shoe(8, rng=7)
+        shoe.shuffle()
+        before = shoe.get_ordinals()
+        for _ in range(100):
+            shoe.deal()
+        shoe.reshuffle()
+        self.assertEqual(416, shoe.cards_remaining())
+        self.assertEqual((32,) * 13, shoe.get_composition())
+        self.assertNotEqual(before, shoe.get_ordinals())
+        self.assertEqual(sorted(before), sorted(shoe.get_ordinals()))
+
+    def test_constructor(self):
+        '''
+        test the pool size
+        '''
+        self.assertRaises(ValueError, ShoePool, 0)
+        self.assertRaises(ValueError, ShoePool, "4")
+        pool = ShoePool(2, 1, background=False)
+        self.assertEqual(2, pool.ready_count())
+        pool.close()
+
+    def test_get_release(self):
+        '''
+        Shoes come out shuffled and go back to be reshuffled.
+        '''
+        for background in (False, True):
+            with ShoePool(2, 8, rng=1, background=background) as pool:
+                seen = []
+                for _ in range(6):
+                    shoe = pool.get(timeout=10)
+                    self.assertEqual(416, shoe.cards_remaining())
+                    seen.append(shoe.get_ordinals())
+                    for _ in range(50):
+                        shoe.deal()
+                    pool.release(shoe)
+                self.assertEqual(6, len(set(seen)))
+            self.assertRaises(ValueError, pool.get)
+
+    def test_reproducible(self):
+        '''
+        A seeded pool deals the same shoes whether or not it uses a thread.
+        '''
+        runs = []
+        for background in (False, True):
+            with ShoePool(3, 1, rng=99, background=background) as pool:
+                run = []
+                for _ in range(5):
+                    shoe = pool.get(timeout=10)
+                    run.append(shoe.get_ordinals())
+                    pool.release(shoe)
+                runs.append(run)
+        self.assertEqual(runs[0], runs[1])
+
+    def test_game(self):
+        '''
+        A Game given a pool plays a fresh shoe each time.
+        '''
+        self.assertRaises(ValueError, Game, Shoe(8), pool=object())
+        with ShoePool(2, 8, rng=3) as pool:
+            game = Game(pool=pool)
+            for _ in range(4):
+                game.play(display=False)
+            self.assertEqual(2, len([pool.get(timeout=10),
+                                     pool.get(timeout=10)]))
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the pybaccarat.sinks module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_sinks.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest,json,shutil,tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.baccarat import Game
+from pybaccarat.playingcards import Shoe, get_card
+from pybaccarat.sinks import CsvSink, JsonlSink, NpzSink, load_npz, \
+    CSV_HEADER, NO_CARD, NATURAL_DIFF
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestSinks(unittest.TestCase):
+    '''
+    Unit test for the sinks.
+    '''
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def play(self, sink, shoes=2):
+        '''
+        Play seeded shoes into a sink and return the hand records.
+        '''
+        shoe = Shoe(8, rng=19)
+        game = Game(shoe=shoe)
+        game.add_observer(sink)
+        hands = []
+        with sink:
+            for _ in range(shoes):
+                shoe.shuffle()
+                hands.append(game.simulate_shoe().hands)
+        return hands
+
+    def test_csv(self):
+        '''
+        one line per hand after the header
+        '''
+        filespec = os.path.join(self.folder, "hands.csv")
+        sink = CsvSink(filespec, buffer_size=7)
+        hands = self.play(sink)
+        with open(filespec) as csv:
+            lines = csv.readlines()
+        self.assertEqual(CSV_HEADER, lines[0])
+        self.assertEqual(len(hands[0]) + len(hands[1]), len(lines) - 1)
+        self.assertEqual(len(lines) - 1, sink.hands_written)
+        first = hands[0][0]
+        self.assertEqual("0,1,%s,%s,%s,%s,%s\n" % (
+            " ".join([str(c) for c in first.player]),
+            " ".join([str(c) for c in first.banker]),
+            first.win, first.diff, first.bonus.strip()), lines[1])
+        self.assertTrue(lines[len(hands[0]) + 1].startswith("1,1,"))
+        self.assertRaises(ValueError, CsvSink, filespec, 0)
+
+    def test_jsonl(self):
+        '''
+        every line is a JSON object
+        '''
+        filespec = os.path.join(self.folder, "hands.jsonl")
+        hands = self.play(JsonlSink(filespec, buffer_size=1000))
+        with open(filespec) as jsonl:
+            rows = [json.loads(line) for line in jsonl]
+        self.assertEqual(len(hands[0]) + len(hands[1]), len(rows))
+        last = hands[1][-1]
+        self.assertEqual({"shoe": 1, "hand": len(hands[1]),
+                          "player": [str(c) for c in last.player],
+                          "banker": [str(c) for c in last.banker],
+                          "win": last.win, "diff": last.diff,
+                          "bonus": last.bonus.strip()}, rows[-1])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_npz(self):
+        '''
+        chunks of columns join back into the hands
+        '''
+        filespec = os.path.join(self.folder, "hands.npz")
+        hands = self.play(NpzSink(filespec, buffer_size=13), 3)
+        columns = load_npz(filespec)
+        flat = hands[0] + hands[1] + hands[2]
+        self.assertEqual(len(flat), len(columns['win']))
+        self.assertEqual((len(flat), 3), columns['player'].shape)
+        for i, hand in enumerate(flat):
+            self.assertEqual("BPT"[columns['win'][i]], hand.win)
+            diff = columns['diff'][i]
+            self.assertEqual(hand.diff,
+                             "n" if diff == NATURAL_DIFF else str(diff))
+            player = [get_card(int(o) % 13 + 1, "cdhs"[int(o) // 13])
+                      for o in columns['player'][i] if o != NO_CARD]
+            self.assertEqual(list(hand.player), player)
+        self.assertEqual(len(hands[0]), columns['hand'][len(hands[0]) - 1])
+        self.assertEqual(2, columns['shoe'][-1])
+        empty = os.path.join(self.folder, "empty.npz")
+        NpzSink(empty).close()
+        self.assertEqual(0, len(load_npz(empty)['win']))
+        self.assertEqual(numpy.int32, load_npz(empty)['shoe'].dtype)
+        self.assertEqual((0, 3), load_npz(empty)['banker'].shape)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_npz_many_chunks(self):
+        '''
+        chunk numbers past 5 digits are read, in numeric order
+        '''
+        filespec = os.path.join(self.folder, "many.npz")
+        chunks = (99999, 100000, 7, 123456)
+        arrays = {}
+        for chunk in chunks:
+            for name in NpzSink.COLUMNS:
+                shape = (1, 3) if name in ('player', 'banker') else 1
+                arrays["%05d_%s" % (chunk, name)] = \
+                    numpy.full(shape, chunk % 100, dtype=numpy.int32)
+        numpy.savez(filespec, **arrays)
+        columns = load_npz(filespec)
+        self.assertEqual([7, 99, 0, 56], list(columns['win']))
+        self.assertEqual([7, 99, 0, 56], list(columns['player'][:, 0]))
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the pybaccarat.sweep module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_sweep.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.baccarat import Game
+from pybaccarat.baccaratsystems import Dragon, EZDragon, George1, ValSys
+from pybaccarat.seeding import make_shoe
+from pybaccarat.sweep import grid, sweep
+from pybaccarat.tape import compile_run
+
+
+class TestSweep(unittest.TestCase):
+    '''
+    Unit test for grid() and sweep().
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tapes = compile_run(12, 10)
+
+    def test_grid(self):
+        '''
+        every combination, the last name changing fastest
+        '''
+        self.assertEqual([{'a': 1, 'b': 3}, {'a': 1, 'b': 4},
+                          {'a': 2, 'b': 3}, {'a': 2, 'b': 4}],
+                         grid(b=[3, 4], a=[1, 2]))
+        self.assertEqual([{}], grid())
+        self.assertEqual([], grid(a=[]))
+
+    def test_defaults(self):
+        '''
+        the default parameters play as the systems always did
+        '''
+        george = George1()
+        self.assertEqual((3, 4), (george.George1_size,
+                                  george.George1_later_size))
+        self.assertEqual(4, ValSys().streak)
+        self.assertEqual((25, 11), (Dragon().threshold,
+                                    Dragon().threshold_hands))
+        self.assertEqual((4.0, 8.65, 10.0),
+                         (EZDragon().true_count, EZDragon().decks,
+                          EZDragon().hands_per_deck))
+
+    def test_sweep(self):
+        '''
+        each grid point totals the same as playing it on every shoe
+        '''
+        points = grid(size=[2, 3], later_size=[3, 4])
+        result = sweep("George1", points, self.tapes, processes=1)
+        self.assertEqual(("won", "lost", "tied", "money"), result.names)
+        self.assertEqual(10, result.shoes)
+        for (point, totals) in result.rows():
+            expected = [0, 0, 0, 0.0]
+            for index in range(10):
+                system = George1(**point)
+                Game(shoe=make_shoe(12, index), system=system).simulate_shoe()
+                for (i, value) in enumerate((system.won, system.lost,
+                                             system.tied, system.money)):
+                    expected[i] += value
+            self.assertEqual(expected, [totals['won'], totals['lost'],
+                                        totals['tied'], totals['money']])
+        # the parameters change the money
+        self.assertEqual(4, len(set([r[1]['money'] for r in result.rows()])))
+        # the table does not depend on the processes or the chunks
+        other = sweep("George1", points, self.tapes, processes=2,
+                      chunk_size=3)
+        self.assertEqual(result.table(), other.table())
+
+    def test_card_count_systems(self):
+        '''
+        Dragon and EZDragon totals
+        '''
+        dragon = sweep("Dragon", grid(threshold=[0, 25]), self.tapes,
+                       processes=1)
+        self.assertEqual(("p_money", "b_money", "plays"), dragon.names)
+        (low, high) = [r[1] for r in dragon.rows()]
+        self.assertTrue(low['plays'] > high['plays'])
+        ez = sweep("EZDragon", grid(true_count=[-99.0]), self.tapes,
+                   processes=1)
+        totals = ez.rows()[0][1]
+        hands = sum([len(tape) for tape in self.tapes])
+        self.assertEqual(hands, totals['won'] + totals['lost'])
+        self.assertEqual(40.0 * totals['won'] - totals['lost'],
+                         totals['money'])
+
+    def test_report(self):
+        '''
+        table() and best()
+        '''
+        result = sweep("ValSys", grid(streak=[2, 4, 6]), self.tapes,
+                       processes=1)
+        lines = result.table(sort_by="money").split("\n")
+        self.assertEqual("Sys(ValSys) shoes(10)", lines[0])
+        self.assertEqual(["streak", "won", "lost", "tied", "money"],
+                         lines[1].split())
+        self.assertEqual(5, len(lines))
+        (point, totals) = result.best("money")
+        self.assertEqual(str(point['streak']), lines[2].split()[0])
+        self.assertEqual(max([r[1]['money'] for r in result.rows()]),
+                         totals['money'])
+        self.assertRaises(ValueError, result.best, "nothing")
+        self.assertRaises(ValueError, result.table, "nothing")
+
+    def test_errors(self):
+        '''
+        bad arguments
+        '''
+        self.assertRaises(ValueError, sweep, "Interactive", [{}], self.tapes)
+        self.assertRaises(ValueError, sweep, "NoSuchSystem", [{}],
+                          self.tapes)
+        self.assertRaises(ValueError, sweep, "ValSys", [{'nothing': 1}],
+                          self.tapes)
+        self.assertRaises(ValueError, sweep, "ValSys", [{}], self.tapes,
+                          chunk_size=0)
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
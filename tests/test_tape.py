@@ -0,0 +1,174 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the pybaccarat.tape module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_tape.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest,array,pickle,shutil,tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.baccarat import Game, HandObserver, HandResult, \
+    ShoeResult
+from pybaccarat.baccaratsystems import George1, JustBoards, ValSys
+from pybaccarat.playingcards import get_card
+from pybaccarat.seeding import make_shoe
+from pybaccarat.tape import OutcomeTape, RECORD_SIZE, compile_result, \
+    compile_run, compile_shoe, load_tapes, replay, replay_system, save_tapes
+
+
+class Recorder(HandObserver):
+    '''
+    Record the events of a shoe.
+    '''
+    def __init__(self):
+        self.events = []
+
+    def new_shoe(self, burned_cards):
+        self.events.append(("new_shoe", tuple(burned_cards)))
+
+    def hand_pre(self, hand_number):
+        self.events.append(("hand_pre", hand_number))
+        return ""
+
+    def hand_post(self, hand_number, hand, player, banker):
+        self.events.append(("hand_post", hand_number, hand, str(player),
+                            str(banker), player.value(), banker.value()))
+        return ""
+
+    def end_shoe(self):
+        self.events.append(("end_shoe",))
+        return ""
+
+
+class TestTape(unittest.TestCase):
+    '''
+    Unit test for OutcomeTape, compile and replay.
+    '''
+
+    def test_compile(self):
+        '''
+        a tape holds the result of the shoe and the running counts
+        '''
+        result = Game(shoe=make_shoe(3, 0)).simulate_shoe()
+        tape = compile_shoe(make_shoe(3, 0))
+        self.assertEqual(len(result.hands), len(tape))
+        self.assertEqual(RECORD_SIZE * len(tape), len(tape.records))
+        self.assertEqual(result, tape.to_result())
+        self.assertEqual(result.hands[5], tape.hand(5))
+        self.assertEqual("".join([h.win for h in result.hands]), tape.wins())
+        counts = [0] * 13
+        for card in result.burned_cards:
+            counts[card.get_rank() - 1] += 1
+        for (index, hand) in enumerate(result.hands):
+            self.assertEqual(tuple(counts), tape.counts(index))
+            self.assertEqual(len(hand.player) + len(hand.banker),
+                             tape.cards_consumed(index))
+            for card in hand.player + hand.banker:
+                counts[card.get_rank() - 1] += 1
+        self.assertEqual(compile_run(3, 3),
+                         [compile_shoe(make_shoe(3, k)) for k in range(3)])
+        self.assertEqual(compile_run(3, 2, first=1), compile_run(3, 3)[1:])
+
+    def test_natural_and_bonus(self):
+        '''
+        codes of a 3 card hand with a bonus and of a natural tie
+        '''
+        card = get_card
+        result = ShoeResult((card("2s"), card("Kh"), card("4s")), [
+            HandResult((card("2c"), card("3d"), card("3h")),
+                       (card("Kc"), card("Kd"), card("Ks")), "P", "3", "P8"),
+            HandResult((card("9c"), card("Th")), (card("9d"), card("Ts")),
+                       "T", "n", "  ")])
+        tape = compile_result(result)
+        self.assertEqual(6, tape.cards_consumed(0))
+        self.assertEqual(4, tape.cards_consumed(1))
+        self.assertEqual(("P", "3", "P8"), tape.hand(0)[2:])
+        self.assertEqual(("T", "n", "  "), tape.hand(1)[2:])
+        self.assertEqual(4, tape.counts(1)[12])  # kings, one burned
+        self.assertEqual(result.hands, tape.hands())
+
+    def test_replay(self):
+        '''
+        observers see the same events as simulate_shoe() sends
+        '''
+        game = Game(shoe=make_shoe(4, 1))
+        played = Recorder()
+        game.add_observer(played)
+        game.simulate_shoe()
+        replayed = Recorder()
+        replay(compile_shoe(make_shoe(4, 1)), [replayed])
+        self.assertEqual(played.events, replayed.events)
+
+    def test_replay_system(self):
+        '''
+        a system ends a replayed shoe as it ends the dealt shoe
+        '''
+        for index in range(8):
+            tape = compile_shoe(make_shoe(9, index))
+            for system_class in (George1, ValSys):
+                dealt = system_class()
+                Game(shoe=make_shoe(9, index), system=dealt).simulate_shoe()
+                replayed = system_class()
+                replay_system(tape, replayed)
+                self.assertEqual(
+                    (dealt.won, dealt.lost, dealt.tied, dealt.money,
+                     dealt.WLseq),
+                    (replayed.won, replayed.lost, replayed.tied,
+                     replayed.money, replayed.WLseq))
+        both = [George1(), ValSys()]
+        replay_system(tape, both)
+        self.assertEqual((dealt.won, dealt.lost, dealt.money),
+                         (both[1].won, both[1].lost, both[1].money))
+        self.assertRaises(ValueError, replay_system, tape, JustBoards())
+
+    def test_save_load(self):
+        '''
+        tapes read back equal, bad files are refused
+        '''
+        folder = tempfile.mkdtemp()
+        try:
+            filespec = os.path.join(folder, "run.tape")
+            tapes = compile_run(6, 4)
+            save_tapes(filespec, tapes)
+            loaded = load_tapes(filespec)
+            self.assertEqual(tapes, loaded)
+            self.assertEqual(tapes[2].to_result(), loaded[2].to_result())
+            save_tapes(filespec, [])
+            self.assertEqual([], load_tapes(filespec))
+            with open(filespec, 'wb') as bad:
+                bad.write(b"not a tape file")
+            self.assertRaises(ValueError, load_tapes, filespec)
+            save_tapes(filespec, tapes)
+            with open(filespec, 'rb') as good:
+                data = good.read()
+            with open(filespec, 'wb') as cut:
+                cut.write(data[:-5])
+            self.assertRaises(ValueError, load_tapes, filespec)
+        finally:
+            shutil.rmtree(folder)
+
+    def test_pickle(self):
+        '''
+        a tape keeps only its packed bytes, not the decoded hands
+        '''
+        tape = compile_shoe(make_shoe(2, 0))
+        size = len(pickle.dumps(tape))
+        self.assertIsNot(tape.hands(), tape.hands())
+        replay_system(tape, George1())
+        self.assertEqual(size, len(pickle.dumps(tape)))
+        self.assertEqual(tape.hands(), pickle.loads(pickle.dumps(tape)).hands())
+        self.assertRaises(ValueError, OutcomeTape, array.array('B'),
+                          array.array('B', [0] * (RECORD_SIZE + 1)))
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the pybaccarat.timing module.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_timing.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest,threading
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat import baccarat
+from pybaccarat.baccarat import Game, Scoreboard
+from pybaccarat.baccaratsystems import George1
+from pybaccarat.playingcards import Shoe
+from pybaccarat.timing import PhaseTimer
+
+
+class TestPhaseTimer(unittest.TestCase):
+    '''
+    Unit test for PhaseTimer.
+    '''
+
+    def test_phases(self):
+        '''
+        phases count every hand and the self times add up
+        '''
+        game = Game(shoe=Shoe(8, rng=1), system=George1())
+        timer = PhaseTimer()
+        self.assertFalse(timer.is_running())
+        with timer:
+            self.assertTrue(timer.is_running())
+            hands = len(game.simulate_shoe().hands)
+        self.assertFalse(timer.is_running())
+        self.assertEqual(hands, timer.hands())
+        phases = timer.phases()
+        self.assertEqual(hands, phases["Game.play_hand"].calls)
+        self.assertEqual(hands, phases["Ties.mark"].calls)
+        self.assertEqual(hands, phases["George1.hand_pre"].calls)
+        self.assertEqual(4 * hands, phases["Scoreboard.mark"].calls)
+        self.assertEqual(1, phases["Game.burn"].calls)
+        self.assertNotIn("Game.print_hand", phases)
+        for phase in phases.values():
+            self.assertTrue(0.0 <= phase.seconds <= phase.total_seconds)
+        self.assertTrue(phases["BoardTracker.hand_post"].total_seconds >=
+                        phases["Scoreboard.mark"].seconds)
+        self.assertTrue(sum([p.seconds for p in phases.values()]) <=
+                        timer.elapsed())
+        self.assertTrue(timer.hands_per_second() > 0.0)
+        report = timer.report()
+        self.assertTrue(report.startswith("hands(%d) " % hands))
+        self.assertIn("Scoreboard.mark", report)
+
+        # more runs add up, reset() clears
+        with timer:
+            more = len(game.simulate_shoe().hands)
+        self.assertEqual(hands + more, timer.hands())
+        timer.reset()
+        self.assertEqual(0, timer.hands())
+        self.assertEqual({}, timer.phases())
+        self.assertEqual(0.0, timer.elapsed())
+        self.assertEqual(0.0, timer.hands_per_second())
+
+    def test_restore(self):
+        '''
+        stop() puts back every original method
+        '''
+        play_hand = vars(Game)['play_hand']
+        print_hand = vars(Game)['_Game__print_hand']
+        mark = vars(Scoreboard)['mark']
+        side_count = baccarat._side_count
+        timer = PhaseTimer()
+        timer.start()
+        self.assertIsNot(play_hand, vars(Game)['play_hand'])
+        self.assertIsInstance(vars(Game)['_Game__print_hand'], staticmethod)
+        self.assertRaises(ValueError, PhaseTimer().start)
+        timer.stop()
+        timer.stop()
+        self.assertIs(play_hand, vars(Game)['play_hand'])
+        self.assertIs(print_hand, vars(Game)['_Game__print_hand'])
+        self.assertIs(mark, vars(Scoreboard)['mark'])
+        self.assertIs(side_count, baccarat._side_count)
+
+    def test_exception(self):
+        '''
+        a timed method that raises is counted and the timer still stops
+        '''
+        game = Game(shoe=Shoe(0))
+        with PhaseTimer() as timer:
+            self.assertRaises(ValueError, game.play_hand)
+        self.assertEqual(1, timer.hands())
+        self.assertEqual(1, timer.phases()["Shoe.deal_many"].calls)
+        self.assertFalse(timer.is_running())
+
+    def test_other_thread(self):
+        '''
+        calls from another thread run but are not counted
+        '''
+        shoe = Shoe(1)
+        with PhaseTimer() as timer:
+            worker = threading.Thread(target=shoe.deal_many, args=(5,))
+            worker.start()
+            worker.join()
+            self.assertEqual(5, 52 - shoe.cards_remaining())
+            self.assertNotIn("Shoe.deal_many", timer.phases())
+            shoe.deal_many(2)
+        self.assertEqual(1, timer.phases()["Shoe.deal_many"].calls)
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/python
+
+"""!
+Unit test for the VirtualShoe class.
+
+To execute the unit test from base dir location, enter:
+@code
+python tests\test_virtual_shoe.py [-v]
+@endcode
+
+@author <A email="fulkgl@gmail.com">fulkgl@gmail.com</A>
+"""
+
+import os,sys,unittest
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))[:-6]) #=dev first
+from pybaccarat.playingcards import VirtualShoe,Shoe
+from pybaccarat.baccarat import Game
+
+
+class TestVirtualShoe(unittest.TestCase):
+    '''
+    unit test VirtualShoe class
+    '''
+    def test_constructor(self):
+        '''
+        decks, composition and bad values
+        '''
+        shoe = VirtualShoe(8)
+        self.assertEqual(13 * (32,), shoe.get_composition(), "8 decks")
+        self.assertEqual(416, shoe.cards_remaining(), "416 cards")
+        shoe = VirtualShoe(composition=[1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2])
+        self.assertEqual(3, shoe.cards_remaining(), "3 card composition")
+        with self.assertRaises(ValueError):
+            VirtualShoe(13)
+        with self.assertRaises(ValueError):
+            VirtualShoe(composition=[1, 2])
+        with self.assertRaises(ValueError):
+            VirtualShoe(composition=13 * [-1])
+        with self.assertRaises(ValueError):
+            VirtualShoe(8, rng="seed")
+
+    def test_deal(self):
+        '''
+        deals exactly the composition, then None; reset restores it
+        '''
+        shoe = VirtualShoe(2, rng=11)
+        counts = 13 * [0]
+        for _ in range(104):
+            counts[shoe.deal().get_rank() - 1] += 1
+        self.assertEqual(13 * [8], counts, "every rank dealt 8 times")
+        self.assertEqual(13 * (0,), shoe.get_composition(), "empty")
+        self.assertIsNone(shoe.deal(), "no more cards")
+        shoe.reset()
+        self.assertEqual(13 * (8,), shoe.get_composition(), "reset")
+        self.assertTrue(shoe.cut_card_seen(), "cut card 0 after reset")
+        shoe.set_cut_card(-14)
+        self.assertFalse(shoe.cut_card_seen(), "cut card set")
+
+    def test_distribution(self):
+        '''
+        the first card drawn follows the composition weights
+        '''
+        composition = [30, 0, 0, 0, 0, 0, 0, 0, 0, 10, 0, 0, 0]
+        shoe = VirtualShoe(composition=composition, rng=2)
+        aces = 0
+        trials = 4000
+        for _ in range(trials):
+            shoe.reset()
+            if shoe.deal().get_rank() == 1:
+                aces += 1
+        # expect 3000, 4 standard deviations is about 110
+        self.assertTrue(abs(aces - 3000) < 110, "aces(%d)" % aces)
+
+    def test_branch_game(self):
+        '''
+        branch from a live shoe and play the rest as a Game
+        '''
+        shoe = Shoe(8, rng=4)
+        shoe.shuffle()
+        for _ in range(100):
+            shoe.deal()
+        branch = VirtualShoe(composition=shoe.get_composition(), rng=4)
+        self.assertEqual(316, branch.cards_remaining(), "316 left")
+        Game(shoe=branch).play(display=False)
+
+    def test_save_load(self):
+        '''
+        save_shoe keeps the cards dealt; load_shoe adds the ranks
+        '''
+        filespec = os.sep + 'tmp' + os.sep + 'ut_virtual.shoe'
+        shoe = VirtualShoe(1, rng=6)
+        shoe.reshuffle(lazy=True)
+        dealt = [shoe.deal() for _ in range(20)]
+        shoe.save_shoe(filespec)
+        loaded = Shoe(0)
+        loaded.load_shoe(filespec)
+        self.assertEqual(dealt, [loaded.deal() for _ in range(20)], "dealt")
+        self.assertEqual(shoe.get_composition(), loaded.get_composition(),
+                         "undealt")
+        more = VirtualShoe(0)
+        more.load_shoe(filespec)
+        self.assertEqual(13 * (4,), more.get_composition(), "loaded")
+        more.reset()
+        self.assertEqual(52, more.cards_remaining(), "kept by reset")
+        os.remove(filespec)
+
+
+#
+# Command line entry point
+#
+if __name__ == '__main__':
+    unittest.main()